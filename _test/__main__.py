@@ -43,6 +43,9 @@ all_suites.extend( fraction_fields_test.all_suites )
 from . import elliptic_curves_group_test
 all_suites.extend( elliptic_curves_group_test.all_suites )
 
+from . import l_torsion_group_test
+all_suites.extend( l_torsion_group_test.all_suites )
+
 
 #- Support --------------------------------------------------------------------
 from . import support_test
@@ -54,6 +54,16 @@ def generate_test_suites(frobenius_trace_implementation, name_prefix):
         """y^2 = x^3 + 7x + 16 over GF<23>"""
         # From http://www.certicom.com/ecc_tutorial/ecc_twopoints.html
         self.assert_( self._count_points( 23, 7, 16 ) == 22 )
+    
+    def test_13_0_5(self):
+        """y^2 = x^3 + 5 over GF<13>"""
+        # x^3 + 5 splits completely: its zeros are 2, 5, and 6.
+        self.assert_( self._count_points( 13, 0, 5 ) == 16 )
+    
+    def test_17_9_0(self):
+        """y^2 = x^3 + 9x over GF<17>"""
+        # x^3 + 9x splits completely: its zeros are 0, 5, and 12.
+        self.assert_( self._count_points( 17, 9, 0 ) == 20 )
         
     def _count_points(self, p, A, B):
         curve = EllipticCurve( FiniteField(p), A, B )
@@ -74,10 +84,16 @@ def generate_test_suites(frobenius_trace_implementation, name_prefix):
 
 import naive_schoof
 import reduced_computation_schoof
+import sea_schoof
+import bsgs_count
+import point_count
 
 implementations = [
     (naive_schoof.frobenius_trace, "Naive"),
     (reduced_computation_schoof.frobenius_trace, "Reduced"),
+    (sea_schoof.frobenius_trace, "SEA"),
+    (bsgs_count.frobenius_trace, "BSGS"),
+    (point_count.frobenius_trace, "Dispatch"),
 ]
 
 all_suites = []
@@ -85,6 +101,573 @@ for implementation, prefix in implementations:
     all_suites.extend( generate_test_suites( implementation, prefix ) )
 
 
+from elliptic_curves.l_torsion_group.naive import ProjectiveLTorsionGroup
+
+class TraceSearchTest(unittest.TestCase):
+    """
+    Test cases for the search of the trace residue in
+    reduced_computation_schoof
+    """
+    
+    E = EllipticCurve( FiniteField(23), 3, 4 )
+    
+    def test_baby_step_giant_step(self):
+        """Baby-step giant-step and sequential search agree"""
+        for l in [ 5, 7 ]:
+            torsion_group = ProjectiveLTorsionGroup( self.E )( l )
+            frobenius_point = torsion_group.frobenius_point()
+            for trace in range( -(l-1)//2, (l+1)//2 ):
+                if not trace:
+                    continue
+                point_sum = trace * frobenius_point
+                self.assert_( reduced_computation_schoof.\
+                                baby_step_giant_step_trace_search(
+                                    point_sum, frobenius_point, l ) == trace )
+                self.assert_( reduced_computation_schoof.\
+                                sequential_trace_search(
+                                    point_sum, frobenius_point, l ) == trace )
+
+    def test_reducible_modulus(self):
+        """Z-coordinates that are zero divisors modulo psi_l"""
+        # For this curve, phi^2(P) + 1*P has a z-coordinate that vanishes
+        # for some, but not all 3-torsion points.
+        E = EllipticCurve( FiniteField(13), 12, 1 )
+        torsion_group = ProjectiveLTorsionGroup( E )( 3 )
+        trace = naive_schoof.frobenius_trace( E )
+        self.assert_( reduced_computation_schoof.frobenius_trace_mod_l(
+                            torsion_group ).remainder() == trace % 3 )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( TraceSearchTest )
+    )
+
+
+class TwoPowerTraceTest(unittest.TestCase):
+    """
+    Test cases for the trace modulo powers of two in
+    reduced_computation_schoof
+    """
+    
+    def test_small_fields(self):
+        """Trace modulo 2, 4, and 8 agrees with enumeration"""
+        for p, A, B in [ (23, 3, 4), (23, 7, 16), (101, 1, 4), (101, 50, 3),
+                         (1009, 5, 11) ]:
+            E = EllipticCurve( FiniteField(p), A, B )
+            trace = p + 1 - self._count_points( p, A, B )
+            for k in [ 1, 2, 3 ]:
+                congruence = reduced_computation_schoof.\
+                                frobenius_trace_mod_2k( E, k )
+                self.assert_( congruence.modulus() == 2**k )
+                self.assert_( congruence.remainder() == trace % 2**k )
+    
+    def _count_points(self, p, A, B):
+        squares = [ 0 ] * p
+        for y in range( p ):
+            squares[ y*y % p ] += 1
+        return 1 + sum( squares[ (x**3 + A*x + B) % p ] for x in range( p ) )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( TwoPowerTraceTest )
+    )
+
+
+from fields.finite.compact import FiniteField as CompactFiniteField
+
+class ParallelTraceTest(unittest.TestCase):
+    """
+    Test cases for the process pool in reduced_computation_schoof
+    """
+    
+    def test_same_trace(self):
+        """Parallel and sequential computation agree"""
+        E = EllipticCurve( CompactFiniteField(10007), 3, 7 )
+        self.assert_( reduced_computation_schoof.frobenius_trace( E, workers=2 )
+                      == reduced_computation_schoof.frobenius_trace( E ) )
+    
+    def test_congruences(self):
+        """One congruence per prime"""
+        E = EllipticCurve( CompactFiniteField(1009), 5, 11 )
+        primes = [ 3, 5, 7 ]
+        with reduced_computation_schoof.parallel_trace_congruences(
+                                            E, primes, 2 ) as congruences:
+            moduli = sorted( c.modulus() for c in congruences )
+        self.assert_( moduli == primes )
+    
+    def test_schedule(self):
+        """Needed primes largest first, then optional primes smallest first"""
+        schedule = reduced_computation_schoof.schedule_torsion_primes
+        search_range = range( -1000, 1001 )
+        # Without 7 or 5, more than 16 candidates remain; 3 is optional.
+        self.assert_( schedule( [ 3, 5, 7 ], 4, search_range ) == [ 7, 5, 3 ] )
+        self.assert_( schedule( [ 3, 5, 7, 11 ], 4, search_range )
+                      == [ 3, 5, 7, 11 ] )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( ParallelTraceTest )
+    )
+
+
+class CombineTraceCongruencesTest(unittest.TestCase):
+    """
+    Test cases for the incremental combination of trace congruences in
+    reduced_computation_schoof
+    """
+    
+    p = 1009
+    E = EllipticCurve( FiniteField(p), 5, 11 )
+    
+    def test_early_termination(self):
+        """Unused congruences are never computed"""
+        trace = reduced_computation_schoof.frobenius_trace( self.E )
+        search_range = reduced_computation_schoof.\
+                            hasse_frobenius_trace_range( self.E.field() )
+        def congruences():
+            for l in [ 4, 3, 5, 7, 11 ]:
+                yield QuotientRing( Integers, l )( trace )
+            self.fail( "all congruences were requested" )
+        
+        reports = []
+        result = reduced_computation_schoof.combine_trace_congruences(
+                        self.E, congruences(), search_range,
+                        lambda modulus, count: reports.append( (modulus, count) )
+                    )
+        self.assert_( result == trace )
+        self.assert_( [ m for m, c in reports ] == [ 4, 3, 5, 7, 11 ][ : len( reports ) ] )
+        counts = [ c for m, c in reports ]
+        self.assert_( counts == sorted( counts, reverse=True ) )
+    
+    def test_too_few_congruences(self):
+        """Insufficient congruences"""
+        trace = reduced_computation_schoof.frobenius_trace( self.E )
+        search_range = range( -10**6, 10**6 )
+        congruences = [ QuotientRing( Integers, 3 )( trace ) ]
+        self.assertRaises( ArithmeticError,
+                           reduced_computation_schoof.combine_trace_congruences,
+                           self.E, congruences, search_range )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( CombineTraceCongruencesTest )
+    )
+
+
+import os
+import tempfile
+from support.running import Checkpoint
+
+class TraceCheckpointTest(unittest.TestCase):
+    """
+    Test cases for resuming reduced_computation_schoof from a checkpoint
+    """
+    
+    E = EllipticCurve( FiniteField(10007), 3, 7 )
+    
+    def setUp(self):
+        descriptor, self.filename = tempfile.mkstemp()
+        os.close( descriptor )
+    
+    def tearDown(self):
+        os.remove( self.filename )
+    
+    def test_resume(self):
+        """Recorded congruences are reused"""
+        checkpoint = Checkpoint( self.filename )
+        trace = reduced_computation_schoof.frobenius_trace(
+                                        self.E, checkpoint=checkpoint )
+        checkpoint.close()
+        self.assert_( trace == reduced_computation_schoof.frobenius_trace( self.E ) )
+        records = Checkpoint( self.filename, resume=True ).records()
+        self.assert_( records )
+        self.assert_( all( trace % m == r for m, r in records.items() ) )
+        
+        reports = []
+        checkpoint = Checkpoint( self.filename, resume=True )
+        resumed = reduced_computation_schoof.frobenius_trace(
+                        self.E,
+                        progress=lambda m, c: reports.append( m ),
+                        checkpoint=checkpoint
+                    )
+        checkpoint.close()
+        self.assert_( resumed == trace )
+        # Nothing new to compute, so nothing new to record.
+        self.assert_( sorted( reports ) == sorted( records ) )
+        self.assert_( Checkpoint( self.filename, resume=True ).records() == records )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( TraceCheckpointTest )
+    )
+
+
+class TinyFieldTest(unittest.TestCase):
+    """
+    Test cases for curves over fields with a handful of elements; some of
+    them have no finite points
+    """
+    
+    def test_against_count(self):
+        """Traces over tiny fields agree with the point count"""
+        for p in [ 3, 5, 7 ]:
+            squares = [ 0 ] * p
+            for y in range( p ):
+                squares[ y*y % p ] += 1
+            for A in range( p ):
+                for B in range( p ):
+                    if ( 4*A**3 + 27*B**2 ) % p == 0:
+                        continue
+                    order = 1 + sum( squares[ (x**3 + A*x + B) % p ]
+                                     for x in range( p ) )
+                    E = EllipticCurve( FiniteField( p ), A, B )
+                    for frobenius_trace in [
+                                reduced_computation_schoof.frobenius_trace,
+                                sea_schoof.frobenius_trace ]:
+                        self.assert_( frobenius_trace( E ) == p + 1 - order )
+    
+    def test_no_finite_points(self):
+        """Curves with the point at infinity alone"""
+        # y^2 = x^3 + 2x + 2 over GF(3) has no finite point.
+        E = EllipticCurve( FiniteField( 3 ), 2, 2 )
+        self.assert_( reduced_computation_schoof.random_point( E ) is None )
+        self.assert_( reduced_computation_schoof.verify_trace_candidates(
+                                                    E, [ 0, 3 ] ) == 3 )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( TinyFieldTest )
+    )
+
+
+from support.primes import is_probable_prime
+
+class ScreenCurveTest(unittest.TestCase):
+    """
+    Test cases for screening curves by their cofactor in
+    reduced_computation_schoof
+    """
+    
+    p = 1009
+    
+    def test_against_count(self):
+        """Screening agrees with the point count"""
+        for A, B in [ (1, 1), (2, 3), (5, 11), (7, 2), (13, 17), (4, 9) ]:
+            E = EllipticCurve( FiniteField( self.p ), A, B )
+            order = self.p + 1 - reduced_computation_schoof.frobenius_trace( E )
+            for max_cofactor in [ 1, 2, 4 ]:
+                acceptable = any( order % h == 0 and is_probable_prime( order // h )
+                                  for h in range( 1, max_cofactor + 1 ) )
+                result = reduced_computation_schoof.screen_curve( E, max_cofactor )
+                self.assert_( result == ( order if acceptable else None ) )
+    
+    def test_even_order(self):
+        """Rational 2-torsion rejects prime orders"""
+        # x^3 + 2x - 3 has the zero 1.
+        E = EllipticCurve( FiniteField( self.p ), 2, -3 )
+        stages = []
+        self.assert_( reduced_computation_schoof.screen_curve(
+                                    E, rejection=stages.append ) is None )
+        self.assert_( stages == [ "2-torsion" ] )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( ScreenCurveTest )
+    )
+
+
+class ComplexMultiplicationTest(unittest.TestCase):
+    """
+    Test cases for the closed-form traces of curves with complex
+    multiplication in reduced_computation_schoof
+    """
+    
+    def _point_count_trace(self, p, A, B):
+        squares = [ 0 ] * p
+        for y in range( p ):
+            squares[ y*y % p ] += 1
+        return p + 1 - ( 1 + sum( squares[ (x**3 + A*x + B) % p ]
+                                  for x in range( p ) ) )
+    
+    def test_against_count(self):
+        """Agreement with counted points"""
+        # 97 = 1 mod 12 has ordinary curves in both families; 83 = 11 mod 12
+        # has only supersingular ones.
+        for p in [ 97, 83, 1009 ]:
+            for D in [ 1, 2, 3, 5, 7, 11 ]:
+                for A, B in [ (0, D), (D, 0), (0, -D), (-D, 0) ]:
+                    E = EllipticCurve( FiniteField(p), A, B )
+                    trace = reduced_computation_schoof.complex_multiplication_trace( E )
+                    self.assert_( trace == self._point_count_trace( p, A, B ) )
+    
+    def test_against_generic(self):
+        """Agreement with the generic congruences"""
+        p = 1000000009
+        for A, B in [ (0, 7), (3, 0), (0, -2), (-5, 0) ]:
+            E = EllipticCurve( CompactFiniteField(p), A, B )
+            trace = reduced_computation_schoof.frobenius_trace( E )
+            self.assert_( trace ==
+                    reduced_computation_schoof.complex_multiplication_trace( E ) )
+            congruence = reduced_computation_schoof.frobenius_trace_mod_2k( E, 2 )
+            self.assert_( ( trace - congruence.remainder() ) % 4 == 0 )
+            torsion_group = ProjectiveLTorsionGroup( E )
+            for l in [ 3, 5, 7 ]:
+                congruence = reduced_computation_schoof.frobenius_trace_mod_l(
+                                                        torsion_group( l ) )
+                self.assert_( ( trace - congruence.remainder() ) % l == 0 )
+    
+    def test_other_curves(self):
+        """No closed form for other curves"""
+        E = EllipticCurve( FiniteField(97), 2, 3 )
+        self.assert_( reduced_computation_schoof.complex_multiplication_trace( E )
+                      is None )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( ComplexMultiplicationTest )
+    )
+
+
+class BSGSCountTest(unittest.TestCase):
+    """
+    Test cases for the baby-step giant-step point counting in bsgs_count
+    """
+    
+    def test_against_schoof(self):
+        """Agreement with Schoof's algorithm"""
+        for p in [ 1009, 10007, 1000003 ]:
+            for A, B in [ (3, 7), (5, 11), (1, 1) ]:
+                E = EllipticCurve( CompactFiniteField(p), A, B )
+                self.assert_( bsgs_count.frobenius_trace( E )
+                              == reduced_computation_schoof.frobenius_trace( E ) )
+    
+    def test_twist(self):
+        """Quadratic twists have the negative trace"""
+        E = EllipticCurve( CompactFiniteField(10007), 5, 11 )
+        twist = bsgs_count.quadratic_twist( E )
+        self.assert_( bsgs_count.frobenius_trace( twist )
+                      == -bsgs_count.frobenius_trace( E ) )
+    
+    def test_order_congruence(self):
+        """Point orders restrict the group order"""
+        p = 10007
+        E = EllipticCurve( CompactFiniteField(p), 3, 7 )
+        order = p + 1 - reduced_computation_schoof.frobenius_trace( E )
+        for i in range( 5 ):
+            P = reduced_computation_schoof.random_point( E )
+            residue, modulus = bsgs_count.order_congruence( P )
+            self.assert_( ( order - residue ) % modulus == 0 )
+            self.assert_( ( residue * P ).is_infinite() )
+    
+    def test_dispatch(self):
+        """Choice of the algorithm by bit size"""
+        previous = point_count.set_bsgs_bit_limit( 20 )
+        try:
+            self.assert_( point_count.counting_algorithm( 2**20 - 3 )
+                          == bsgs_count.frobenius_trace )
+            self.assert_( point_count.counting_algorithm( 2**21 - 9 )
+                          == reduced_computation_schoof.frobenius_trace )
+        finally:
+            point_count.set_bsgs_bit_limit( previous )
+        self.assert_( point_count.bsgs_bit_limit == previous )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( BSGSCountTest )
+    )
+
+
+from support.trace_cache import TraceCache, OrderCache
+
+class TraceCacheTest(unittest.TestCase):
+    """
+    Test cases for the persistent cache of Frobenius traces
+    """
+    
+    p = 1009
+    
+    def setUp(self):
+        descriptor, self.filename = tempfile.mkstemp()
+        os.close( descriptor )
+    
+    def tearDown(self):
+        os.remove( self.filename )
+    
+    def _curve(self, A, B):
+        return EllipticCurve( FiniteField( self.p ), A, B )
+    
+    def test_isomorphic_and_twisted(self):
+        """Isomorphic curves and twists share an entry"""
+        E = self._curve( 5, 11 )
+        trace = reduced_computation_schoof.frobenius_trace( E )
+        cache = TraceCache( self.filename )
+        self.assert_( cache.lookup( E ) is None )
+        cache.store( E, trace )
+        for c in range( 1, 8 ):
+            twisted = self._curve( 5 * c**2, 11 * c**3 )
+            sign = 1 if pow( c, (self.p - 1) // 2, self.p ) == 1 else -1
+            self.assert_( cache.lookup( twisted ) == sign * trace )
+            self.assert_( cache.lookup( twisted )
+                          == reduced_computation_schoof.frobenius_trace( twisted ) )
+        cache.close()
+    
+    def test_persistence(self):
+        """Entries survive reopening and interrupted writes"""
+        E = self._curve( 2, 3 )
+        trace = reduced_computation_schoof.frobenius_trace( E )
+        cache = TraceCache( self.filename )
+        cache.store( E, trace )
+        cache.close()
+        with open( self.filename, "at" ) as cache_file:
+            cache_file.write( "1009 17" )
+        
+        cache = TraceCache( self.filename )
+        self.assert_( cache.lookup( E ) == trace )
+        cache.store( self._curve( 1, 1 ), 0 )
+        cache.close()
+        with open( self.filename, "rt" ) as cache_file:
+            lines = cache_file.read().split( "\n" )
+        self.assert_( len( lines ) == 3 and lines[-1] == "" )
+    
+    def test_shared_file(self):
+        """Lookups see the entries of other instances"""
+        E = self._curve( 7, 13 )
+        reader = TraceCache( self.filename )
+        writer = TraceCache( self.filename )
+        self.assert_( reader.lookup( E ) is None )
+        writer.store( E, 12 )
+        self.assert_( reader.lookup( E ) == 12 )
+        reader.close()
+        writer.close()
+    
+    def test_order_cache(self):
+        """Group orders of the command line inputs share the trace entries"""
+        E = self._curve( 5, 11 )
+        trace = reduced_computation_schoof.frobenius_trace( E )
+        cache = OrderCache( self.filename )
+        self.assert_( cache.lookup( ( "1009", "5", "11" ) ) is None )
+        cache.store( ( "1009", "5", "11" ), self.p + 1 - trace )
+        reader = TraceCache( self.filename )
+        self.assert_( reader.lookup( E ) == trace )
+        self.assert_( cache.lookup( ( "1009", "20", "88" ) )
+                      == self.p + 1 - reduced_computation_schoof.frobenius_trace(
+                                                    self._curve( 20, 88 ) ) )
+        reader.close()
+    
+    def test_uncovered_curves(self):
+        """Curves with A = 0 or B = 0 are not cached"""
+        cache = TraceCache( self.filename )
+        for A, B in [ (0, 5), (5, 0) ]:
+            cache.store( self._curve( A, B ), 0 )
+            self.assert_( cache.lookup( self._curve( A, B ) ) is None )
+        cache.close()
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( TraceCacheTest )
+    )
+
+
+from elliptic_curves.modular_polynomials.classical import \
+        modular_polynomial, compute_modular_polynomial
+from rings.polynomials.naive import Polynomials
+from rings.quotients.naive import QuotientRing
+from rings.integers.naive import Integers
+
+class ModularPolynomialTest(unittest.TestCase):
+    """Test cases for the classical modular polynomials"""
+    
+    def test_phi_2(self):
+        """Coefficients of Phi_2"""
+        phi = compute_modular_polynomial( 2 )
+        self.assert_( phi[3][0] == 1 and phi[2][2] == -1 )
+        self.assert_( phi[2][1] == 1488 )
+        self.assert_( phi[2][0] == -162000 )
+        self.assert_( phi[1][1] == 40773375 )
+        self.assert_( phi[1][0] == 8748000000 )
+        self.assert_( phi[0][0] == -157464000000000 )
+    
+    def test_symmetry(self):
+        """Symmetry of the computed polynomials"""
+        for l in [ 3, 5, 7 ]:
+            phi = compute_modular_polynomial( l )
+            for i in range( l+2 ):
+                for k in range( l+2 ):
+                    self.assert_( phi[i][k] == phi[k][i] )
+    
+    def test_bundled(self):
+        """Bundled and computed polynomials agree"""
+        for l in [ 3, 5, 11 ]:
+            self.assert_( modular_polynomial( l ) == compute_modular_polynomial( l ) )
+    
+    def test_non_prime(self):
+        """Non-prime level"""
+        self.assertRaises( ValueError, modular_polynomial, 9 )
+
+
+class SEATest(unittest.TestCase):
+    """
+    Test cases for the Elkies and Atkin primes in sea_schoof
+    """
+    
+    p = 1009
+    E = EllipticCurve( FiniteField(p), 5, 11 )
+    
+    def test_count_points(self):
+        """Point counts agree with enumeration"""
+        for A, B in [ (5, 11), (123, 456), (1, 1) ]:
+            E = EllipticCurve( FiniteField( self.p ), A, B )
+            self.assert_( sea_schoof.frobenius_trace( E )
+                          == self.p + 1 - self._count_points( A, B ) )
+    
+    def test_fallback(self):
+        """Exhausting the primes falls back to Schoof's algorithm"""
+        # Without the point order tests, the Atkin primes never suffice.
+        limit = sea_schoof.atkin_candidates_limit
+        sea_schoof.atkin_candidates_limit = 0
+        try:
+            E = EllipticCurve( FiniteField( self.p ), 123, 456 )
+            self.assert_( sea_schoof.frobenius_trace( E )
+                          == self.p + 1 - self._count_points( 123, 456 ) )
+        finally:
+            sea_schoof.atkin_candidates_limit = limit
+    
+    def test_kernel_polynomial(self):
+        """Kernel polynomials divide the division polynomial"""
+        R = Polynomials( self.E.field() )
+        j = sea_schoof.j_invariant( self.E )
+        kernel_count = 0
+        for l in [ 3, 5, 7 ]:
+            modular = sea_schoof.modular_equation( l, j, R )
+            for isogenous_j in self._roots( modular ):
+                try:
+                    kernel = sea_schoof.kernel_polynomial( self.E, l, isogenous_j )
+                except ZeroDivisionError:
+                    # Double zeros of the modular equation have no formula.
+                    continue
+                kernel_count += 1
+                division_polynomial = \
+                    ProjectiveLTorsionGroup( self.E )( l )._torsion_polynomial()
+                self.assert_( kernel.degree() == (l-1) // 2 )
+                self.assert_( not division_polynomial % kernel )
+        self.assert_( kernel_count > 0 )
+    
+    def test_trace_candidates(self):
+        """The trace lies among the candidates"""
+        trace = self.p + 1 - self._count_points( 5, 11 )
+        for l in [ 3, 5, 7, 11, 13 ]:
+            Z = QuotientRing( Integers, l )
+            self.assert_( Z( trace ) in sea_schoof.trace_candidates( self.E, l ) )
+    
+    def _count_points(self, A, B):
+        p = self.p
+        squares = [ 0 ] * p
+        for y in range( p ):
+            squares[ y*y % p ] += 1
+        return 1 + sum( squares[ (x**3 + A*x + B) % p ] for x in range( p ) )
+    
+    def _roots(self, polynomial):
+        field = polynomial.coefficient_field()
+        return [ field( a ) for a in range( self.p ) if not polynomial( field( a ) ) ]
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( ModularPolynomialTest )
+    )
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( SEATest )
+    )
+
+
 if __name__ == "__main__":
     all_tests = unittest.TestSuite( all_suites )
     unittest.TextTestRunner().run( all_tests )
@@ -18,6 +18,8 @@
 import unittest
 
 from fields.finite.naive import FiniteField
+from support.multiples import double_and_add_multiple, naf_multiple, \
+                              PrecomputedMultiples
 
 def generate_test_suites(curve_implementation, infinity_implementation,  \
                           name_prefix):
@@ -39,13 +41,17 @@ def generate_test_suites(curve_implementation, infinity_implementation,  \
   O = infinity_implementation()
 
 
-  # TODO: Add test cases for point creation (on the curve or not)
-
 
   class PointsTest(unittest.TestCase):
     """
     Test cases for creating and comparing points on elliptic curves 
     """
+    #- Creation --------------------------------------------------------------- 
+    def test_create_off_curve(self):
+        """Creation of points not on the curve"""
+        self.assertRaises( ValueError, E1, 9, 6 )
+
+
     #- Equality --------------------------------------------------------------- 
     def test_eq_true(self):
         """Equality: true statement"""
@@ -72,6 +78,20 @@ def generate_test_suites(curve_implementation, infinity_implementation,  \
         self.failIf( E1(9, 5).is_infinite() )
 
 
+    #- Representation --------------------------------------------------------- 
+    def test_coordinates(self):
+        """Re-creation from coordinates"""
+        P = E1(11, 10) + E1(9, 5)
+        self.assert_( E1( *P.coordinates() ) == P )
+
+    def test_to_affine(self):
+        """Conversion to Cartesian coordinates"""
+        P = (E1(11, 10) + E1(11, 10)).to_affine()
+        self.assert_( (P.x(), P.y()) == (F(13), F(18)) )
+        self.assert_( P == E1(13, 18) )
+        self.assert_( (E1(9, 5) - E1(9, 5)).to_affine() == O )
+
+
   class GroupOperationTest(unittest.TestCase):
     """
     Test cases for the group operation on elliptic curves
@@ -129,6 +149,35 @@ def generate_test_suites(curve_implementation, infinity_implementation,  \
     def test_rmul_zero(self):
         """Multiplication with zero (point as right factor)"""
         self.assert_( 0 * E1(11, 10) == O )
+
+    def test_mul_negative(self):
+        """Multiplication with negative integers"""
+        P = E1(11, 10)
+        self.assert_( P * -1 == -P )
+        self.assert_( -3 * P == -(P + P + P) )
+
+    def test_mul_order(self):
+        """Multiplication with the group order and beyond"""
+        # The curve y^2 = x^3 + x over GF(23) has 24 points.
+        P = E1(11, 10)
+        self.assert_( P * 24 == O )
+        self.assert_( P * (24 * 2**70 + 5) == P * 5 )
+
+    def test_mul_strategies(self):
+        """Multiplication with different strategies"""
+        P = E1(11, 10)
+        multiples = PrecomputedMultiples( P )
+        for n in range( -30, 30 ):
+            expected = O
+            for i in range( abs(n) ):
+                expected = expected + P
+            if n < 0:
+                expected = -expected
+            self.assert_( P * n == expected )
+            self.assert_( multiples( n ) == expected )
+            if n > 0:
+                self.assert_( double_and_add_multiple( P, n ) == expected )
+                self.assert_( naf_multiple( P, n ) == expected )
         
 
   class PointAtInfinityTest(unittest.TestCase):
@@ -176,11 +225,18 @@ def generate_test_suites(curve_implementation, infinity_implementation,  \
 #===============================================================================
 
 import elliptic_curves.naive
+import elliptic_curves.projective
 
 implementations = [
     ( elliptic_curves.naive.EllipticCurve,
       elliptic_curves.naive.PointAtInfinity,
       "Naive" ),
+    ( elliptic_curves.projective.ProjectivePoint,
+      elliptic_curves.naive.PointAtInfinity,
+      "Projective" ),
+    ( elliptic_curves.projective.JacobianPoint,
+      elliptic_curves.naive.PointAtInfinity,
+      "Jacobian" ),
 ]
 
 all_suites = []
@@ -84,6 +84,12 @@ def generate_test_suites(finitefield_implementation, name_prefix):
     def test_eq_uncastable(self):
         """Equality: uncastable resolves to false"""
         self.failIf( F(1) == G(1) )
+
+    def test_hash(self):
+        """Hash: equal elements and their remainders hash alike"""
+        self.assert_( hash( F(3) ) == hash( F(20) ) == hash( 3 ) )
+        self.assert_( hash( G(3) ) == hash( G(2**89 + 2) ) == hash( 3 ) )
+        self.assert_( F(20) in set( [ F(3) ] ) )
         
 
     #- Inequality ------------------------------------------------------------- 
@@ -265,6 +271,20 @@ def generate_test_suites(finitefield_implementation, name_prefix):
         self.assert_( F(15)**2 == F(4) )
         self.assert_( G(2**45)**2 == G(2) )
 
+    def test_pow_large(self):
+        """Integer power with large exponents (Fermat's little theorem)"""
+        self.assert_( F(3)**16 == F(1) )
+        self.assert_( G(3)**(2**89 - 2) == G(1) )
+
+    def test_pow_zero(self):
+        """Integer power with exponent zero"""
+        self.assert_( F(5)**0 == F(1) )
+        self.assert_( G(5)**0 == G(1) )
+
+    def test_pow_negative(self):
+        """Integer power with negative exponents"""
+        self.assert_( F(2)**-3 == F(8).multiplicative_inverse() )
+
     def test_pow_non_casting(self):
         """Integer power: no casting of exponent"""
         def f():
@@ -287,9 +307,11 @@ def generate_test_suites(finitefield_implementation, name_prefix):
 #===============================================================================
 
 import fields.finite.naive
+import fields.finite.compact
 
 implementations = [
     (fields.finite.naive.FiniteField, "Naive"),
+    (fields.finite.compact.FiniteField, "Compact"),
 ]
 
 all_suites = []
@@ -297,6 +319,28 @@ for implementation, prefix in implementations:
     all_suites.extend( generate_test_suites( implementation, prefix ) )
 
 
+class CompactEqualityTest(unittest.TestCase):
+    """Test cases for comparisons of compact elements with integers"""
+    
+    F = fields.finite.compact.FiniteField( 17 )
+    
+    def test_eq_remainder_only(self):
+        """Equality: integers equal the element only as remainder"""
+        self.assert_( self.F(3) == 3 )
+        self.failIf( self.F(3) == 20 )
+        self.failIf( self.F(3) == -14 )
+    
+    def test_hash_consistent(self):
+        """Hash: integers that equal an element have its hash"""
+        elements = set( [ self.F(3) ] )
+        self.assert_( 3 in elements )
+        self.failIf( 20 in elements )
+
+all_suites.append(
+        unittest.TestLoader().loadTestsFromTestCase( CompactEqualityTest )
+    )
+
+
 if __name__ == "__main__":
     all_tests = unittest.TestSuite( all_suites )
     unittest.TextTestRunner().run( all_tests )
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import unittest
+
+from fields.finite.naive import FiniteField
+from elliptic_curves.naive import EllipticCurve
+
+def generate_test_suites(torsion_group_implementation, name_prefix):
+  """
+  Generate TestCase classes for the given l-torsion group implementation and
+  combine all tests to TestSuites. This groups the tests by implementation
+  and category (instead of category alone) and allows flexible addition
+  and removal of implementations.
+  """
+
+  F = FiniteField( 23 )
+  E = EllipticCurve( F, 3, 4 )
+  El = torsion_group_implementation( E )
+
+  def frobenius(point, q):
+      return point.__class__( *[ c ** q for c in point.coordinates() ] )
+
+
+  class FrobeniusTest(unittest.TestCase):
+    """
+    Test cases concerning the cached Frobenius images of torsion points.
+    """
+    def test_frobenius_point(self):
+        """Frobenius image"""
+        for l in [ 3, 5 ]:
+            torsion_group = El( l )
+            point = torsion_group.elements()[0]
+            self.assert_( torsion_group.frobenius_point()
+                          == frobenius( point, 23 ) )
+
+    def test_frobenius2_point(self):
+        """Frobenius image of the Frobenius image"""
+        torsion_group = El( 3 )
+        point = torsion_group.elements()[0]
+        expected = frobenius( frobenius( point, 23 ), 23 )
+        self.assert_( torsion_group.frobenius_point( 2 ) == expected )
+
+    def test_frobenius_point_cached(self):
+        """Frobenius images are computed once"""
+        torsion_group = El( 5 )
+        self.assert_( torsion_group.frobenius_point( 2 )
+                      is torsion_group.frobenius_point( 2 ) )
+
+    def test_frobenius_point_invalid(self):
+        """Frobenius image for non-positive powers raises exception"""
+        def f():
+            return El( 3 ).frobenius_point( 0 )
+        self.assertRaises( ValueError, f )
+
+
+  class TorsionTest(unittest.TestCase):
+    """
+    Test cases concerning the admissible torsions.
+    """
+    def test_even_torsion(self):
+        """Even torsions raise exception"""
+        self.assertRaisesRegex( ValueError, "odd", El, 4 )
+
+    def test_characteristic_torsion(self):
+        """Multiples of the characteristic raise exception"""
+        self.assertRaisesRegex( ValueError, "characteristic", El, 23 )
+
+
+  suites = []
+  for test_class in [ FrobeniusTest, TorsionTest ]:
+      test_class.__name__ = "{0}_{1}".format( name_prefix, test_class.__name__ )
+      suites.append( unittest.TestLoader().loadTestsFromTestCase( test_class ) )
+  return suites
+
+
+#===============================================================================
+# Implementation importing and TestSuites generation
+#===============================================================================
+
+import elliptic_curves.l_torsion_group.naive
+
+implementations = [
+    ( elliptic_curves.l_torsion_group.naive.LTorsionGroup, "Naive" ),
+    ( elliptic_curves.l_torsion_group.naive.ProjectiveLTorsionGroup,
+      "Projective" ),
+]
+
+all_suites = []
+for implementation, prefix in implementations:
+    all_suites.extend( generate_test_suites( implementation, prefix ) )
+
+
+class TorsionFactorTest(unittest.TestCase):
+    """
+    Test cases concerning the admissible torsions of torsion factors.
+    """
+    def setUp(self):
+        E = EllipticCurve( FiniteField( 23 ), 3, 4 )
+        self.T = elliptic_curves.l_torsion_group.naive.TorsionFactor( E )
+        self.factor = self.T._division_polynomial_list()[4].y_factor()
+
+    def test_even_torsion(self):
+        """Even torsions are admissible"""
+        self.assert_( self.T( 4, self.factor ).torsion() == 4 )
+
+    def test_small_torsion(self):
+        """Torsions below 3 raise exception without demanding odd ones"""
+        self.assertRaisesRegex( ValueError, "^only torsions greater than 2",
+                                self.T, 2, self.factor )
+
+all_suites.append( unittest.TestLoader().loadTestsFromTestCase( TorsionFactorTest ) )
+
+
+if __name__ == "__main__":
+    all_tests = unittest.TestSuite( all_suites )
+    unittest.TextTestRunner().run( all_tests )
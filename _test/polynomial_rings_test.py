@@ -87,6 +87,12 @@ def generate_test_suites(polynomialring_implementation, name_prefix):
         self.assert_( R(1, -1, 3) == R(1, -1, 3, 0, 0) )
         self.assert_( S(1, -1, 3) == S(1, -1, 3, 17, 34, 0) )
 
+    def test_hash(self):
+        """Hash: equal polynomials have equal hashes"""
+        self.assert_( hash( R(1, -1, 3) ) == hash( R(1, -1, 3, 0, 0) ) )
+        self.assert_( hash( S(1, -1, 3) ) == hash( S(1, -1, 3, 17, 34, 0) ) )
+        self.assert_( len( { S(0), S(0, 0), S(1, 2), S(1, 2, 0) } ) == 2 )
+
     def test_eq_casting_field_elements(self):
         """Equality: automatic casting of field elements on the right hand side"""
         self.assert_( R(3) == Z(3) )
@@ -412,6 +418,31 @@ def generate_test_suites(polynomialring_implementation, name_prefix):
         self.assert_( R(1, 1)**2 == R(1, 2, 1) )    
         self.assert_( S(1, 1)**2 == S(1, 2, 1) )    
 
+    def test_pow_zero(self):
+        """Integer power with exponent zero"""
+        self.assert_( S(1, 1)**0 == S(1) )
+
+    def test_pow_modulus(self):
+        """Integer power with reduction modulo a polynomial"""
+        self.assert_( pow( S(0, 1), 2**40, S(1, 0, 1) ) == S(1) )
+
+    def test_powmod(self):
+        """Modular exponentiation"""
+        self.assert_( S(0, 1).powmod( 2**40, S(1, 0, 1) ) == S(1) )
+        self.assert_( S(1, 1).powmod( 5, S(1, 0, 0, 1) ) \
+                        == S(1, 1)**5 % S(1, 0, 0, 1) )
+        self.assert_( S(2, 3).powmod( 0, S(1, 1) ) == S(1) )
+
+    def test_compose_mod(self):
+        """Modular composition"""
+        f = S( list( range( 1, 21 ) ) )
+        g = S( 3, 0, 1, 2, 5 )
+        m = S( 1, 2, 0, 4, 1, 1, 0, 3, 1, 0, 2 )
+        self.assert_( f.compose_mod( g, m ) == f( g ) % m )
+        self.assert_( S(0, 1).compose_mod( g, m ) == g )
+        self.assert_( S(5).compose_mod( g, m ) == S(5) )
+        self.assert_( f.compose_mod( S(0), m ) == f( S(0) ) )
+
     def test_pow_non_casting(self):
         """Integer power: only integer exponents"""
         def f():
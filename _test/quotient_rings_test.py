@@ -37,6 +37,9 @@ def generate_test_suites(quotientring_implementation, name_prefix):
   
   P = rings.polynomials.naive.Polynomials( fields.finite.naive.FiniteField( 17 ) )
   R = quotientring_implementation( P, P(1, 0, 0, 1) )
+  # A modulus of large degree for reduction with a precomputed reciprocal
+  m = P( 3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8 )
+  S = quotientring_implementation( P, m )
 
 
   class ElementsTest(unittest.TestCase):
@@ -267,6 +270,13 @@ def generate_test_suites(quotientring_implementation, name_prefix):
         self.assert_( G(7).multiplicative_inverse() == G(3) )
         self.assert_( R((0, 0, 1)).multiplicative_inverse() == R((0, -1)))
     
+    def test_mul_inverse_non_monic_gcd(self):
+        """Multiplicative inverse if the gcd is a constant other than one"""
+        x = R((2, 3))
+        self.assert_( x * x.multiplicative_inverse() == R(1) )
+        y = S( (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13) )
+        self.assert_( y * y.multiplicative_inverse() == S(1) )
+    
     def test_mul_inverse_zero(self):
         """Multiplicative inverse of zero raises exception"""
         def f():
@@ -344,6 +354,16 @@ def generate_test_suites(quotientring_implementation, name_prefix):
         self.assert_( G(3)**3 == G(7) )
         self.assert_( R((0, 1))**3 == R(-1) )
 
+    def test_pow_large(self):
+        """Integer power with large exponents"""
+        self.assert_( F(3)**(2**64 + 1) == F(3)**((2**64 + 1) % 16) )
+        self.assert_( R((0, 1))**(6 * 2**64 + 1) == R((0, 1)) )
+
+    def test_pow_zero(self):
+        """Integer power with exponent zero"""
+        self.assert_( F(5)**0 == F(1) )
+        self.assert_( R((0, 1))**0 == R(1) )
+
     def test_pow_non_casting(self):
         """Integer power: no casting of exponent"""
         def f():
@@ -356,6 +376,21 @@ def generate_test_suites(quotientring_implementation, name_prefix):
         self.assertRaises( TypeError, g )
         self.assertRaises( TypeError, h )
 
+    def test_compose(self):
+        """Composition of polynomial residue classes"""
+        a = P( list( range( 1, 30 ) ) )
+        b = P( 4, 0, 7, 1 )
+        self.assert_( S(a).compose( S(b) ) == S( (a % m)( b ) ) )
+        self.assert_( R((1, 2, 3)).compose( R((0, 0, 1)) ) == R((1, 0, 2, 0, 3)) )
+
+    def test_reduction_large_modulus(self):
+        """Reduction modulo a polynomial of large degree"""
+        a = P( list( range( 1, 23 ) ) )
+        b = P( list( range( 40, 0, -3 ) ) )
+        self.assert_( S(a).remainder() == a % m )
+        self.assert_( (S(a) * S(b)).remainder() == (a * b) % m )
+        self.assert_( S(a)**5 == S( a**5 % m ) )
+
 
   suites = []
   for test_class in [ ElementsTest, ArithmeticTest ]:
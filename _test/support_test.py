@@ -60,6 +60,26 @@ class InversePrimorialTest(unittest.TestCase):
         self.assert_( inverse_primorial(-1) == 2 )
 
 
+from support.primes import is_probable_prime
+
+class IsProbablePrimeTest(unittest.TestCase):
+    """Test cases for the Miller-Rabin test @c support.primes.is_probable_prime"""
+
+    def test_small(self):
+        """Agreement with the sieve"""
+        primes = set( primes_range( 1, 2000 ) )
+        for n in range( -2, 2000 ):
+            self.assert_( is_probable_prime( n ) == ( n in primes ) )
+
+    def test_large(self):
+        """Mersenne numbers and strong pseudoprimes"""
+        self.assert_( is_probable_prime( 2**61 - 1 ) )
+        self.assert_( is_probable_prime( 2**127 - 1 ) )
+        self.assert_( not is_probable_prime( 2**67 - 1 ) )
+        # Strong pseudoprime to the bases 2, 3, 5, and 7
+        self.assert_( not is_probable_prime( 3215031751 ) )
+
+
 #- Quotients ------------------------------------------------------------------ 
 
 from rings.integers.naive import Integers
@@ -97,7 +117,41 @@ class CongruenceEquationTest(unittest.TestCase):
         def f():
             solve_congruence_equations( [] )
         self.assertRaises( ValueError , f )
+
+    def test_common_divisors(self):
+        """Moduli with common divisors"""
+        Z4 = QuotientRing( Integers, 4 )
+        Z6 = QuotientRing( Integers, 6 )
+        solution = solve_congruence_equations( [ Z4(1), Z6(3), Z4(1) ] )
+        self.assert_( solution.modulus() == 12 )
+        self.assert_( solution.remainder() == 9 )
+
+    def test_contradiction(self):
+        """Contradicting congruence equations"""
+        Z4 = QuotientRing( Integers, 4 )
+        Z6 = QuotientRing( Integers, 6 )
+        self.assertRaises( ValueError, solve_congruence_equations,
+                           [ Z4(1), Z6(2) ] )
+    
+
+from support.quotients import representatives_in_range
+
+class RepresentativesInRangeTest(unittest.TestCase):
+    """Test cases for the representatives of congruences in ranges"""
+    
+    def test_result(self):
+        """Sample results"""
+        Z7 = QuotientRing( Integers, 7 )
+        self.assert_( list( representatives_in_range( Z7(3), range(0, 20) ) )
+                      == [ 3, 10, 17 ] )
+        self.assert_( list( representatives_in_range( Z7(3), range(-10, 4) ) )
+                      == [ -4, 3 ] )
     
+    def test_empty(self):
+        """No representatives"""
+        Z7 = QuotientRing( Integers, 7 )
+        self.assert_( len( representatives_in_range( Z7(6), range(0, 5) ) ) == 0 )
+
 
 from support.quotients import inverse_modulo
 
@@ -122,6 +176,45 @@ class InverseModuloTest(unittest.TestCase):
         self.assertRaises( ZeroDivisionError, f )
 
 
+from support.quotients import square_root_modulo
+
+class SquareRootModuloTest(unittest.TestCase):
+    """Test cases for the computation of square roots modulo primes"""
+    
+    def test_result(self):
+        """Square roots of all squares"""
+        # 11 = 3 mod 4 uses the shortcut, 13 and 17 need Tonelli-Shanks.
+        for p in [ 2, 11, 13, 17 ]:
+            for n in range( p ):
+                root = square_root_modulo( n*n, p )
+                self.assert_( (root*root - n*n) % p == 0 )
+
+    def test_non_square(self):
+        """Input without square root"""
+        def f():
+            square_root_modulo(2, 13)
+        self.assertRaises( ValueError, f )
+
+
+from support.quotients import cornacchia
+
+class CornacchiaTest(unittest.TestCase):
+    """Test cases for the algorithm of Cornacchia"""
+    
+    def test_result(self):
+        """Representations x^2 + d*y^2 of primes"""
+        for p in [ 13, 97, 1009, 1000000009 ]:
+            for d in [ 1, 3 ]:
+                x, y = cornacchia( d, p )
+                self.assert_( x*x + d*y*y == p )
+    
+    def test_no_solution(self):
+        """Primes without representation"""
+        # 7 = 3 mod 4 is no sum of two squares; 11 = 2 mod 3.
+        self.assertRaises( ValueError, cornacchia, 1, 7 )
+        self.assertRaises( ValueError, cornacchia, 3, 11 )
+
+
 #- Rings ---------------------------------------------------------------------- 
 
 from fields.finite.naive import FiniteField
@@ -155,6 +248,14 @@ class ExtendedEuclideanAlgorithmTest(unittest.TestCase):
         x, y, d = eeuc( p, q )
         self.assert_( x*p + y*q == d )
         
+    def test_negative_integers(self):
+        """GCD of negative integers is positive"""
+        for u, v in [ (-4, 6), (4, -6), (-4, -6), (6, -4) ]:
+            for integer_type in [ int, Integers ]:
+                u, v = integer_type( u ), integer_type( v )
+                x, y, d = eeuc( u, v )
+                self.assert_( d == 2 and x*u + y*v == d )
+        
     def test_zero(self):
         """GCD of zero"""
         def f():
@@ -167,7 +268,64 @@ class ExtendedEuclideanAlgorithmTest(unittest.TestCase):
 
 from fields.finite.naive import FiniteField
 from rings.polynomials.naive import Polynomials
-from support.rings import gcd
+from support.rings import gcd, half_gcd, set_half_gcd_threshold
+
+class HalfGcdTest(unittest.TestCase):
+    """Test cases for the half-gcd algorithm"""
+    
+    R = Polynomials( FiniteField(101) )
+    
+    def setUp(self):
+        # A small threshold exercises the recursion on small polynomials.
+        self.threshold = set_half_gcd_threshold( 2 )
+    
+    def tearDown(self):
+        set_half_gcd_threshold( self.threshold )
+    
+    def _polynomial(self, degree):
+        coefficients = [ random.randrange(0, 101) for i in range(degree) ]
+        return self.R( coefficients + [ 1 + random.randrange(0, 100) ] )
+    
+    def test_half_gcd(self):
+        """Half-gcd degree bounds"""
+        for degree in [ 1, 2, 7, 20, 33 ]:
+            a = self._polynomial( degree )
+            b = self._polynomial( degree - 1 )
+            (m00, m01), (m10, m11) = half_gcd( a, b )
+            c, d = m00*a + m01*b, m10*a + m11*b
+            self.assert_( c.degree() >= (degree + 1) // 2 > d.degree() )
+    
+    def test_linear_combination(self):
+        """Half-gcd linear combination"""
+        for degree_a, degree_b, degree_g in [ (5, 9, 0), (30, 30, 4),
+                                              (40, 12, 7), (25, 24, 0) ]:
+            g = self._polynomial( degree_g )
+            a = self._polynomial( degree_a ) * g
+            b = self._polynomial( degree_b ) * g
+            x, y, d = eeuc( a, b )
+            self.assert_( x*a + y*b == d )
+            self.assert_( (a % d).degree() < 0 and (b % d).degree() < 0 )
+            self.assert_( d.degree() >= degree_g )
+    
+    def test_same_gcd(self):
+        """Half-gcd and remainder sequence agree"""
+        a, b = self._polynomial( 30 ), self._polynomial( 27 )
+        d = eeuc( a, b )[2]
+        set_half_gcd_threshold( 1000 )
+        self.assert_( eeuc( a, b )[2] == d )
+    
+    def test_integers(self):
+        """Integer fast path"""
+        for u, v in [ (17, 25), (-24, 27), (24, -27), (2**89 - 1, 2**61 - 1),
+                      (12, 4), (4, 12) ]:
+            x, y, d = eeuc( u, v )
+            self.assert_( x*u + y*v == d )
+            self.assert_( d > 0 and u % d == 0 and v % d == 0 )
+    
+    def test_threshold(self):
+        """Threshold validation"""
+        self.assertRaises( ValueError, set_half_gcd_threshold, 0 )
+
 
 class GcdTest(unittest.TestCase):
     """Test cases for the gcd function"""
@@ -201,6 +359,14 @@ class GcdTest(unittest.TestCase):
         R = Polynomials( FiniteField(7) )
         self.assert_( gcd( R(-1, 0, 1), R(0, 1) ).degree() == 0 )
         
+    def test_negative_integers(self):
+        """GCD of negative integers is positive"""
+        for u, v in [ (-4, 6), (4, -6), (-4, -6), (6, -4) ]:
+            for integer_type in [ int, Integers ]:
+                u, v = integer_type( u ), integer_type( v )
+                x, y, d = eeuc( u, v )
+                self.assert_( d == 2 and x*u + y*v == d )
+        
     def test_zero(self):
         """GCD of zero"""
         def f():
@@ -211,6 +377,500 @@ class GcdTest(unittest.TestCase):
         self.assertRaises( ZeroDivisionError, g )
 
 
+from fields.finite.naive import FiniteField
+from rings.polynomials.naive import Polynomials
+from rings.quotients.naive import QuotientRing
+from support.rings import batch_inverses
+
+class BatchInversesTest(unittest.TestCase):
+    """Test cases for the simultaneous inversion of ring elements"""
+    
+    R = Polynomials( FiniteField(7) )
+    S = QuotientRing( R, R(1, 1, 0, 1) )    # x^3 + x + 1 is irreducible
+    
+    def test_inverses(self):
+        """Simultaneous inverses"""
+        elements = [ self.S( self.R(c) ) for c in [ [1, 2], [0, 1], [5],
+                                                    [2, 0, 3], [1, 1, 1] ] ]
+        inverses = batch_inverses( elements )
+        self.assert_( len( inverses ) == len( elements ) )
+        for element, inverse in zip( elements, inverses ):
+            self.assert_( element * inverse == self.S.one() )
+    
+    def test_single(self):
+        """Inverse of a single element"""
+        element = self.S( self.R(4, 1) )
+        self.assert_( batch_inverses( [ element ] )
+                      == [ element.multiplicative_inverse() ] )
+    
+    def test_empty(self):
+        """Empty list"""
+        self.assert_( batch_inverses( [] ) == [] )
+    
+    def test_non_unit(self):
+        """List with a non-unit"""
+        elements = [ self.S( self.R(1, 2) ), self.S.zero() ]
+        self.assertRaises( ZeroDivisionError, batch_inverses, elements )
+
+
+from support.factorization import distinct_degree_factorization, \
+                                  equal_degree_factorization, factor, \
+                                  roots, find_root, smallest_factor, \
+                                  square_free_part
+
+class FactorizationTest(unittest.TestCase):
+    """Test cases for the factorization of polynomials over prime fields"""
+    
+    F = FiniteField(101)
+    R = Polynomials( F )
+    
+    # Irreducible over GF<101>: 101 = 1 mod 4, 2 is no square modulo 101,
+    # and x^3 + x + 1 has no zero.
+    linear = [ R(3, 1), R(-5, 1), R(17, 1) ]
+    quadratic = [ R(-2, 0, 1) ]
+    cubic = [ R(1, 1, 0, 1) ]
+    
+    def _product(self, factors):
+        result = self.R.one()
+        for f in factors:
+            result = result * f
+        return result
+    
+    def test_distinct_degree(self):
+        """Distinct-degree factorization"""
+        f = self._product( self.linear + self.quadratic + self.cubic )
+        self.assert_( distinct_degree_factorization( f ) == [
+                        ( 1, self._product( self.linear ) ),
+                        ( 2, self._product( self.quadratic ) ),
+                        ( 3, self._product( self.cubic ) ) ] )
+    
+    def test_equal_degree(self):
+        """Equal-degree factorization"""
+        f = self._product( self.linear )
+        factors = equal_degree_factorization( f, 1 )
+        self.assert_( sorted( factors, key=lambda g: g.coefficients()[0].remainder() )
+                      == sorted( self.linear,
+                                 key=lambda g: g.coefficients()[0].remainder() ) )
+    
+    def test_factor(self):
+        """Complete factorization with repeated factors"""
+        f = self._product( self.linear + self.linear + self.cubic ) * self.R(5)
+        factors = factor( f )
+        self.assert_( len( factors ) == 4 )
+        self.assert_( self._product( factors )
+                      == self._product( self.linear + self.cubic ) )
+    
+    def test_square_free_part(self):
+        """Square-free part"""
+        f = self._product( self.quadratic * 3 + self.linear )
+        self.assert_( square_free_part( f )
+                      == self._product( self.quadratic + self.linear ) )
+    
+    def test_roots(self):
+        """Roots of polynomials"""
+        f = self._product( self.linear + self.cubic )
+        self.assert_( sorted( [ r.remainder() for r in roots( f ) ] )
+                      == [ 5, 84, 98 ] )
+        self.assert_( roots( self._product( self.quadratic + self.cubic ) ) == [] )
+    
+    def test_find_root(self):
+        """Single roots of polynomials"""
+        f = self._product( self.linear + self.linear + self.quadratic )
+        self.assert_( not f( find_root( f ) ) )
+        g = self._product( self.cubic )
+        self.assertRaises( ValueError, find_root, g )
+    
+    def test_smallest_factor(self):
+        """Irreducible factors of least degree"""
+        f = self._product( self.quadratic + self.cubic )
+        self.assert_( smallest_factor( f ) == self.quadratic[0] )
+        f = self._product( self.linear + self.cubic )
+        self.assert_( smallest_factor( f ) in self.linear )
+
+
+
+#- Prime selection ------------------------------------------------------------
+
+from itertools import combinations
+from support.prime_selection import select_torsion_primes, \
+        torsion_prime_cost, set_cost_model
+
+class PrimeSelectionTest(unittest.TestCase):
+    """Cost-driven selection of torsion primes"""
+    
+    def _cost(self, primes, q):
+        return sum( torsion_prime_cost( l, q ) for l in primes )
+    
+    def test_product(self):
+        """Product covers the bound"""
+        for n in [ 2, 3, 4, 100, 10**6, 10**30 ]:
+            primes = select_torsion_primes( n, 10**9 )
+            self.assert_( self._product( primes ) >= n )
+            self.assert_( primes == sorted( primes ) )
+    
+    def test_trivial_bound(self):
+        """No primes for trivial bounds"""
+        self.assert_( select_torsion_primes( 1, 101 ) == [] )
+        self.assert_( select_torsion_primes( 0, 101 ) == [] )
+    
+    def test_shunned(self):
+        """Shunned primes are excluded"""
+        for n in [ 3, 50, 10**8 ]:
+            self.assert_( 7 not in select_torsion_primes( n, 7, 7 ) )
+        self.assert_( 3 not in select_torsion_primes( 2, 3, 3 ) )
+    
+    def test_optimality(self):
+        """Minimal cost compared to exhaustive search"""
+        candidates = primes_range( 3, 50 )
+        q = 2**61 - 1
+        for exponent in [ 1.5, 2.5, 4.0 ]:
+            previous = set_cost_model( exponent=exponent )
+            try:
+                for n in [ 10, 1000, 10**5, 10**6 ]:
+                    best = min( self._cost( subset, q )
+                                for k in range( 1, 8 )
+                                for subset in combinations( candidates, k )
+                                if self._product( subset ) >= n )
+                    selected = select_torsion_primes( n, q )
+                    self.assert_( abs( self._cost( selected, q ) - best ) < 1e-9 )
+            finally:
+                set_cost_model( **previous )
+    
+    def test_set_cost_model(self):
+        """Setting and restoring the cost model"""
+        previous = set_cost_model( coefficient=2.0 )
+        self.assert_( torsion_prime_cost( 3, 4 ) == 2.0 * 3**previous["exponent"] * 2 )
+        self.assert_( set_cost_model( **previous )["coefficient"] == 2.0 )
+        self.assertRaises( ValueError, set_cost_model, exponent=0 )
+        self.assertRaises( ValueError, set_cost_model, coefficient=-1 )
+    
+    def _product(self, primes):
+        product = 1
+        for l in primes:
+            product *= l
+        return product
+
+
+
+#- Checkpoints ----------------------------------------------------------------
+
+import os
+import tempfile
+from support.running import Checkpoint
+
+class CheckpointTest(unittest.TestCase):
+    """Append-only checkpoint files"""
+    
+    def setUp(self):
+        descriptor, self.filename = tempfile.mkstemp()
+        os.close( descriptor )
+    
+    def tearDown(self):
+        os.remove( self.filename )
+    
+    def test_records(self):
+        """Records survive reopening"""
+        checkpoint = Checkpoint( self.filename )
+        checkpoint.record( 3, 1 )
+        checkpoint.record( 5, 4 )
+        checkpoint.close()
+        checkpoint = Checkpoint( self.filename, resume=True )
+        self.assert_( checkpoint.records() == { 3: 1, 5: 4 } )
+        checkpoint.record( 7, 0 )
+        checkpoint.close()
+        self.assert_( Checkpoint( self.filename, resume=True ).records()
+                      == { 3: 1, 5: 4, 7: 0 } )
+    
+    def test_no_resume(self):
+        """Fresh checkpoints discard old records"""
+        checkpoint = Checkpoint( self.filename )
+        checkpoint.record( 3, 1 )
+        checkpoint.close()
+        self.assert_( Checkpoint( self.filename ).records() == {} )
+        self.assert_( Checkpoint( self.filename, resume=True ).records() == {} )
+    
+    def test_interrupted_write(self):
+        """Incomplete lines are discarded"""
+        with open( self.filename, "wt" ) as checkpoint_file:
+            checkpoint_file.write( "3 1\n5 4\n11" )
+        checkpoint = Checkpoint( self.filename, resume=True )
+        self.assert_( checkpoint.records() == { 3: 1, 5: 4 } )
+        checkpoint.record( 7, 2 )
+        checkpoint.close()
+        with open( self.filename, "rt" ) as checkpoint_file:
+            self.assert_( checkpoint_file.read() == "3 1\n5 4\n7 2\n" )
+
+
+#- Exponentiation -------------------------------------------------------------
+
+from fields.finite.naive import FiniteField
+from rings.polynomials.naive import Polynomials
+from support.powers import left_to_right_power, right_to_left_power, \
+                           k_ary_power, sliding_window_power
+
+class PowersTest(unittest.TestCase):
+    """Test cases for the exponentiation algorithms in support.powers"""
+    
+    algorithms = [ left_to_right_power, right_to_left_power,
+                   k_ary_power, sliding_window_power ]
+    
+    def test_integer_results(self):
+        """Sample results for integers"""
+        for algorithm in self.algorithms:
+            for n in [ 1, 2, 3, 15, 16, 17, 1000, 12345 ]:
+                self.assert_( algorithm( 3, n ) == 3**n )
+
+    def test_modulus(self):
+        """Reduction of intermediate results"""
+        for algorithm in self.algorithms:
+            for n in [ 1, 7, 2**64 + 1 ]:
+                self.assert_( algorithm( 5, n, 1009 ) == pow( 5, n, 1009 ) )
+
+    def test_polynomial_results(self):
+        """Sample results for polynomials"""
+        R = Polynomials( FiniteField(7) )
+        p = R(1, 2, 3)
+        for algorithm in self.algorithms:
+            self.assert_( algorithm( p, 5 ) == p*p*p*p*p )
+            self.assert_( algorithm( p, 9, R(1, 0, 0, 1) ) \
+                            == (p*p*p*p*p*p*p*p*p) % R(1, 0, 0, 1) )
+
+    def test_window_size(self):
+        """Explicit window sizes"""
+        for window_size in range( 1, 7 ):
+            self.assert_( k_ary_power( 3, 12345, None, window_size ) \
+                            == 3**12345 )
+            self.assert_( sliding_window_power( 3, 12345, None, window_size ) \
+                            == 3**12345 )
+
+    def test_non_positive_exponent(self):
+        """Non-positive exponents"""
+        for algorithm in self.algorithms:
+            self.assertRaises( ValueError, algorithm, 3, 0 )
+            self.assertRaises( ValueError, algorithm, 3, -1 )
+
+    def test_derived_strategy(self):
+        """Strategy of a derived class leaves the specialization unchanged"""
+        R = Polynomials( FiniteField(7) )
+        strategy = R._power_algorithm
+        class RightToLeftR(R):
+            _power_algorithm = staticmethod( right_to_left_power )
+        self.assert_( RightToLeftR(1, 2)**5 == R(1, 2)**5 )
+        self.assert_( Polynomials( FiniteField(7) )._power_algorithm \
+                        is strategy )
+
+
+#- Scalar multiplication ------------------------------------------------------
+
+from support.multiples import double_and_add_multiple, naf_multiple, \
+                              wnaf_multiple, naf_digits, PrecomputedMultiples
+
+class MultiplesTest(unittest.TestCase):
+    """Test cases for the scalar multiplication algorithms in support.multiples"""
+    
+    algorithms = [ double_and_add_multiple, naf_multiple, wnaf_multiple ]
+    
+    def test_results(self):
+        """Sample results for integers"""
+        for algorithm in self.algorithms:
+            for n in [ 1, 2, 3, 7, 15, 16, 17, 1000, 2**70 + 12345 ]:
+                self.assert_( algorithm( 3, n ) == 3 * n )
+
+    def test_widths(self):
+        """Explicit NAF widths"""
+        for width in range( 2, 8 ):
+            for n in [ 1, 5, 127, 2**100 - 1 ]:
+                self.assert_( wnaf_multiple( 3, n, width ) == 3 * n )
+
+    def test_naf_digits(self):
+        """Non-adjacent form properties"""
+        for width in range( 2, 6 ):
+            for n in range( 0, 300 ):
+                digits = naf_digits( n, width )
+                self.assert_( sum( [ d * 2**i for i, d in enumerate(digits) ] ) == n )
+                for i, d in enumerate( digits ):
+                    if d:
+                        self.assert_( d % 2 == 1 and abs(d) < 2**(width - 1) )
+                        self.failIf( any( digits[ i+1 : i+width ] ) )
+
+    def test_precomputed(self):
+        """Precomputed table of multiples"""
+        multiples = PrecomputedMultiples( 3 )
+        for n in [ 1000, 1, -17, 0, 2**80 + 3 ]:
+            self.assert_( multiples( n ) == 3 * n )
+
+    def test_non_positive_factor(self):
+        """Non-positive factors"""
+        for algorithm in self.algorithms:
+            self.assertRaises( ValueError, algorithm, 3, 0 )
+            self.assertRaises( ValueError, algorithm, 3, -1 )
+
+
+#- Template specialization ----------------------------------------------------
+
+from support.types import template, specialization_cache_info, \
+                          clear_specialization_cache
+
+class SpecializationCacheTest(unittest.TestCase):
+    """Test cases for the template specialization cache"""
+    
+    def setUp(self):
+        class C( metaclass=template("a", "b") ):
+            pass
+        self.C = C
+        clear_specialization_cache()
+    
+    def test_identity(self):
+        """Equal parameters yield identical classes"""
+        self.assert_( self.C(1, 2) is self.C(1, 2) )
+        self.assert_( self.C(1)(2) is self.C(1)(2) )
+        self.assert_( self.C(1, b=2) is self.C(b=2, a=1) )
+
+    def test_distinct(self):
+        """Different parameters yield different classes"""
+        self.failIf( self.C(1, 2) is self.C(2, 1) )
+        self.failIf( self.C(1, 2) is self.C(True, 2) )
+
+    def test_unhashable(self):
+        """Unhashable parameters are not cached"""
+        self.failIf( self.C([1], 2) is self.C([1], 2) )
+        self.assert_( self.C([1], 2).a == [1] )
+
+    def test_statistics(self):
+        """Hit and miss counts"""
+        # Keep references; the cache discards unused classes.
+        classes = [ self.C(1, 2), self.C(1, 2), self.C([1], 2) ]
+        info = specialization_cache_info()
+        self.assert_( (info.hits, info.misses, info.size) == (1, 2, 1) )
+        clear_specialization_cache()
+        self.assert_( tuple( specialization_cache_info() ) == (0, 0, 0) )
+
+
+#- Polynomial multiplication --------------------------------------------------
+
+import random
+from fields.finite.naive import FiniteField
+from rings.integers.naive import Integers
+from support.polynomials import product, schoolbook_product, \
+                                karatsuba_product, toom3_product, \
+                                kronecker_product, \
+                                set_multiplication_thresholds
+
+class PolynomialProductTest(unittest.TestCase):
+    """Test cases for the multiplication algorithms in support.polynomials"""
+    
+    def setUp(self):
+        # Small thresholds exercise the recursion on short lists.
+        self.thresholds = set_multiplication_thresholds(
+                                karatsuba=2, toom3=3, kronecker=1000
+                            )
+        
+    def tearDown(self):
+        set_multiplication_thresholds( **self.thresholds )
+    
+    def _check(self, algorithm, F, lengths):
+        zero = F.zero()
+        for m, n in lengths:
+            a = [ F( random.randrange(0, 1000) ) for i in range(m) ]
+            b = [ F( random.randrange(0, 1000) ) for i in range(n) ]
+            expected = schoolbook_product( a, b, zero )
+            result = algorithm( a, b, zero )
+            # Faster algorithms may leave zeros at the end.
+            self.assert_( result[ : len(expected) ] == expected )
+            self.failIf( any( result[ len(expected) : ] ) )
+    
+    lengths = [ (0, 5), (1, 7), (2, 2), (7, 8), (13, 13), (40, 9), (31, 29) ]
+    
+    def test_karatsuba(self):
+        """Karatsuba multiplication"""
+        self._check( karatsuba_product, FiniteField(101), self.lengths )
+        self._check( karatsuba_product, FiniteField(2), self.lengths )
+    
+    def test_toom3(self):
+        """Toom-3 multiplication"""
+        self._check( toom3_product, FiniteField(101), self.lengths )
+
+    def test_kronecker(self):
+        """Kronecker substitution"""
+        self._check( kronecker_product, FiniteField(101), self.lengths )
+        self._check( kronecker_product, FiniteField(2), self.lengths )
+        self._check( kronecker_product, FiniteField(2**89 - 1), self.lengths )
+
+    def test_kronecker_square(self):
+        """Kronecker substitution squaring"""
+        F = FiniteField(2**61 - 1)
+        a = [ F( random.randrange(0, 2**61) ) for i in range(17) ]
+        self.assert_( kronecker_product( a, a, F.zero() )
+                        == schoolbook_product( a, a, F.zero() ) )
+
+    def test_product(self):
+        """Automatic algorithm selection"""
+        self._check( product, FiniteField(101), self.lengths )
+        self._check( product, FiniteField(3), self.lengths )
+        self._check( product, Integers, self.lengths )
+        set_multiplication_thresholds( kronecker=2 )
+        self._check( product, FiniteField(101), self.lengths )
+        self._check( product, Integers, self.lengths )
+
+    def test_thresholds(self):
+        """Threshold validation"""
+        self.assertRaises( ValueError, set_multiplication_thresholds, 1 )
+
+
+from support.polynomials import reciprocal, PrecomputedDivisor, \
+                                linear_combinations
+
+class PrecomputedDivisorTest(unittest.TestCase):
+    """Test cases for the division with precomputed reciprocals"""
+    
+    F = FiniteField(101)
+    
+    def _coefficients(self, length):
+        return [ self.F( random.randrange(0, 101) ) for i in range(length) ]
+    
+    def test_reciprocal(self):
+        """Power series inverse"""
+        zero = self.F.zero()
+        series = [ self.F(3) ] + self._coefficients(9)
+        for precision in [ 1, 2, 5, 16 ]:
+            inverse = reciprocal( series, precision, zero )
+            self.assert_( len( inverse ) == precision )
+            check = schoolbook_product( series, inverse, zero )[ : precision ]
+            self.assert_( check == [ self.F(1) ] + [ zero ] * (precision - 1) )
+    
+    def test_reciprocal_continued(self):
+        """Power series inverse continued from lower precision"""
+        zero = self.F.zero()
+        series = [ self.F(7) ] + self._coefficients(20)
+        start = reciprocal( series, 3, zero )
+        self.assert_( reciprocal( series, 21, zero, start )
+                        == reciprocal( series, 21, zero ) )
+    
+    def test_linear_combinations(self):
+        """Linear combinations of coefficient lists"""
+        for F in [ self.F, FiniteField(2**61 - 1), Integers ]:
+            vectors = [ [ F(1), F(2), F(3) ], [ F(4) ], [ F(5), F(6) ] ]
+            rows = [ [ F(1), F(1), F(1) ], [ F(2), F(0), F(-1) ], [ F(3) ] ]
+            expected = [ [ F(10), F(8), F(3) ],
+                         [ F(-3), F(-2), F(6) ],
+                         [ F(3), F(6), F(9) ] ]
+            self.assert_( linear_combinations( rows, vectors, F(0) ) == expected )
+    
+    def test_divmod(self):
+        """Division with remainder"""
+        zero = self.F.zero()
+        for n, m in [ (1, 5), (2, 1), (5, 9), (9, 17), (9, 40) ]:
+            b = self._coefficients(n) + [ self.F(1 + n) ]
+            a = self._coefficients(m) + [ self.F(1) ]
+            quotient, remainder = PrecomputedDivisor( b, zero ).divmod( a )
+            self.assert_( len( remainder ) <= n )
+            total = schoolbook_product( quotient, b, zero )
+            total += [ zero ] * (len( a ) - len( total ))
+            for i, r in enumerate( remainder ):
+                total[i] += r
+            self.assert_( total == a )
+
+
 #===============================================================================
 # TestSuites generation
 #===============================================================================
@@ -219,9 +879,23 @@ all_suites = []
 for test_class in [
                PrimesRangeTest,
                InversePrimorialTest,
+               IsProbablePrimeTest,
                CongruenceEquationTest,
                InverseModuloTest,
+               SquareRootModuloTest,
+               CornacchiaTest,
+               RepresentativesInRangeTest,
                ExtendedEuclideanAlgorithmTest,
+               PowersTest,
+               MultiplesTest,
+               SpecializationCacheTest,
+               PolynomialProductTest,
+               PrecomputedDivisorTest,
+               HalfGcdTest,
+               BatchInversesTest,
+               FactorizationTest,
+               PrimeSelectionTest,
+               CheckpointTest,
            ]:
     all_suites.append( unittest.TestLoader().loadTestsFromTestCase( test_class ) ) 
 
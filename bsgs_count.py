@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Point counting on elliptic curves over prime fields with the baby-step
+giant-step method of Shanks and Mestre.
+
+The order of the curve lies in the Hasse interval
+@f$ [p + 1 - 2\sqrt{p}, p + 1 + 2\sqrt{p}] @f$ of width
+@f$ w = 4\sqrt{p} @f$.  For a random point @f$ P @f$, the baby steps
+@f$ jP @f$ and the giant steps @f$ (n_0 + im)P @f$ with
+@f$ m \approx \sqrt{w} @f$ find all multiples @f$ N @f$ of the order of
+@f$ P @f$ in the interval with @f$ O(p^{1/4}) @f$ group operations.  If
+there is only one, then it is the order of the curve.  Otherwise, the
+order of @f$ P @f$ is the distance of the multiples; it restricts the
+trace @f$ t @f$ to a congruence class.
+
+The quadratic twist @f$ E' @f$ has @f$ p + 1 + t @f$ points, so points on
+@f$ E' @f$ restrict @f$ t @f$ as well.  Mestre showed that for
+@f$ p > 229 @f$, the curve or its twist has a point whose order has a
+single multiple in the Hasse interval.  The function alternates random
+points on both curves and combines their congruences until a single trace
+remains.  Smaller fields are counted directly.
+
+The method needs only the group law on EllipticCurve points and a hash
+table of the baby steps, and beats Schoof's algorithm on small and medium
+fields; see point_count for the choice between the two.
+
+@see   Cohen, H., "A Course in Computational Algebraic Number Theory",
+       Springer 1993, algorithm 7.4.12
+@see   Schoof, R., "Counting Points on Elliptic Curves over Finite Fields",
+       Journal de Theorie des Nombres de Bordeaux 7 (1995), pp. 219--254,
+       section 3
+
+@package   schoof.bsgs
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+from itertools import cycle
+from math import isqrt
+
+from elliptic_curves.naive import EllipticCurve
+from reduced_computation_schoof import hasse_frobenius_trace_range, \
+                                       random_point
+from rings.integers.naive import Integers
+from rings.quotients.naive import QuotientRing
+from support.quotients import solve_congruence_equations, \
+                              representatives_in_range
+
+def frobenius_trace(curve):
+    """
+    Compute the trace of the Frobenius endomorphism for the given
+    EllipticCurve @p curve over a prime field.
+
+    The function combines the congruences of random points on the curve and
+    its quadratic twist (see order_congruence()) until the Hasse interval
+    contains a single trace.
+
+    @return    The trace @f$ t @f$ of the Frobenius endomorphism. The number of
+               points on the curve then is @f$ p + 1 - t @f$, where @f$ p @f$
+               is the size of the prime field over which the curve was
+               defined.
+    """
+    field = curve.field()
+    p = field.size()
+    if p <= small_field_limit:
+        return __counted_trace( curve )
+
+    search_range = hasse_frobenius_trace_range( field )
+
+    # The curve has p + 1 - t points, the twist p + 1 + t.  The moduli of
+    # the congruences usually have common divisors.
+    trace = QuotientRing( Integers, 1 )( 0 )
+    for E, sign in cycle( [ ( curve, 1 ), ( quadratic_twist( curve ), -1 ) ] ):
+        order_residue, order_modulus = order_congruence( random_point( E ) )
+        congruence = QuotientRing( Integers, order_modulus )(
+                            sign * ( p + 1 - order_residue )
+                        )
+        trace = solve_congruence_equations( [ trace, congruence ] )
+
+        candidates = representatives_in_range( trace, search_range )
+        if len( candidates ) == 1:
+            return candidates[0]
+
+
+def order_congruence(point):
+    """
+    Return the pair @f$ (N_0, n) @f$ such that the orders @f$ N @f$ in the
+    Hasse interval with @f$ NP = O @f$ for the @p point @f$ P @f$ are
+    exactly those with @f$ N \equiv N_0 \pmod{n} @f$.  If there is a single
+    one, then @f$ n @f$ exceeds the interval; otherwise, @f$ n @f$ is the
+    order of @f$ P @f$.
+
+    The function uses @f$ m \approx \sqrt{w} @f$ baby steps
+    @f$ jP @f$, which it stores in a dictionary, and about as many giant
+    steps @f$ (n_0 + im)P @f$, where @f$ n_0 @f$ is the lower end of the
+    interval.  A giant step whose negative is a baby step
+    yields the multiple @f$ n_0 + im + j @f$ of the order.
+    """
+    field = point.field()
+    p = field.size()
+    search_range = hasse_frobenius_trace_range( field )
+    lower, upper = p + 1 - search_range[-1], p + 1 - search_range[0]
+    m = isqrt( upper - lower ) + 1
+
+    baby_steps = { None: 0 }
+    baby_step = point
+    for j in range( 1, m ):
+        if baby_step.is_infinite():
+            # The point has order j < m.
+            return 0, j
+        baby_steps[ __point_key( baby_step ) ] = j
+        baby_step = baby_step + point
+
+    multiples = []
+    giant_step = lower * point
+    step = m * point
+    for n in range( lower, upper + 1, m ):
+        j = baby_steps.get( __negative_point_key( giant_step ) )
+        if j is not None and n + j <= upper:
+            multiples.append( n + j )
+        giant_step = giant_step + step
+
+    if len( multiples ) == 1:
+        return multiples[0], upper - lower + 1
+    return multiples[0], multiples[1] - multiples[0]
+
+
+def quadratic_twist(curve):
+    """
+    Return the quadratic twist @f$ y^2 = x^3 + d^2 A x + d^3 B @f$ of the
+    @p curve @f$ y^2 = x^3 + Ax + B @f$ for the least quadratic non-residue
+    @f$ d @f$ of the prime field.
+    """
+    field = curve.field()
+    p = field.size()
+    d = 2
+    while pow( d, (p - 1) // 2, p ) != p - 1:
+        d += 1
+    A, B = curve.parameters()
+    return EllipticCurve( field, d**2 * A, d**3 * B )
+
+
+## Curves over prime fields with at most this many elements are counted
+#  point by point; Mestre's theorem needs more than 229 elements.
+small_field_limit = 1000
+
+
+#- Auxiliary Functions --------------------------------------------------------
+
+def __counted_trace(curve):
+    """
+    Return the trace of the Frobenius endomorphism of @p curve from the
+    number of points, which the function counts with the Legendre symbols of
+    @f$ x^3 + Ax + B @f$.
+
+    This function is not intended for direct use.
+    """
+    field = curve.field()
+    p = field.size()
+    A, B = [ field( c ).remainder() for c in curve.parameters() ]
+    trace = 0
+    for x in range( p ):
+        value = ( x**3 + A*x + B ) % p
+        if value:
+            # The Legendre symbol 1 means two points, -1 none.
+            trace -= 1 if pow( value, (p - 1) // 2, p ) == 1 else -1
+    return trace
+
+
+def __point_key(point):
+    """
+    Return a hashable key of the finite @p point: its coordinate remainders.
+
+    This function is not intended for direct use.
+    """
+    return ( point.x().remainder(), point.y().remainder() )
+
+
+def __negative_point_key(point):
+    """
+    Return the key of the negative of @p point, or @c None for the point at
+    infinity.
+
+    This function is not intended for direct use.
+    """
+    if point.is_infinite():
+        return None
+    return ( point.x().remainder(), ( -point.y() ).remainder() )
+
+
+#------------------------------------------------------------------------------
+
+from fields.finite.compact import FiniteField
+
+import sys
+from support.running import AlgorithmRunner
+from support.trace_cache import OrderCache
+
+def bsgs_count_algorithm( p, A, B, output=sys.stdout ):
+    p, A, B = int(p), int(A), int(B)
+
+    message = "Counting points of y^2 = x^3 + {A}x + {B} over GF<{p}>: "
+    print( message.format( p=p, A=A, B=B ), end="", file=output )
+    output.flush()
+
+    curve = EllipticCurve( FiniteField(p), A, B )
+    trace = frobenius_trace( curve )
+    order = p + 1 - trace
+    print( order, file=output )
+    return order
+
+
+if __name__ == "__main__":
+    runner = AlgorithmRunner(
+                     bsgs_count_algorithm,
+                     algorithm_version="$Rev$",
+                     result_cache=OrderCache
+                 )
+    runner.run()
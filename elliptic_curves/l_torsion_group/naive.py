@@ -26,6 +26,7 @@ of an elliptic curve.
 from rings.quotients.naive import QuotientRing
 from fields.fraction.naive import FractionField
 from elliptic_curves.naive import EllipticCurve
+from elliptic_curves.projective import ProjectivePoint, JacobianPoint
 from elliptic_curves.polynomials.naive import CurvePolynomials
 from elliptic_curves.division_polynomials.naive import DivisionPolynomialsList
 
@@ -72,6 +73,15 @@ class LTorsionGroup( metaclass=template("_elliptic_curve") ):
            second edition, Springer, 2009, p. 373
     """
 
+    ## The template for the point that represents the group; use the
+    #  templates from elliptic_curves.projective in subclasses to avoid
+    #  divisions (and the field of fractions) altogether.
+    _point_template = EllipticCurve
+    
+    ## Whether the group accepts even torsions; subclasses whose torsion
+    #  polynomial depends on @f$ x @f$ alone may set it.
+    _allows_even_torsion = False
+    
     #- Instance Methods ------------------------------------------------------- 
     
     def __init__(self, torsion):
@@ -82,14 +92,23 @@ class LTorsionGroup( metaclass=template("_elliptic_curve") ):
                        the group represents all points of order @p torsion.  It
                        must be an odd integer greater than 1 and prime to the
                        field characteristic; the limitation comes from the
-                       implicit representation, see above. 
+                       implicit representation, see above.  Groups with
+                       @c _allows_even_torsion accept even integers
+                       greater than 2, too.
         """
         torsion = int( torsion )
-        if torsion < 3 or torsion % 2 == 0 or self.curve().field()(torsion) == 0:
+        if self._allows_even_torsion:
+            if torsion < 3:
+                raise ValueError( "only torsions greater than 2 are supported" )
+        elif torsion < 3 or torsion % 2 == 0:
             raise ValueError( "only odd torsions greater than 1 are supported" )
+        if self.curve().field()(torsion) == 0:
+            raise ValueError( "torsion must be prime to the characteristic" )
         
         self.__torsion = torsion
         self.__point = None
+        self.__frobenius_images = []
+        self.__frobenius_points = []
     
     
     def elements(self):
@@ -122,6 +141,55 @@ class LTorsionGroup( metaclass=template("_elliptic_curve") ):
         return self.__torsion
 
 
+    def frobenius_point(self, power=1):
+        """
+        Return the image of the point in elements() under the @p power-th
+        iterate of the Frobenius endomorphism @f$ \phi @f$.  For the point
+        @f$ P = (x, y) @f$ and field size @f$ q @f$, this is
+        @f$ \phi^k(P) = (x^{q^k}, y^{q^k}) @f$ for @f$ k = @f$ @p power.
+
+        The group computes the images once and keeps them.  It avoids powers
+        of coordinates (which are rational functions in the general case):
+        the fundamental relation @f$ y^2 = f(x) = x^3 + Ax + B @f$ yields
+        @f$ y^q = y \cdot f(x)^{(q-1)/2} @f$, so both coordinates of
+        @f$ \phi(P) @f$ are powers of univariate polynomials modulo
+        @f$ \psi_l @f$.  Further iterates need no more powers: if
+        @f$ x^q = h(x) @f$ and @f$ y^q = y \cdot g(x) @f$, then
+        @f$ x^{q^{k+1}} = h_k(h) @f$ and
+        @f$ y^{q^{k+1}} = y \cdot g \cdot g_k(h) @f$ for
+        @f$ x^{q^k} = h_k(x) @f$ and @f$ y^{q^k} = y \cdot g_k(x) @f$.  The
+        group computes the compositions modulo @f$ \psi_l @f$ with
+        rings.quotients.naive.QuotientRing.compose().
+
+        @param power   A positive integer; the Schoof algorithms require
+                       @f$ \phi(P) @f$ and @f$ \phi^2(P) @f$.
+
+        @exception ValueError  if @p power is not positive.
+        """
+        power = int( power )
+        if power < 1:
+            raise ValueError( "Frobenius powers must be positive" )
+
+        if not self.__point:
+            self.__init_point()
+        while len( self.__frobenius_points ) < power:
+            self.__extend_frobenius_points()
+        return self.__frobenius_points[ power-1 ]
+
+
+    def _torsion_polynomial(self):
+        """
+        Return the polynomial over the curve whose zeros are the finite
+        points of the group: the l-th division polynomial @f$ \psi_l @f$.
+        The representing point has its coordinates in the quotient ring
+        modulo this polynomial.
+
+        @note  For odd @f$ l @f$, the polynomial must not depend on
+               @f$ y @f$.
+        """
+        return self._division_polynomial_list()[ self.__torsion ]
+
+
     def __init_point(self):
         """
         Create the point that implicitly represents the whole l-torsion group
@@ -135,11 +203,15 @@ class LTorsionGroup( metaclass=template("_elliptic_curve") ):
         # R = F[x] / (y**2 - x**3 - A*x - B)
         R = self._division_polynomial_list().curve_polynomials()
         # The n-th division polynomial
-        psi = self._division_polynomial_list()[ self.__torsion ]
+        psi = self._torsion_polynomial()
 
         # T = ( F[x] / (y**2 - x**3 - A*x - B) ) / psi(l)
         S = QuotientRing( R, psi )
-        T = FractionField( S )
+        if issubclass( self._point_template, (ProjectivePoint, JacobianPoint) ):
+            # Division-free point representations need no fractions.
+            T = S
+        else:
+            T = FractionField( S )
         
         A, B = R.curve().parameters()
         
@@ -148,7 +220,39 @@ class LTorsionGroup( metaclass=template("_elliptic_curve") ):
         x = T( R( (0, 1), 0 ) )
         y = T( R( 0     , 1 ) )
         
-        self.__point = EllipticCurve( T, A, B )( x, y )
+        self.__coordinate_field = T
+        self.__point = self._point_template( T, A, B )( x, y )
+
+
+    def __extend_frobenius_points(self):
+        """
+        Compute the image of the representing point under the next iterate
+        of the Frobenius endomorphism and store it in the cache; see
+        frobenius_point().
+        """
+        R = self._division_polynomial_list().curve_polynomials()
+        psi = self._torsion_polynomial()
+        q = self.curve().field().size()
+        
+        if not self.__frobenius_images:
+            # Odd division polynomials are univariate: compute in
+            # F[x] / psi(l), which reduces with a precomputed reciprocal.
+            U = QuotientRing( R.polynomial_ring(), psi.x_factor() )
+            x_image = U( R.polynomial_ring()( 0, 1 ) ) ** q
+            y_image = U( R.y2_reduction() ) ** ((q - 1) // 2)
+        else:
+            # Raising polynomials over F to the q-th power is the same as
+            # substituting x^q for x.
+            x_first, y_first = self.__frobenius_images[0]
+            x_previous, y_previous = self.__frobenius_images[-1]
+            x_image = x_previous.compose( x_first )
+            y_image = y_first * y_previous.compose( x_first )
+        self.__frobenius_images.append( (x_image, y_image) )
+
+        T = self.__coordinate_field
+        x = T( R( x_image.remainder(), 0 ) )
+        y = T( R( 0, y_image.remainder() ) )
+        self.__frobenius_points.append( self.__point.__class__( x, y ) )
 
 
     #- Class Methods----------------------------------------------------------- 
@@ -175,3 +279,146 @@ class LTorsionGroup( metaclass=template("_elliptic_curve") ):
             cls.__division_polynomial_list = DivisionPolynomialsList( R )
 
             return cls.__division_polynomial_list
+
+
+class ProjectiveLTorsionGroup( LTorsionGroup ):
+    """
+    An l-torsion group of an elliptic curve for odd l whose representing point
+    uses projective coordinates.
+    
+    The group operations on the point require no divisions.  Therefore the
+    coordinates come from the quotient ring @f$ \mathbb{F}_{p}[x,y] / \psi_l @f$
+    rather than its field of fractions, which makes the operations cheaper.
+    
+    @see   LTorsionGroup and elliptic_curves.projective.ProjectivePoint
+    """
+    _point_template = ProjectivePoint
+
+
+class IsogenyKernel( LTorsionGroup ):
+    """
+    The kernel of an isogeny of odd prime degree l: a subgroup of order l of
+    the l-torsion group of an elliptic curve.
+
+    The kernel is given by its kernel polynomial @f$ h @f$, the polynomial of
+    degree @f$ (l-1)/2 @f$ whose zeros are the x-coordinates of the finite
+    points in the kernel; it divides the division polynomial
+    @f$ \psi_l @f$.  The implicit representation works as in
+    LTorsionGroup, except that the coordinates are taken modulo @f$ h @f$
+    instead of @f$ \psi_l @f$.  The degree drops from
+    @f$ (l^2 - 1)/2 @f$ to @f$ (l - 1)/2 @f$, so arithmetic with the
+    representing point is much cheaper.
+
+    If the kernel is invariant under the Frobenius endomorphism
+    @f$ \phi @f$ (which holds if @f$ h @f$ has coefficients in the curve's
+    field), then @f$ \phi @f$ acts on it as multiplication by an
+    eigenvalue @f$ \lambda @f$.  Schoof's algorithm with Elkies'
+    improvement finds @f$ \lambda @f$ and uses
+    @f$ t \equiv \lambda + q/\lambda \pmod{l} @f$; see @c sea_schoof.
+
+    Use it, for example, as follows:
+    @code
+    Kernels = IsogenyKernel( E )
+    kernel = Kernels( 5, h )    # h divides psi_5 and has degree 2
+    P = kernel.elements()[0]
+    @endcode
+
+    @see   LTorsionGroup
+    """
+
+    def __init__(self, torsion, kernel_polynomial):
+        """
+        Construct a new isogeny kernel of the given prime degree @p torsion.
+
+        @param kernel_polynomial   A polynomial in @f$ x @f$ alone of
+                                   degree @f$ (l-1)/2 @f$ that divides the
+                                   l-th division polynomial.  It must be an
+                                   element of @c polynomial_ring() of the
+                                   curve polynomials.  No checks will be
+                                   performed.
+        """
+        LTorsionGroup.__init__( self, torsion )
+        self.__kernel_polynomial = kernel_polynomial
+
+
+    def kernel_polynomial(self):
+        """
+        Return the kernel polynomial @f$ h @f$, whose zeros are the
+        x-coordinates of the finite points in the kernel.
+        """
+        return self.__kernel_polynomial
+
+
+    def _torsion_polynomial(self):
+        """
+        Return the kernel polynomial as polynomial over the curve.
+        """
+        R = self._division_polynomial_list().curve_polynomials()
+        return R( self.__kernel_polynomial )
+
+
+class ProjectiveIsogenyKernel( IsogenyKernel ):
+    """
+    An isogeny kernel whose representing point uses projective coordinates.
+
+    @see   IsogenyKernel and ProjectiveLTorsionGroup
+    """
+    _point_template = ProjectivePoint
+
+
+class TorsionFactor( LTorsionGroup ):
+    """
+    A set of points of order n whose x-coordinates are the zeros of a given
+    factor of the n-th division polynomial; n may be even.
+
+    The implicit representation works as in LTorsionGroup, except that the
+    coordinates are taken modulo the factor.  For even n, the division
+    polynomial is @f$ \psi_n = y \cdot f_n(x) @f$; factors of
+    @f$ f_n @f$ depend on @f$ x @f$ alone and avoid multivariate
+    arithmetic.  If the factor is irreducible, then all represented points
+    are conjugate under the Frobenius endomorphism; relations between
+    Frobenius images and multiples hold either for all of them or for none.
+    The computation of the trace modulo powers of two uses this; see
+    reduced_computation_schoof.frobenius_trace_mod_2k().
+
+    @see   LTorsionGroup and IsogenyKernel
+    """
+    _allows_even_torsion = True
+
+    def __init__(self, torsion, factor):
+        """
+        Construct the set of points of order @p torsion whose x-coordinates
+        are the zeros of the polynomial @p factor.
+
+        @param factor  A polynomial in @f$ x @f$ alone that divides
+                       @f$ f_n @f$ (or @f$ \psi_n @f$ for odd @f$ n @f$);
+                       it must be an element of @c polynomial_ring() of the
+                       curve polynomials.  No checks will be performed.
+        """
+        LTorsionGroup.__init__( self, torsion )
+        self.__factor = factor
+
+
+    def factor(self):
+        """
+        Return the factor of the division polynomial whose zeros are the
+        x-coordinates of the represented points.
+        """
+        return self.__factor
+
+
+    def _torsion_polynomial(self):
+        """
+        Return the factor as polynomial over the curve.
+        """
+        R = self._division_polynomial_list().curve_polynomials()
+        return R( self.__factor )
+
+
+class ProjectiveTorsionFactor( TorsionFactor ):
+    """
+    A torsion factor whose representing point uses projective coordinates.
+
+    @see   TorsionFactor and ProjectiveLTorsionGroup
+    """
+    _point_template = ProjectivePoint
@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+The classical modular polynomials @f$ \Phi_l(X, Y) @f$ for small primes
+@f$ l @f$.
+
+The classical modular polynomial @f$ \Phi_l @f$ is the symmetric polynomial
+with integer coefficients whose zeros over the complex numbers are the
+pairs @f$ (j(\tau), j(l\tau)) @f$ of values of the modular
+@f$ j @f$-function.  Over a finite field of characteristic
+@f$ p \neq l @f$, the zeros of @f$ \Phi_l(X, j(E)) @f$ are the
+@f$ j @f$-invariants of the curves that are l-isogenous to @f$ E @f$.
+Schoof's algorithm with the improvements of Elkies and Atkin (see
+@c sea_schoof) uses them to find the factors of the division polynomials.
+
+The repository ships the polynomials for the small primes in the file
+@c classical.txt.gz next to this module; tools/modular_polynomials.py
+writes that file.  The module computes the polynomials for other primes
+from the q-expansion of @f$ j @f$ on demand.
+
+@see   Blake, I., Seroussi, G., and Smart, N., "Elliptic Curves in
+       Cryptography", Cambridge University Press, 1999, chapter VII.2
+
+@package   elliptic_curves.modular_polynomials.classical
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+import gzip
+import os
+
+## The name of the bundled data file; see read_modular_polynomials() for
+#  the format.
+data_filename = os.path.join( os.path.dirname( __file__ ), "classical.txt.gz" )
+
+
+def modular_polynomial(l):
+    """
+    Return the coefficients of the classical modular polynomial
+    @f$ \Phi_l(X, Y) = \sum_{i,k} a_{ik} X^i Y^k @f$ for the prime @p l.
+
+    The result is a list of @f$ l+2 @f$ integer lists: entry @f$ i @f$
+    contains the coefficients @f$ a_{i0}, \ldots, a_{i,l+1} @f$ of the
+    polynomial in @f$ Y @f$ that is the coefficient of @f$ X^i @f$.  The
+    polynomial is symmetric, that is, @f$ a_{ik} = a_{ki} @f$.  Use it, for
+    example, to compute @f$ \Phi_l(X, j) @f$ over a field:
+    @code
+    phi = modular_polynomial( 5 )
+    coefficients = [ sum( c * j**k for k, c in enumerate( row ) )
+                     for row in phi ]
+    @endcode
+
+    The function reads the polynomials from the bundled data file on the
+    first call and computes the others with compute_modular_polynomial();
+    it keeps all polynomials that it returned once.
+
+    @exception ValueError  if @p l is no prime.
+    """
+    global __bundled_read
+    l = int( l )
+    if l < 2 or any( l % d == 0 for d in range( 2, int( l**0.5 ) + 1 ) ):
+        raise ValueError( "modular polynomials require prime levels" )
+
+    if l not in __cache and not __bundled_read:
+        __bundled_read = True
+        if os.path.exists( data_filename ):
+            __cache.update( read_modular_polynomials( data_filename ) )
+    if l not in __cache:
+        __cache[ l ] = compute_modular_polynomial( l )
+    return __cache[ l ]
+
+__cache = {}
+__bundled_read = False
+
+
+def read_modular_polynomials(filename):
+    """
+    Return a dictionary that maps primes @f$ l @f$ to the coefficients of
+    @f$ \Phi_l @f$ (in the format of modular_polynomial()) from the file
+    with the given @p filename.
+
+    Every line of the file holds the prime @f$ l @f$, the exponents
+    @f$ i \geq k @f$, and the coefficient @f$ a_{ik} @f$, separated by
+    spaces.  Omitted coefficients are zero; lines starting with @c # are
+    comments.  Files whose name ends in @c .gz are gzip-compressed.
+    """
+    polynomials = {}
+    opener = gzip.open if filename.endswith( ".gz" ) else open
+    with opener( filename, "rt" ) as data:
+        for line in data:
+            if not line.strip() or line.startswith( "#" ):
+                continue
+            l, i, k, coefficient = [ int( word ) for word in line.split() ]
+            if l not in polynomials:
+                polynomials[ l ] = [ [ 0 ] * (l+2) for n in range( l+2 ) ]
+            polynomials[ l ][ i ][ k ] = coefficient
+            polynomials[ l ][ k ][ i ] = coefficient
+    return polynomials
+
+
+def write_modular_polynomials(polynomials, output):
+    """
+    Write the modular @p polynomials, a dictionary that maps primes to
+    coefficients in the format of modular_polynomial(), to the file object
+    @p output; the format is the one that read_modular_polynomials()
+    expects.
+    """
+    for l in sorted( polynomials ):
+        for i, row in enumerate( polynomials[ l ] ):
+            for k, coefficient in enumerate( row[ : i+1 ] ):
+                if coefficient:
+                    print( l, i, k, coefficient, file=output )
+
+
+def compute_modular_polynomial(l):
+    """
+    Compute the coefficients of the classical modular polynomial
+    @f$ \Phi_l @f$ for the prime @p l from the q-expansion of the modular
+    @f$ j @f$-function; see modular_polynomial() for the result format.
+
+    With @f$ t^l = q @f$, the zeros of @f$ \Phi_l(X, j(q)) @f$ are
+    @f$ j(q^l) @f$ and the @f$ l @f$ values @f$ j(\zeta^s t) @f$ for the
+    l-th roots of unity @f$ \zeta^s @f$.  The power sums of the latter are
+    @f$ l @f$ times the sums of the terms of @f$ j(t)^m @f$ whose
+    exponents are multiples of @f$ l @f$; Newton's identities turn them
+    into the coefficients of the polynomial in @f$ X @f$.  Each
+    coefficient is a Laurent series in @f$ q @f$ with a pole of order at
+    most @f$ l+1 @f$; subtracting multiples of powers of @f$ j(q) @f$
+    writes it as polynomial in @f$ j @f$.  The computation uses exact
+    integer arithmetic.
+
+    @note  The effort grows like @f$ l^2 @f$ multiplications of power series
+           with @f$ l^2 @f$ terms, and the coefficients have
+           @f$ O(l \log l) @f$ digits.  Primes beyond 100 take long.
+    """
+    # Terms of j(t) with exponents up to l*(l+1); with a pole at t^-1,
+    # j(t)^m needs (l+1)*(l+1) terms.
+    precision = (l+1)**2
+    j = __j_series( precision )
+    powers = [ [ 1 ] + [ 0 ] * (precision - 1) ]
+    for m in range( 1, l+2 ):
+        powers.append( __truncated_product( powers[-1], j, precision ) )
+
+    # powers[m][n] is the coefficient of t^(n-m) in j(t)^m.  The power sums
+    # of the l conjugates are series in q with exponents -1, 0, ..., l+1;
+    # entry e of a q-series holds the coefficient of q^(e-1).
+    length = l + 3
+    power_sums = [ None ]
+    for m in range( 1, l+1 ):
+        power_sums.append( [ l * powers[m][ (e-1)*l + m ]
+                             if 0 <= (e-1)*l + m < precision else 0
+                             for e in range( length ) ] )
+
+    # Newton's identities: k e_k = sum_{i=1}^{k} (-1)^(i-1) e_{k-i} p_i.
+    elementary = [ [ 0, 1 ] + [ 0 ] * (length - 2) ]
+    for k in range( 1, l+1 ):
+        total = [ 0 ] * length
+        for i in range( 1, k+1 ):
+            summand = __shifted_product( elementary[ k-i ], power_sums[i] )
+            sign = 1 if i % 2 else -1
+            total = [ t + sign * s for t, s in zip( total, summand ) ]
+        elementary.append( [ t // k for t in total ] )
+
+    # X-coefficients of prod (X - j(zeta^s t)) (X - j(q^l)) as q-series with
+    # exponents -(l+1), ..., 0; entry e holds the coefficient of q^(e-l-1).
+    j_of_q_l = {}
+    for n in range( -1, 2 ):
+        j_of_q_l[ n*l ] = powers[1][ n+1 ]
+    coefficients = []
+    for i in range( l+2 ):
+        series = [ 0 ] * (l+2)
+        for e in range( l+2 ):
+            exponent = e - l - 1
+            value = 0
+            # X^i from X * (X^(i-1)-coefficient) of the first product ...
+            if 1 <= i:
+                value += __conjugates_coefficient( elementary, l, i-1, exponent )
+            # ... and from -j(q^l) * (X^i-coefficient).
+            if i <= l:
+                for shift, c in j_of_q_l.items():
+                    value -= c * __conjugates_coefficient(
+                                        elementary, l, i, exponent - shift
+                                    )
+            series[ e ] = value
+        coefficients.append( series )
+
+    # Write each coefficient as polynomial in j: the series j^d starts with
+    # q^-d, so subtracting from the highest pole downwards is triangular.
+    phi = []
+    for series in coefficients:
+        row = [ 0 ] * (l+2)
+        for d in range( l+1, -1, -1 ):
+            c = series[ l+1-d ]
+            if c:
+                row[ d ] = c
+                for e in range( l+1-d, l+2 ):
+                    series[ e ] -= c * powers[d][ e - (l+1-d) ]
+        assert not any( series ), "q-expansion precision exhausted"
+        phi.append( row )
+
+    return phi
+
+
+#- Auxiliary Functions --------------------------------------------------------
+
+def __j_series(precision):
+    """
+    Return the first @p precision coefficients of the q-expansion
+    @f$ j(q) = q^{-1} + 744 + 196884q + \ldots @f$ of the modular
+    @f$ j @f$-function; entry @f$ n @f$ is the coefficient of
+    @f$ q^{n-1} @f$.
+
+    The function uses @f$ j = E_4^3 / \Delta @f$ with the Eisenstein
+    series @f$ E_4 = 1 + 240 \sum_n \sigma_3(n) q^n @f$ and
+    @f$ \Delta = q \prod_n (1 - q^n)^{24} @f$; the inverse of the product
+    is the 24th power of the generating function of the partition numbers,
+    so that all series have non-negative coefficients.
+
+    This function is not intended for direct use.
+    """
+    e4 = [ 1 ] + [ 240 * sum( d**3 for d in range( 1, n+1 ) if n % d == 0 )
+                   for n in range( 1, precision ) ]
+
+    # Partition numbers with Euler's pentagonal number recurrence.
+    partitions = [ 1 ] + [ 0 ] * (precision - 1)
+    for n in range( 1, precision ):
+        k, total = 1, 0
+        while True:
+            first = k * (3*k - 1) // 2
+            if first > n:
+                break
+            sign = 1 if k % 2 else -1
+            total += sign * partitions[ n - first ]
+            second = k * (3*k + 1) // 2
+            if second <= n:
+                total += sign * partitions[ n - second ]
+            k += 1
+        partitions[ n ] = total
+
+    inverse_delta = [ 1 ] + [ 0 ] * (precision - 1)
+    power = partitions
+    remaining = 24
+    while remaining:
+        if remaining & 1:
+            inverse_delta = __truncated_product( inverse_delta, power, precision )
+        remaining >>= 1
+        if remaining:
+            power = __truncated_product( power, power, precision )
+
+    e4_cubed = __truncated_product(
+                        __truncated_product( e4, e4, precision ), e4, precision
+                    )
+    return __truncated_product( e4_cubed, inverse_delta, precision )
+
+
+def __truncated_product(a, b, precision):
+    """
+    Return the first @p precision coefficients of the product of the power
+    series @p a and @p b with non-negative integer coefficients.
+
+    The function packs the coefficients into big integers (Kronecker
+    substitution) with slots wide enough to avoid carries.
+
+    This function is not intended for direct use.
+    """
+    a, b = a[ : precision ], b[ : precision ]
+    bound = min( len(a), len(b) ) * max( a ) * max( b )
+    slot_bytes = (bound.bit_length() + 8) // 8
+    packed_a = __pack( a, slot_bytes )
+    packed_b = packed_a if a is b else __pack( b, slot_bytes )
+    length = len(a) + len(b) - 1
+    data = (packed_a * packed_b).to_bytes( length * slot_bytes, "little" )
+    return [ int.from_bytes( data[ i : i+slot_bytes ], "little" )
+             for i in range( 0, min( length, precision ) * slot_bytes,
+                             slot_bytes ) ] \
+           + [ 0 ] * (precision - length)
+
+
+def __pack(coefficients, slot_bytes):
+    """
+    Return the integer @f$ \sum_n c_n 2^{8 n \cdot s} @f$ for the
+    non-negative @p coefficients @f$ c_n @f$ and @f$ s = @f$ @p slot_bytes.
+
+    This function is not intended for direct use.
+    """
+    return int.from_bytes( b"".join( c.to_bytes( slot_bytes, "little" )
+                                     for c in coefficients ), "little" )
+
+
+def __shifted_product(a, b):
+    """
+    Return the product of the q-series @p a and @p b, whose entry @f$ e @f$
+    is the coefficient of @f$ q^{e-1} @f$, in the same format and with the
+    same length.
+
+    This function is not intended for direct use.
+    """
+    length = len( a )
+    result = [ 0 ] * length
+    for m, x in enumerate( a ):
+        if not x:
+            continue
+        for n, y in enumerate( b[ : length + 1 - m ] ):
+            if 0 <= m + n - 1 < length:
+                result[ m + n - 1 ] += x * y
+    return result
+
+
+def __conjugates_coefficient(elementary, l, i, exponent):
+    """
+    Return the coefficient of @f$ X^i q^e @f$ (with @f$ e = @f$
+    @p exponent) in @f$ \prod_s (X - j(\zeta^s t)) =
+    \sum_k (-1)^k e_k X^{l-k} @f$ for the @p elementary symmetric
+    functions @f$ e_k @f$.
+
+    This function is not intended for direct use.
+    """
+    k = l - i
+    if not 0 <= k <= l or not -1 <= exponent <= l+1:
+        return 0
+    c = elementary[ k ][ exponent + 1 ]
+    return c if k % 2 == 0 else -c
@@ -25,6 +25,7 @@ using Cartesian coordinates as representation.
 
 from support.types import template
 from support.profiling import profiling_name, local_method_names
+from support.multiples import wnaf_multiple
 
 @local_method_names
 @profiling_name( "E<{_field}>" )
@@ -80,9 +81,9 @@ class EllipticCurve( metaclass=template("_field", "_A", "_B") ):
                    as an element of field(), which might result in a ValueError
                    or TypeError.
         
-        @exception AssertionError  if the fundamental relation does not hold.
-        @exception ValueError      if an argument cannot be cast as element
-                                   of field(). 
+        @exception ValueError      if the fundamental relation does not hold,
+                                   or if an argument cannot be cast as
+                                   element of field(). 
         @exception TypeError       same as @c ValueError. 
         """
         self.__x = self._field( x )
@@ -90,8 +91,9 @@ class EllipticCurve( metaclass=template("_field", "_A", "_B") ):
 
         A, B = self.parameters()
         x, y = self.__x, self.__y
-        assert y ** 2 == x ** 3  +  A * x  +  B, \
-            "point ({x}, {y}) is not on the curve".format(x=x, y=y)
+        if y ** 2 != x ** 3  +  A * x  +  B:
+            raise ValueError( "point ({x}, {y}) is not on the curve"
+                              .format(x=x, y=y) )
     
     
     def x(self):
@@ -116,6 +118,26 @@ class EllipticCurve( metaclass=template("_field", "_A", "_B") ):
         return self.__y
     
     
+    def coordinates(self):
+        """
+        Return the tuple of (Cartesian) coordinates @f$ (x, y) @f$.
+        
+        @note  Passing the tuple to the class constructor creates an equal
+               point; the same holds for the point representations in
+               elliptic_curves.projective.
+        """
+        return (self.__x, self.__y)
+    
+    
+    def to_affine(self):
+        """
+        Return the point with Cartesian coordinates, which is @p self.
+        
+        @see   elliptic_curves.projective.ProjectivePoint.to_affine()
+        """
+        return self
+    
+    
     def is_infinite(self):
         """
         Test whether the point is infinite or not: always return @c False for
@@ -263,9 +285,15 @@ class EllipticCurve( metaclass=template("_field", "_A", "_B") ):
         the infix operator @c * calls this method.
         
         This method is used when self was the left factor.
+        
+        @note  The multiplication strategy is the static method
+               _multiplication_algorithm(); it defaults to
+               support.multiples.wnaf_multiple(), which requires
+               @f$ O(\log n) @f$ group operations.
 
         @param n   A number object that can be interpreted as an integer.  It
                    determines how often the point will be added to itself.
+                   Negative numbers yield multiples of the additive inverse.
         
         @exception ValueError  if @p n cannot be cast to @c int().
         @exception TypeError   same as @c ValueError.  
@@ -273,12 +301,12 @@ class EllipticCurve( metaclass=template("_field", "_A", "_B") ):
         n = int(n)
         if n == 0:
             return PointAtInfinity()
+        if n < 0:
+            return self._multiplication_algorithm( -self, -n )
         
-        point = self
-        for i in range(1, n):
-            point += self
-        
-        return point
+        return self._multiplication_algorithm( self, n )
+    
+    _multiplication_algorithm = staticmethod( wnaf_multiple )
     
     def __rmul__(self, other):
         """
@@ -350,6 +378,13 @@ class PointAtInfinity:
         return True
     
     
+    def to_affine(self):
+        """
+        Return the point at infinity, which is @p self.
+        """
+        return self
+    
+    
     def __bool__(self):
         """
         Test whether the point is infinite or not: always return @c False, for
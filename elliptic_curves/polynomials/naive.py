@@ -202,6 +202,14 @@ class CurvePolynomials( CommutativeRing, metaclass=template("_elliptic_curve") )
                 and self.__y_factor == other.y_factor() 
 
 
+    def __hash__(self):
+        """
+        Return a hash value of the polynomial; equal polynomials have equal
+        hashes because their canonical forms are equal.
+        """
+        return hash( (self.__x_factor, self.__y_factor) )
+    
+    
     def __add__(self, other):
         """
         Return the sum of @p self and @p other. The infix operator @c + calls
@@ -299,6 +307,65 @@ class CurvePolynomials( CommutativeRing, metaclass=template("_elliptic_curve") )
         return quotient, remainder
 
 
+    def conjugate(self):
+        """
+        Return the conjugate @f$ a(x) - y\cdot b(x) @f$ of @p self, whose
+        canonical form is @f$ a(x) + y\cdot b(x) @f$.
+        
+        The product of a polynomial and its conjugate is the norm(), a
+        polynomial in @f$ x @f$ alone.
+        """
+        return self.__class__( self.__x_factor, -self.__y_factor )
+    
+    
+    def norm(self):
+        """
+        Return the norm @f$ a^2 - (x^3 + Ax + B)\cdot b^2 @f$ of @p self,
+        whose canonical form is @f$ a(x) + y\cdot b(x) @f$; this is the
+        product of @p self and its conjugate().
+        
+        @note  The returned polynomial is univariate.  Thus @p self is a unit
+               modulo a univariate polynomial @f$ m @f$ if, and only if, its
+               norm is a unit modulo @f$ m @f$; then
+               @f$ s^{-1} = \bar{s} \cdot N(s)^{-1} @f$.
+        """
+        return self.__x_factor * self.__x_factor \
+                - self.y2_reduction() * self.__y_factor * self.__y_factor
+    
+    
+    def remainder_function(self):
+        """
+        Return a function that maps polynomials to their remainders modulo
+        @p self; that is, the returned function @c f satisfies
+        @code
+        f( p ) == p % self
+        @endcode
+        for all polynomials @c p.
+        
+        If @p self is a polynomial in @f$ x @f$ alone, such as the division
+        polynomials of odd index, then the function reduces both factors of
+        the canonical form with
+        rings.polynomials.naive.Polynomials.remainder_function(); the
+        reciprocal of @p self is computed only once.
+        
+        @see   rings.quotients.naive.QuotientRing, which uses this method.
+        """
+        polynomials = self.__class__
+        if self.__y_factor:
+            return lambda dividend: polynomials( dividend ) % self
+        
+        reduce = self.__x_factor.remainder_function()
+        
+        def remainder(dividend):
+            dividend = polynomials( dividend )
+            return polynomials(
+                        reduce( dividend.__x_factor ),
+                        reduce( dividend.__y_factor )
+                    )
+        
+        return remainder
+
+
     #- Class Methods----------------------------------------------------------- 
     
     @classmethod
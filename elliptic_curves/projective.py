@@ -0,0 +1,524 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Implementations of elliptic curves with points using projective and Jacobian
+coordinates as representation.
+
+The group operations on these points require no divisions.  Therefore the
+coordinates need only come from a ring, as for example in
+elliptic_curves.l_torsion_group.naive.LTorsionGroup, where divisions in the
+coordinate field are expensive.
+
+@see   Cohen, H., Miyaji, A., and Ono, T., "Efficient Elliptic Curve
+       Exponentiation Using Mixed Coordinates", ASIACRYPT 1998; and
+       Bernstein, D. J. and Lange, T., "Explicit-Formulas Database",
+       http://www.hyperelliptic.org/EFD/
+
+@package   elliptic_curves.projective
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+from elliptic_curves.naive import EllipticCurve, PointAtInfinity
+
+from support.profiling import profiling_name, local_method_names
+
+@local_method_names
+@profiling_name( "P<{_field}>" )
+class ProjectivePoint( EllipticCurve ):
+    """
+    An elliptic curve with points in (homogeneous) projective coordinates;
+    the points support additive infix notation for group operations, as well
+    as multiplication by integers.
+
+    This is a template class that must be instantiated with the field and the
+    parameters @c A and @c B.  Use it, for example, as follows:
+    @code
+    # Instantiate the template as y^2 = x^3 + 3x + 4 over GF(7)
+    E = ProjectivePoint( FiniteField(7), 3, 4 )
+
+    P = E(1, 1)        # The affine point (1, 1)
+    Q = E(4, 3, 4)     # The projective point (4 : 3 : 4), which is (1, 6)
+
+    P + Q == E(0, 1, 0)        # The point at infinity
+    (P + P).to_affine()        # An affine point with Cartesian coordinates
+    @endcode
+
+    A projective point @f$ (X : Y : Z) @f$ with @f$ Z \neq 0 @f$ represents
+    the affine point @f$ (X/Z, Y/Z) @f$.  All points with @f$ Z = 0 @f$ are
+    the point at infinity.  The fundamental relation becomes
+    @f$ Y^2 Z = X^3 + AXZ^2 + BZ^3 @f$.
+
+    @note  Comparisons cross-multiply the coordinates; use to_affine() to get
+           Cartesian coordinates with a single division.
+    @note  is_infinite(), comparisons, and the case distinctions of the
+           addition test the coordinates as a whole.  Over a ring with zero
+           divisors, such as the quotient rings of the l-torsion groups,
+           every @f$ Z @f$ must therefore be zero or a unit: a non-zero
+           @f$ Z @f$ that is no unit vanishes for only some of the
+           represented points.  Callers must split the modulus in this case;
+           see reduced_computation_schoof.frobenius_trace_mod_l().
+
+    @see   elliptic_curves.naive.EllipticCurve
+    """
+
+    #- Instance Methods -----------------------------------------------------------
+
+    def __init__(self, x, y, z=1):
+        """
+        Construct a new point @f$ (x : y : z) @f$ on the elliptic curve.
+
+        The coordinates must be connected by the fundamental relation
+        @f$ y^2 z = x^3 + Axz^2 + Bz^3 @f$.  For @f$ z = 0 @f$, the point is
+        the point at infinity.
+
+        @param x   The first coordinate of the point.  It will be interpreted
+                   as an element of field(), which might result in a ValueError
+                   or TypeError.
+        @param y   The second coordinate of the point.
+        @param z   The third coordinate of the point; the default 1 makes
+                   @f$ (x, y) @f$ the Cartesian coordinates of the point.
+
+        @exception ValueError      if the fundamental relation does not hold,
+                                   or if an argument cannot be cast as
+                                   element of field().
+        @exception TypeError       same as @c ValueError.
+        """
+        self.__x = self._field( x )
+        self.__y = self._field( y )
+        self.__z = self._field( z )
+
+        A, B = self.parameters()
+        x, y, z = self.__x, self.__y, self.__z
+        if z and y**2 * z != x**3  +  A * x * z**2  +  B * z**3:
+            raise ValueError( "point ({x} : {y} : {z}) is not on the curve"
+                              .format(x=x, y=y, z=z) )
+
+
+    def x(self):
+        """
+        Return the first Cartesian coordinate @f$ X/Z @f$ of the point.
+
+        @note  This requires a division; use coordinates() to obtain the
+               projective coordinates.
+        """
+        return self.__x / self.__z
+
+
+    def y(self):
+        """
+        Return the second Cartesian coordinate @f$ Y/Z @f$ of the point.
+
+        @note  This requires a division; use coordinates() to obtain the
+               projective coordinates.
+        """
+        return self.__y / self.__z
+
+
+    def coordinates(self):
+        """
+        Return the tuple of projective coordinates @f$ (X, Y, Z) @f$.
+
+        @note  Passing the tuple to the class constructor creates an equal
+               point.
+        """
+        return (self.__x, self.__y, self.__z)
+
+
+    def to_affine(self):
+        """
+        Return the point as elliptic_curves.naive.EllipticCurve point with
+        Cartesian coordinates; return a PointAtInfinity if @p self is
+        infinite.
+
+        The conversion requires a single inversion in field().
+        """
+        if self.is_infinite():
+            return PointAtInfinity()
+
+        z_inverse = self.__z.multiplicative_inverse()
+        E = EllipticCurve( self._field, self._A, self._B )
+        return E( self.__x * z_inverse, self.__y * z_inverse )
+
+
+    def is_infinite(self):
+        """
+        Test whether the point is infinite, that is, whether the third
+        coordinate is zero.
+        """
+        return not self.__z
+
+
+    def __bool__(self):
+        """
+        Test whether the point is finite, that is, whether the third
+        coordinate is non-zero.
+        """
+        return bool( self.__z )
+
+
+    def __eq__(self, other):
+        """
+        Test whether another point @p other is equal to @p self; return
+        @c True if that is the case.  The infix operator @c == calls
+        this method.
+
+        Two finite points @f$ (X_1 : Y_1 : Z_1), (X_2 : Y_2 : Z_2) @f$ are
+        equal if, and only if, @f$ X_1 Z_2 = X_2 Z_1 @f$ and
+        @f$ Y_1 Z_2 = Y_2 Z_1 @f$.  Points in other representations are
+        compared by their Cartesian coordinates.
+        """
+        if self.is_infinite() or other.is_infinite():
+            return self.is_infinite() and other.is_infinite()
+
+        if isinstance( other, self.__class__ ):
+            x, y, z = other.coordinates()
+        else:
+            other = other.to_affine()
+            x, y, z = other.x(), other.y(), 1
+
+        return self.__x * z == x * self.__z  and  self.__y * z == y * self.__z
+
+
+    def __add__(self, other):
+        """
+        Return the sum of @p self and @p other.  The infix operator @c + calls
+        this method.
+
+        @note  The formulas require no divisions.  If @p other uses another
+               representation, then it will be converted first.
+
+        @see   elliptic_curves.naive.EllipticCurve.__add__()
+        """
+        if other.is_infinite():
+            return self
+        if self.is_infinite():
+            return other
+        if not isinstance( other, self.__class__ ):
+            other = self.from_affine( other.to_affine() )
+
+        return self.__generic_add__( other )
+
+
+    def __generic_add__(self, other):
+        """
+        Addition of finite points @p self and @p other.
+
+        The method falls back to __double__() if the points are equal.
+
+        @note  This method should not be called directly.  Instead use the
+               infix operator @c +, which calls __add__().
+
+        @see   add-1998-cmo-2 in the Explicit-Formulas Database
+        """
+        x1, y1, z1 = self.__x, self.__y, self.__z
+        x2, y2, z2 = other.coordinates()
+
+        y1z2 = y1 * z2
+        x1z2 = x1 * z2
+        z1z2 = z1 * z2
+        u = y2 * z1 - y1z2
+        v = x2 * z1 - x1z2
+
+        if not v:
+            if not u:
+                return self.__double__()
+            else:
+                return self.__class__( 0, 1, 0 )
+
+        vv = v * v
+        vvv = v * vv
+        r = vv * x1z2
+        a = u * u * z1z2 - vvv - 2 * r
+
+        return self.__class__( v * a, u * (r - a) - vvv * y1z2, vvv * z1z2 )
+
+
+    def __double__(self):
+        """
+        Point doubling: add a point to itself.
+
+        @note  This method should not be called directly.  Instead use the
+               infix operator @c +, which calls __add__().
+
+        @see   dbl-2007-bl in the Explicit-Formulas Database
+        """
+        x, y, z = self.__x, self.__y, self.__z
+
+        xx = x * x
+        w = self._A * z * z  +  3 * xx
+        s = 2 * y * z
+        r = y * s
+        rr = r * r
+        b = (x + r)**2 - xx - rr
+        h = w * w - 2 * b
+
+        return self.__class__( h * s, w * (b - h) - 2 * rr, s**3 )
+
+
+    def __neg__(self):
+        """
+        Return the additive inverse (the negative) of @p self, which is
+        @f$ (X : -Y : Z) @f$.
+        """
+        return self.__class__( self.__x, -self.__y, self.__z )
+
+
+    #- Class Methods-----------------------------------------------------------
+
+    @classmethod
+    def from_affine(cls, point):
+        """
+        Return the point with projective coordinates that is equal to the
+        elliptic_curves.naive.EllipticCurve point @p point.
+        """
+        if point.is_infinite():
+            return cls( 0, 1, 0 )
+        return cls( point.x(), point.y(), 1 )
+
+
+
+@local_method_names
+@profiling_name( "J<{_field}>" )
+class JacobianPoint( EllipticCurve ):
+    """
+    An elliptic curve with points in Jacobian coordinates; the points support
+    additive infix notation for group operations, as well as multiplication
+    by integers.
+
+    This is a template class that must be instantiated with the field and the
+    parameters @c A and @c B.  Use it like ProjectivePoint.
+
+    A Jacobian point @f$ (X : Y : Z) @f$ with @f$ Z \neq 0 @f$ represents the
+    affine point @f$ (X/Z^2, Y/Z^3) @f$.  All points with @f$ Z = 0 @f$ are the
+    point at infinity.  The fundamental relation becomes
+    @f$ Y^2 = X^3 + AXZ^4 + BZ^6 @f$.  Point doubling is cheaper than for
+    projective coordinates, which benefits scalar multiplication.
+
+    @note  Comparisons cross-multiply the coordinates; use to_affine() to get
+           Cartesian coordinates with a single division.
+    @note  Over a ring with zero divisors, every @f$ Z @f$ must be zero or a
+           unit; see ProjectivePoint.
+
+    @see   elliptic_curves.naive.EllipticCurve
+    """
+
+    #- Instance Methods -----------------------------------------------------------
+
+    def __init__(self, x, y, z=1):
+        """
+        Construct a new point @f$ (x : y : z) @f$ on the elliptic curve.
+
+        The coordinates must be connected by the fundamental relation
+        @f$ y^2 = x^3 + Axz^4 + Bz^6 @f$.  For @f$ z = 0 @f$, the point is
+        the point at infinity.
+
+        @see   ProjectivePoint.__init__() for a description of the parameters.
+        """
+        self.__x = self._field( x )
+        self.__y = self._field( y )
+        self.__z = self._field( z )
+
+        A, B = self.parameters()
+        x, y, z = self.__x, self.__y, self.__z
+        if z and y**2 != x**3  +  A * x * z**4  +  B * z**6:
+            raise ValueError( "point ({x} : {y} : {z}) is not on the curve"
+                              .format(x=x, y=y, z=z) )
+
+
+    def x(self):
+        """
+        Return the first Cartesian coordinate @f$ X/Z^2 @f$ of the point.
+
+        @note  This requires a division; use coordinates() to obtain the
+               Jacobian coordinates.
+        """
+        return self.__x / self.__z**2
+
+
+    def y(self):
+        """
+        Return the second Cartesian coordinate @f$ Y/Z^3 @f$ of the point.
+
+        @note  This requires a division; use coordinates() to obtain the
+               Jacobian coordinates.
+        """
+        return self.__y / self.__z**3
+
+
+    def coordinates(self):
+        """
+        Return the tuple of Jacobian coordinates @f$ (X, Y, Z) @f$.
+
+        @note  Passing the tuple to the class constructor creates an equal
+               point.
+        """
+        return (self.__x, self.__y, self.__z)
+
+
+    def to_affine(self):
+        """
+        Return the point as elliptic_curves.naive.EllipticCurve point with
+        Cartesian coordinates; return a PointAtInfinity if @p self is
+        infinite.
+
+        The conversion requires a single inversion in field().
+        """
+        if self.is_infinite():
+            return PointAtInfinity()
+
+        z_inverse = self.__z.multiplicative_inverse()
+        zz_inverse = z_inverse * z_inverse
+        E = EllipticCurve( self._field, self._A, self._B )
+        return E( self.__x * zz_inverse, self.__y * zz_inverse * z_inverse )
+
+
+    def is_infinite(self):
+        """
+        Test whether the point is infinite, that is, whether the third
+        coordinate is zero.
+        """
+        return not self.__z
+
+
+    def __bool__(self):
+        """
+        Test whether the point is finite, that is, whether the third
+        coordinate is non-zero.
+        """
+        return bool( self.__z )
+
+
+    def __eq__(self, other):
+        """
+        Test whether another point @p other is equal to @p self; return
+        @c True if that is the case.  The infix operator @c == calls
+        this method.
+
+        Two finite points @f$ (X_1 : Y_1 : Z_1), (X_2 : Y_2 : Z_2) @f$ are
+        equal if, and only if, @f$ X_1 Z_2^2 = X_2 Z_1^2 @f$ and
+        @f$ Y_1 Z_2^3 = Y_2 Z_1^3 @f$.  Points in other representations are
+        compared by their Cartesian coordinates.
+        """
+        if self.is_infinite() or other.is_infinite():
+            return self.is_infinite() and other.is_infinite()
+
+        if isinstance( other, self.__class__ ):
+            x, y, z = other.coordinates()
+        else:
+            other = other.to_affine()
+            x, y, z = other.x(), other.y(), 1
+
+        zz1, zz2 = self.__z * self.__z, z * z
+        return self.__x * zz2 == x * zz1 \
+                and self.__y * zz2 * z == y * zz1 * self.__z
+
+
+    def __add__(self, other):
+        """
+        Return the sum of @p self and @p other.  The infix operator @c + calls
+        this method.
+
+        @note  The formulas require no divisions.  If @p other uses another
+               representation, then it will be converted first.
+
+        @see   elliptic_curves.naive.EllipticCurve.__add__()
+        """
+        if other.is_infinite():
+            return self
+        if self.is_infinite():
+            return other
+        if not isinstance( other, self.__class__ ):
+            other = self.from_affine( other.to_affine() )
+
+        return self.__generic_add__( other )
+
+
+    def __generic_add__(self, other):
+        """
+        Addition of finite points @p self and @p other.
+
+        The method falls back to __double__() if the points are equal.
+
+        @note  This method should not be called directly.  Instead use the
+               infix operator @c +, which calls __add__().
+
+        @see   add-1998-cmo-2 in the Explicit-Formulas Database
+        """
+        x1, y1, z1 = self.__x, self.__y, self.__z
+        x2, y2, z2 = other.coordinates()
+
+        z1z1 = z1 * z1
+        z2z2 = z2 * z2
+        u1 = x1 * z2z2
+        s1 = y1 * z2 * z2z2
+        h = x2 * z1z1 - u1
+        r = y2 * z1 * z1z1 - s1
+
+        if not h:
+            if not r:
+                return self.__double__()
+            else:
+                return self.__class__( 1, 1, 0 )
+
+        hh = h * h
+        hhh = h * hh
+        v = u1 * hh
+        x3 = r * r - hhh - 2 * v
+
+        return self.__class__( x3, r * (v - x3) - s1 * hhh, z1 * z2 * h )
+
+
+    def __double__(self):
+        """
+        Point doubling: add a point to itself.
+
+        @note  This method should not be called directly.  Instead use the
+               infix operator @c +, which calls __add__().
+
+        @see   dbl-1998-cmo-2 in the Explicit-Formulas Database
+        """
+        x, y, z = self.__x, self.__y, self.__z
+
+        yy = y * y
+        zz = z * z
+        s = 4 * x * yy
+        m = 3 * x * x  +  self._A * zz * zz
+        t = m * m - 2 * s
+
+        return self.__class__( t, m * (s - t) - 8 * yy * yy, 2 * y * z )
+
+
+    def __neg__(self):
+        """
+        Return the additive inverse (the negative) of @p self, which is
+        @f$ (X : -Y : Z) @f$.
+        """
+        return self.__class__( self.__x, -self.__y, self.__z )
+
+
+    #- Class Methods-----------------------------------------------------------
+
+    @classmethod
+    def from_affine(cls, point):
+        """
+        Return the point with Jacobian coordinates that is equal to the
+        elliptic_curves.naive.EllipticCurve point @p point.
+        """
+        if point.is_infinite():
+            return cls( 1, 1, 0 )
+        return cls( point.x(), point.y(), 1 )
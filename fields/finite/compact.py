@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+A compact implementation of prime fields.
+
+@package   fields.finite.compact
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+from fields import Field
+
+from support.types import template
+from support.profiling import profiling_name, local_method_names
+
+@local_method_names
+@profiling_name( "GF<{_modulus}>" )
+class FiniteField( Field, metaclass=template( "_modulus" ) ):
+    """
+    The finite field with @f$ p @f$ elements, where @f$ p @f$ is prime; the
+    field operations on the element instances support the natural infix
+    syntax and allow mixing in integer arguments.
+
+    This is a template class that must be instantiated with the field size.
+    It offers the same interface as fields.finite.naive.FiniteField and may
+    replace it anywhere, for instance as coefficient field of
+    rings.polynomials.naive.Polynomials:
+    @code
+    # Instantiate the template; GF23 is a class.
+    GF23 = FiniteField(23)
+    x = GF23(3)    # Create a field element: x is the quotient class (3 mod 23)
+    y = GF23(-2)   # Equivalently: y = GF23(21) because 21 == -2  (mod 23)
+    z = x**2 + 2*y - x/y   # z == 15 (mod 23); note that -2*11 == 1 (mod 23)
+    type(x) is GF23        # This is True
+    @endcode
+
+    Field arithmetic is the innermost loop of all polynomial operations.
+    Therefore this implementation trades the modularity of the naive one for
+    speed: an element stores its remainder as plain @c int in a slot, and the
+    operations cast integer operands inline instead of using
+    support.operators.operand_casting().
+
+    @note      The field size must be a prime.  For compound numbers, division
+               raises a ZeroDivisionError for elements that are not units.
+
+    @see       fields.finite.naive.FiniteField
+    @author    Peter Dinges <pdinges@acm.org>
+    """
+
+    __slots__ = ( "__remainder", )
+
+    #- Instance Methods -----------------------------------------------------------
+
+    def __init__(self, representative):
+        """
+        Construct a new element of the finite field: the residue class of
+        @p representative modulo characteristic().
+
+        If the @p representative already is an element of this FiniteField
+        class, then the new element is a copy of @p representative.
+
+        @exception TypeError   if @p representative cannot be interpreted as
+                               an integer (for example, if it is an element
+                               of another finite field).
+        """
+        if isinstance( representative, self.__class__ ):
+            self.__remainder = representative.__remainder
+        else:
+            self.__remainder = int( representative ) % self._modulus
+
+
+    def remainder(self):
+        """
+        Return the remainder of the residue class @p self: the unique integer
+        in the range @f$ 0, \ldots, p-1 @f$ that represents the element.
+        """
+        return self.__remainder
+
+
+    def __bool__(self):
+        """
+        Test whether the element is non-zero: return @c True if, and only if,
+        the remainder is non-zero.
+        """
+        return self.__remainder != 0
+
+
+    def __eq__(self, other):
+        """
+        Test whether another element @p other is equal to @p self; return
+        @c True if that is the case.  The infix operator @c == calls this
+        method.  An integer is equal to the element if, and only if, it is
+        the remainder(): @c FiniteField(23)(3) @c == @c 3 holds, but
+        @c FiniteField(23)(3) @c == @c 26 does not.  Thus equal objects
+        have equal hashes; see __hash__().
+        """
+        if other.__class__ is self.__class__:
+            return self.__remainder == other.__remainder
+        elif isinstance( other, int ):
+            return self.__remainder == other
+        else:
+            return NotImplemented
+
+
+    def __hash__(self):
+        """
+        Return a hash value of the element: the hash of its remainder.  Equal
+        elements have equal hashes, and so do an element and the integer
+        remainder(), the only integer that compares equal to it.
+        """
+        return hash( self.__remainder )
+
+
+    def __add__(self, other):
+        """
+        Return the sum of @p self and @p other.  The infix operator @c + calls
+        this method.
+        """
+        if other.__class__ is self.__class__:
+            value = other.__remainder
+        elif isinstance( other, int ):
+            value = other
+        else:
+            return NotImplemented
+        return self.__element( (self.__remainder + value) % self._modulus )
+
+    __radd__ = __add__
+
+
+    def __neg__(self):
+        """
+        Return the additive inverse of @p self.  The negation operator @c -x
+        (unary minus) calls this method.
+        """
+        return self.__element( -self.__remainder % self._modulus )
+
+
+    def __sub__(self, other):
+        """
+        Return the difference of @p self and @p other.  The infix operator
+        @c - calls this method.
+        """
+        if other.__class__ is self.__class__:
+            value = other.__remainder
+        elif isinstance( other, int ):
+            value = other
+        else:
+            return NotImplemented
+        return self.__element( (self.__remainder - value) % self._modulus )
+
+
+    def __rsub__(self, other):
+        """
+        Return the difference of @p other and @p self.  The infix operator
+        @c - calls this method if @p self is the subtrahend.
+        """
+        if isinstance( other, int ):
+            return self.__element( (other - self.__remainder) % self._modulus )
+        else:
+            return NotImplemented
+
+
+    def __mul__(self, other):
+        """
+        Return the product of @p self and @p other.  The infix operator @c *
+        calls this method.
+        """
+        if other.__class__ is self.__class__:
+            value = other.__remainder
+        elif isinstance( other, int ):
+            value = other
+        else:
+            return NotImplemented
+        return self.__element( (self.__remainder * value) % self._modulus )
+
+    __rmul__ = __mul__
+
+
+    def __truediv__(self, other):
+        """
+        Return the quotient of @p self and @p other.  The infix operator @c /
+        calls this method.
+
+        @exception ZeroDivisionError   if @p other is zero.
+        """
+        if other.__class__ is self.__class__:
+            value = other.__remainder
+        elif isinstance( other, int ):
+            value = other
+        else:
+            return NotImplemented
+        return self.__element(
+                    (self.__remainder * self.__inverse( value )) % self._modulus
+                )
+
+
+    def __rtruediv__(self, other):
+        """
+        Return the quotient of @p other and @p self.  The infix operator @c /
+        calls this method if @p self is the divisor.
+
+        @exception ZeroDivisionError   if @p self is zero.
+        """
+        if isinstance( other, int ):
+            inverse = self.__inverse( self.__remainder )
+            return self.__element( (other * inverse) % self._modulus )
+        else:
+            return NotImplemented
+
+
+    def __pow__(self, n, modulus=None):
+        """
+        Return @p self taken to the @p n-th power.  The infix operator @c **
+        and the built-in function @c pow() call this method.  Negative
+        exponents yield powers of the multiplicative_inverse().
+
+        @param modulus If not @c None, then the generic Field.__pow__()
+                       computes the power and reduces all intermediate
+                       results modulo @p modulus.
+
+        @exception TypeError           if @p n is no integer type.
+        @exception ZeroDivisionError   if @p n is negative and @p self is zero.
+        """
+        if modulus is not None:
+            return Field.__pow__( self, n, modulus )
+        n = int( n )
+        if n < 0:
+            return self.multiplicative_inverse() ** -n
+        return self.__element( pow( self.__remainder, n, self._modulus ) )
+
+
+    def multiplicative_inverse(self):
+        """
+        Return the multiplicative inverse of @p self.
+
+        @exception ZeroDivisionError   if @p self is zero.
+        """
+        return self.__element( self.__inverse( self.__remainder ) )
+
+
+    def __element(self, remainder):
+        """
+        Return a new element of the field with the given, already reduced
+        @p remainder; this bypasses the template machinery and __init__().
+
+        @note  This method should not be called directly.
+        """
+        element = object.__new__( self.__class__ )
+        element.__remainder = remainder
+        return element
+
+
+    def __inverse(self, value):
+        """
+        Return the inverse of the integer @p value modulo characteristic().
+
+        @note  This method should not be called directly.
+        """
+        try:
+            return pow( value, -1, self._modulus )
+        except ValueError:
+            message = "element has no inverse: representative and modulus " \
+                      "are not relatively prime"
+            raise ZeroDivisionError( message )
+
+
+    #- Class Methods-----------------------------------------------------------
+
+    @classmethod
+    def modulus(cls):
+        """
+        Return the field characteristic @f$ p @f$; the elements are the
+        residue classes modulo @f$ p @f$.
+        """
+        return cls._modulus
+
+    @classmethod
+    def characteristic(cls):
+        """
+        Return the field characteristic @f$ p @f$.
+        """
+        return cls._modulus
+
+    @classmethod
+    def power(cls):
+        """
+        Return the power @f$ k @f$ of the characteristic that yields the field
+        size: @f$ q = p^k @f$, where @f$ p @f$ is the field characteristic.
+
+        @note  In the current implementation, @f$ k @f$ is always 1.
+        """
+        return 1
+
+    @classmethod
+    def size(cls):
+        """
+        Return the number of elements in the field.
+        """
+        return cls._modulus
+
+    @classmethod
+    def elements(cls):
+        """
+        Return a list of all field elements in ascending order
+        @f$ (0, 1, 2, ..., p-1) @f$ (mod p).
+
+        @note  The method populates the complete list, so this operation might
+               be expensive for large field characteristics.
+        """
+        return [ cls(i) for i in range(0, cls._modulus) ]
+
+    @classmethod
+    def zero(cls):
+        """
+        Return the field's neutral element of addition (zero).
+        """
+        return cls( 0 )
+
+    @classmethod
+    def one(cls):
+        """
+        Return the field's neutral element of multiplication (one).
+        """
+        return cls( 1 )
@@ -105,12 +105,16 @@ def frobenius_trace_mod_2(curve):
     A, B = curve.parameters()
 
     defining_polynomial = x**3 + A*x + B
-    rational_characteristic = x**curve.field().size() - x
+    # Reduce modulo the defining polynomial while exponentiating; this
+    # leaves the gcd unchanged and avoids a polynomial of degree q.
+    rational_characteristic = \
+        x.powmod( curve.field().size(), defining_polynomial ) - x
     
     # gcd() has an arbitrary unit as leading coefficient;
-    # relatively prime polynomials have a constant gcd.
-    d = gcd( rational_characteristic, defining_polynomial )
-    if d.degree() == 0:
+    # relatively prime polynomials have a constant gcd.  A vanishing
+    # rational characteristic means that all zeros are rational.
+    if rational_characteristic \
+            and gcd( rational_characteristic, defining_polynomial ).degree() == 0:
         # The rational characteristic and the defining polynomial
         # are relatively prime: no rational point of order 2 exists
         # and the Frobenius trace must be odd.
@@ -147,9 +151,12 @@ def frobenius_trace_mod_l(torsion_group):
     for trace_candidate in range( 0, torsion_group.torsion() ):
         candidate_congruence = ints_mod_torsion( trace_candidate )
         for point in torsion_group.elements():
+            # The torsion group caches the Frobenius images of its only point.
             if not frobenius_equation( candidate_congruence,
                                        field_size,
-                                       point ):
+                                       point,
+                                       torsion_group.frobenius_point( 1 ),
+                                       torsion_group.frobenius_point( 2 ) ):
                 # Exit inner loop and skip the 'else' clause.
                 break
         else:
@@ -160,7 +167,8 @@ def frobenius_trace_mod_l(torsion_group):
     raise ArithmeticError( message )
 
 
-def frobenius_equation(trace, size, point):
+def frobenius_equation(trace, size, point,
+                       frobenius_point=None, frobenius2_point=None):
     """
     Check whether @p trace could be the trace of the Frobenius endomorphism
     @f$ \phi @f$ on the l-torsion group. To test the candidate, use it in
@@ -174,13 +182,23 @@ def frobenius_equation(trace, size, point):
                        This is the exponent of the Frobenius endomorphism.
     @param     point   The l-torsion point that will be inserted into
                        @f$ \chi_{\phi}(phi) @f$.
+    @param     frobenius_point     The image @f$ \phi(\mathtt{point}) @f$,
+                                   or @c None to compute it with frobenius().
+    @param     frobenius2_point    The image
+                                   @f$ \phi^2(\mathtt{point}) @f$, or
+                                   @c None to compute it with frobenius().
     
     @return    @c True, if @f$ (\chi_{\phi}(\phi))(\mathtt{point}) @f$ is the
                point at infinity. 
     """ 
+    if frobenius_point is None:
+        frobenius_point = frobenius( point, size )
+    if frobenius2_point is None:
+        frobenius2_point = frobenius( frobenius_point, size )
+    
     size_remainder = size % trace.modulus()
-    result = frobenius( frobenius(point, size), size ) \
-                - trace.remainder() * frobenius(point, size) \
+    result = frobenius2_point \
+                - trace.remainder() * frobenius_point \
                 + size_remainder * point
     return result.is_infinite()
 
@@ -190,8 +208,9 @@ def frobenius(point, q):
     The Frobenius endomorphism @f$ \phi @f$.
     
     @return    The point @f$ (x^q, y^q) @f$ if @p point is @f$ (x, y) @f$.
+               Points in projective representations map coordinate-wise.
     """
-    return point.__class__( point.x() ** q, point.y() ** q )
+    return point.__class__( *[ c ** q for c in point.coordinates() ] )
 
 
 def possible_frobenius_trace_range(field):
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Point counting on elliptic curves over prime fields with the fastest
+available algorithm for the size of the field.
+
+The baby-step giant-step method of bsgs_count takes @f$ O(p^{1/4}) @f$
+group operations; Schoof's algorithm (reduced_computation_schoof) takes
+polynomial time in @f$ \log p @f$, but with a large constant.  The module
+uses the former for fields with at most bsgs_bit_limit bits and the latter
+for larger fields.  Curves with complex multiplication by
+@f$ \mathbb{Z}[i] @f$ or @f$ \mathbb{Z}[\omega] @f$ always take the closed
+form of reduced_computation_schoof.complex_multiplication_trace().
+
+@package   schoof.dispatch
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+import bsgs_count
+import reduced_computation_schoof
+
+def frobenius_trace(curve):
+    """
+    Compute the trace of the Frobenius endomorphism for the given
+    EllipticCurve @p curve over a prime field; choose the algorithm by the
+    bit size of the field.
+
+    @return    The trace @f$ t @f$ of the Frobenius endomorphism. The number of
+               points on the curve then is @f$ p + 1 - t @f$, where @f$ p @f$
+               is the size of the prime field over which the curve was
+               defined.
+    """
+    trace = reduced_computation_schoof.complex_multiplication_trace( curve )
+    if trace is not None:
+        return trace
+    return counting_algorithm( curve.field().size() )( curve )
+
+
+def counting_algorithm(p):
+    """
+    Return the function that computes the trace of the Frobenius
+    endomorphism of curves over the field with @p p elements fastest.
+    """
+    if p.bit_length() <= bsgs_bit_limit:
+        return bsgs_count.frobenius_trace
+    return reduced_computation_schoof.frobenius_trace
+
+
+## The largest bit size of fields for which frobenius_trace() uses the
+#  baby-step giant-step method.  It is faster than Schoof's algorithm up to
+#  about 68 bits here; beyond 64 bits, the table of baby steps holds more
+#  than @f$ 10^5 @f$ points.
+bsgs_bit_limit = 64
+
+def set_bsgs_bit_limit(bits):
+    """
+    Set the largest bit size of fields for which frobenius_trace() uses the
+    baby-step giant-step method.
+
+    @return    The previous limit.
+    """
+    global bsgs_bit_limit
+    previous = bsgs_bit_limit
+    bsgs_bit_limit = int( bits )
+    return previous
+
+
+#------------------------------------------------------------------------------
+
+from fields.finite.compact import FiniteField
+from elliptic_curves.naive import EllipticCurve
+
+import sys
+from support.running import AlgorithmRunner
+from support.trace_cache import OrderCache
+
+def point_count_algorithm( p, A, B, output=sys.stdout ):
+    p, A, B = int(p), int(A), int(B)
+
+    message = "Counting points of y^2 = x^3 + {A}x + {B} over GF<{p}>: "
+    print( message.format( p=p, A=A, B=B ), end="", file=output )
+    output.flush()
+
+    curve = EllipticCurve( FiniteField(p), A, B )
+    trace = frobenius_trace( curve )
+    order = p + 1 - trace
+    print( order, file=output )
+    return order
+
+
+if __name__ == "__main__":
+    runner = AlgorithmRunner(
+                     point_count_algorithm,
+                     algorithm_version="$Rev$",
+                     result_cache=OrderCache
+                 )
+    runner.run()
@@ -33,11 +33,31 @@ in Mathematics of Computation, Vol. 44, No. 170 (Apr. 1985), pp. 483--494.
 @author    Peter Dinges <pdinges@acm.org>
 """
 
-from elliptic_curves.l_torsion_group.naive import LTorsionGroup
-from support.primes import inverse_primorial, primes_range
-from support.quotients import solve_congruence_equations, representative_in_range
+import math
+import random
 
-def frobenius_trace(curve):
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import chain
+from math import ceil, isqrt, sqrt
+
+from elliptic_curves.l_torsion_group.naive import ProjectiveLTorsionGroup, \
+                                                  ProjectiveTorsionFactor
+from elliptic_curves.naive import EllipticCurve
+from fields.finite.compact import FiniteField
+from rings.integers.naive import Integers
+from rings.polynomials.naive import Polynomials
+from rings.quotients.naive import QuotientRing
+from support.factorization import smallest_factor
+from support.multiples import PrecomputedMultiples
+from support.prime_selection import select_torsion_primes
+from support.primes import is_probable_prime
+from support.quotients import solve_congruence_equations
+from support.quotients import representatives_in_range, square_root_modulo, \
+                              cornacchia, inverse_modulo
+from support.rings import gcd, batch_inverses
+
+def frobenius_trace(curve, workers=1, progress=None, checkpoint=None):
     """
     Compute the trace of the Frobenius endomorphism for the given EllpiticCurve
     @p curve.
@@ -45,36 +65,459 @@ def frobenius_trace(curve):
     This is an implementation of Schoof's original algorithm for counting the
     points of an elliptic curve over a finite field.
     
+    Curves with @f$ A = 0 @f$ or @f$ B = 0 @f$ take a shortcut through
+    complex_multiplication_trace().
+    
+    The computations modulo different primes are independent.  With more
+    than one worker, the function distributes them to a pool of processes
+    (see parallel_trace_congruences()) and computes the trace modulo the
+    power of two in the meantime.  It combines the congruences as they
+    arrive and stops early if few candidates remain; see
+    combine_trace_congruences().  Stopping early cancels the queued primes
+    and terminates the workers.
+    
+    @param workers The number of processes that compute the trace modulo
+                   the odd primes; 1 computes all in the calling process,
+                   smallest prime first.  For more than one worker, the
+                   curve must be defined over a prime field, and the pool
+                   receives the primes in the order of
+                   schedule_torsion_primes().
+    @param progress    A callable or @c None; see
+                       combine_trace_congruences().
+    @param checkpoint  A support.running.Checkpoint or @c None.  The
+                       function records every computed congruence
+                       @f$ t \equiv r \pmod{m} @f$ as the pair
+                       @f$ (m, r) @f$ and skips the moduli that the
+                       checkpoint already holds.
+    
     @return    The trace @f$ t @f$ of the Frobenius endomorphism. The number of
                points on the curve then is @f$ q + 1 - t @f$, where @f$ q @f$
                is the size of the finite field over which the curve was defined.
     """
-    trace_congruences = []
+    trace = complex_multiplication_trace( curve )
+    if trace is not None:
+        return trace
+    
     search_range = hasse_frobenius_trace_range( curve.field() )
-    torsion_primes = greedy_prime_factors(
-                                 len(search_range),
-                                 curve.field().characteristic()
-                             )
+    exponent, torsion_primes = __trace_moduli( curve.field() )
+
+    # Start with the congruences from earlier runs; they are free.
+    solved = checkpoint.records() if checkpoint is not None else {}
+    known_congruences = [ QuotientRing( Integers, m )( solved[ m ] )
+                          for m in [ 2**exponent ] + torsion_primes
+                          if m in solved ]
+    torsion_primes = [ l for l in torsion_primes if l not in solved ]
+    
+    def recorded(congruences):
+        for congruence in congruences:
+            if checkpoint is not None:
+                checkpoint.record( congruence.modulus(), congruence.remainder() )
+            yield congruence
+    
+    def two_power_congruences():
+        if 2**exponent not in solved:
+            yield frobenius_trace_mod_2k( curve, exponent )
+    
+    if workers > 1 and len( torsion_primes ) > 1:
+        known_modulus = 2**exponent
+        for congruence in known_congruences:
+            known_modulus *= congruence.modulus()
+        scheduled_primes = schedule_torsion_primes(
+                                torsion_primes, known_modulus, search_range
+                            )
+        with parallel_trace_congruences( curve, scheduled_primes, workers ) \
+                as odd_congruences:
+            trace_congruences = chain(
+                    known_congruences,
+                    recorded( chain( two_power_congruences(), odd_congruences ) )
+                )
+            return combine_trace_congruences(
+                        curve, trace_congruences, search_range, progress
+                    )
+    
+    # Compute lazily to skip the largest primes if possible.
+    torsion_group = ProjectiveLTorsionGroup( curve )
+    trace_congruences = chain(
+            known_congruences,
+            recorded( chain(
+                two_power_congruences(),
+                ( frobenius_trace_mod_l( torsion_group( prime ) )
+                  for prime in sorted( torsion_primes ) )
+            ) )
+        )
+    return combine_trace_congruences(
+                curve, trace_congruences, search_range, progress
+            )
+
+
+def complex_multiplication_trace(curve):
+    """
+    Return the trace of the Frobenius endomorphism of @p curve if the curve
+    has the form @f$ y^2 = x^3 + B @f$ or @f$ y^2 = x^3 + Ax @f$ over a
+    prime field with @f$ p > 3 @f$ elements; otherwise, return @c None.
+    
+    These curves have complex multiplication by @f$ \mathbb{Z}[\omega] @f$
+    (the cube roots of unity) and @f$ \mathbb{Z}[i] @f$, respectively, and
+    their traces have a closed form.  The curve is supersingular, that is,
+    the trace is 0, if @f$ p \equiv 2 \pmod{3} @f$ and
+    @f$ p \equiv 3 \pmod{4} @f$, respectively.  Otherwise, @f$ p @f$ is the
+    norm of a primary prime @f$ \pi @f$ of the ring, and
+    @f{align*}{
+     y^2 = x^3 + B &: \quad t = -\overline{\chi_6(4B)}\pi
+                                 - \chi_6(4B)\overline{\pi} \\
+     y^2 = x^3 + Ax &: \quad t = \overline{\chi_4(-A)}\pi
+                                 + \chi_4(-A)\overline{\pi},
+    @f}
+    where @f$ \chi_n(D) \equiv D^{(p-1)/n} \pmod{\pi} @f$ is the
+    @f$ n @f$-th power residue symbol.  The function finds @f$ \pi @f$ with
+    the algorithm of Cornacchia (see support.quotients.cornacchia()), so it
+    takes a few modular exponentiations.
+    
+    @see   Ireland, K., and Rosen, M., "A Classical Introduction to Modern
+           Number Theory", second edition, Springer 1990, chapter 18, §3
+    """
+    field = curve.field()
+    p = field.characteristic()
+    if field.size() != p or p <= 3:
+        return None
+    
+    A, B = [ field( c ).remainder() for c in curve.parameters() ]
+    if A == 0 and p % 3 == 2:
+        return 0
+    if B == 0 and p % 4 == 3:
+        return 0
     
-    # To avoid multivariate polynomial arithmetic, make l=2 a special case.
-    if 2 in torsion_primes:
-        trace_congruences.append( frobenius_trace_mod_2( curve ) )
-        torsion_primes.remove( 2 )
+    if A == 0:
+        # Eisenstein integers x + y*omega as pairs (x, y).
+        x, y = cornacchia( 3, p )
+        pi = ( x + y, 2*y )      # x + y*sqrt(-3) = (x + y) + 2y*omega
+        units = [ (1, 0), (1, 1), (0, 1), (-1, 0), (-1, -1), (0, -1) ]
+        multiply = __eisenstein_product
+        real_part_times_2 = lambda z: 2*z[0] - z[1]
+        conjugate = lambda z: ( z[0] - z[1], -z[1] )
+        # Primary means pi = 2 (mod 3).
+        primary = lambda z: z[0] % 3 == 2 and z[1] % 3 == 0
+        D, n, sign = 4*B, 6, -1
+    elif B == 0:
+        # Gaussian integers x + y*i as pairs (x, y).
+        x, y = cornacchia( 1, p )
+        pi = ( x, y )
+        units = [ (1, 0), (0, 1), (-1, 0), (0, -1) ]
+        multiply = __gaussian_product
+        real_part_times_2 = lambda z: 2*z[0]
+        conjugate = lambda z: ( z[0], -z[1] )
+        # Primary means pi = 1 (mod 2 + 2i).
+        primary = lambda z: ( z[0] % 4, z[1] % 4 ) in [ (1, 0), (3, 2) ]
+        D, n, sign = -A, 4, 1
+    else:
+        return None
+    
+    # Exactly one associate of pi is primary.
+    pi = [ z for z in [ multiply( u, pi ) for u in units ] if primary( z ) ][0]
+    
+    # Modulo pi, the generator of the ring maps to -x/y.
+    generator = -pi[0] * inverse_modulo( pi[1], p ) % p
+    residue = pow( D, (p - 1) // n, p )
+    character = [ u for u in units
+                  if ( u[0] + u[1] * generator ) % p == residue ][0]
+    return sign * real_part_times_2( multiply( conjugate( character ), pi ) )
 
-    torsion_group = LTorsionGroup( curve )
-    for prime in torsion_primes:
-        trace_congruences.append(
-                frobenius_trace_mod_l( torsion_group( prime ) )
-             )
+
+def screen_curve(curve, max_cofactor=1, rejection=None):
+    """
+    Return the number of points on the elliptic @p curve if it is a prime
+    times a cofactor of at most @p max_cofactor; otherwise, return @c None.
+    
+    The function computes the same congruences as frobenius_trace() in
+    ascending order of the moduli, but checks each of them first: the order
+    @f$ N = q + 1 - t @f$ satisfies @f$ N \equiv q + 1 - r \pmod{m} @f$ for
+    the congruence @f$ t \equiv r \pmod{m} @f$, so
+    @f$ \gcd(q + 1 - r, m) @f$ divides the cofactor.  As soon as the
+    product of these divisors exceeds @p max_cofactor, the function rejects
+    the curve.  Since half of all curves have even order and a third of the
+    remaining ones an order divisible by 3, most curves cost only the
+    congruences modulo @f$ 2^k @f$ and 3.  The surviving curves get a
+    complete point count and a primality test of @f$ N @f$ divided by its
+    small factors.  Curves with complex multiplication (see
+    complex_multiplication_trace()) skip the screening.
+    
+    @param max_cofactor    The largest acceptable cofactor; 1 accepts only
+                           prime orders.
+    @param rejection       A callable or @c None.  If the function rejects
+                           the curve, then it calls it with the name of the
+                           deciding stage: @c "2-torsion" (the order is even),
+                           @c "small primes" (the congruences exceed the
+                           cofactor), or @c "primality" (the complete order
+                           fails the primality test).
+    """
+    q = curve.field().size()
+    search_range = hasse_frobenius_trace_range( curve.field() )
+    exponent, torsion_primes = __trace_moduli( curve.field() )
     
-    trace_congruence = solve_congruence_equations( trace_congruences )
-    return representative_in_range( trace_congruence, search_range )
+    def reject(stage):
+        if rejection is not None:
+            rejection( stage )
+        return None
+    
+    def test_primality(order):
+        for cofactor in range( 1, max_cofactor + 1 ):
+            if order % cofactor == 0 and is_probable_prime( order // cofactor ):
+                return order
+        return reject( "primality" )
+    
+    # Curves with complex multiplication need no screening.
+    trace = complex_multiplication_trace( curve )
+    if trace is not None:
+        return test_primality( q + 1 - trace )
+    
+    # The trace modulo 2 costs a fraction of the trace modulo 2^k and
+    # suffices to reject the even orders.
+    if max_cofactor < 2 \
+            and ( q + 1 - frobenius_trace_mod_2( curve ).remainder() ) % 2 == 0:
+        return reject( "2-torsion" )
+    
+    rejected = False
+    def screened(congruences):
+        nonlocal rejected
+        cofactor = 1
+        for congruence in congruences:
+            m = congruence.modulus()
+            cofactor *= math.gcd( ( q + 1 - congruence.remainder() ) % m, m )
+            if cofactor > max_cofactor:
+                rejected = True
+                return
+            yield congruence
+    
+    torsion_group = ProjectiveLTorsionGroup( curve )
+    trace_congruences = chain(
+            [ frobenius_trace_mod_2k( curve, exponent ) ],
+            ( frobenius_trace_mod_l( torsion_group( prime ) )
+              for prime in sorted( torsion_primes ) )
+        )
+    try:
+        trace = combine_trace_congruences(
+                    curve, screened( trace_congruences ), search_range
+                )
+    except ArithmeticError:
+        if rejected:
+            return reject( "small primes" )
+        raise
+    
+    return test_primality( q + 1 - trace )
 
 
-from rings.integers.naive import Integers
-from rings.polynomials.naive import Polynomials
-from rings.quotients.naive import QuotientRing
-from support.rings import gcd
+def combine_trace_congruences(curve, congruences, search_range, progress=None):
+    """
+    Return the trace of the Frobenius endomorphism of @p curve from the
+    iterable of @p congruences for the trace (with relatively prime
+    moduli); take as few congruences as possible.
+    
+    The function maintains the combined congruence and the candidates for
+    the trace that it leaves in @p search_range.  It stops as soon as there
+    is a single candidate.  If there are at most
+    verification_candidates_limit candidates, then it tests them with
+    verify_trace_candidates(), which costs a few scalar multiplications;
+    if only one candidate passes, it stops as well.  This often spares the
+    computation modulo the largest prime.
+    
+    @param progress    A callable or @c None.  The function calls it after
+                       every congruence with the modulus of the congruence
+                       and the number of remaining candidates.
+    
+    @exception ArithmeticError     if the @p congruences leave several
+                                   candidates.
+    """
+    combined, candidates = None, search_range
+    for congruence in congruences:
+        if combined is None:
+            combined = congruence
+        else:
+            combined = solve_congruence_equations( [ combined, congruence ] )
+        candidates = representatives_in_range( combined, search_range )
+        
+        if progress is not None:
+            progress( congruence.modulus(), len( candidates ) )
+        
+        if len( candidates ) == 1:
+            return candidates[0]
+        if len( candidates ) <= verification_candidates_limit:
+            trace = verify_trace_candidates( curve, candidates )
+            if trace is not None:
+                return trace
+    
+    message = "congruences left {0} trace candidates"
+    raise ArithmeticError( message.format( len( candidates ) ) )
+
+
+## The largest number of trace candidates that combine_trace_congruences()
+#  tests with random points instead of computing further congruences.
+verification_candidates_limit = 16
+
+
+def verify_trace_candidates(curve, candidates):
+    """
+    Return the only trace candidate from @p candidates that passes the
+    point order test, or @c None if no candidate or several candidates pass.
+    
+    A candidate @f$ t @f$ passes the test if @f$ (q + 1 - t)P @f$ is the point
+    at infinity for verification_point_count random points @f$ P @f$.  The
+    true trace passes for all points; a false candidate passes only if the
+    orders of all points divide its difference to the true trace.  A curve
+    without finite points has order 1, so @f$ t = q @f$.
+    """
+    q = curve.field().size()
+    points = [ random_point( curve ) for i in range( verification_point_count ) ]
+    if any( P is None for P in points ):
+        # Only the point at infinity: the order is 1.
+        return q if q in candidates else None
+    # All candidates multiply the same points: share their doublings.
+    multiples = [ PrecomputedMultiples( P ) for P in points ]
+    survivors = [ t for t in candidates
+                  if all( multiple( q + 1 - t ).is_infinite()
+                          for multiple in multiples ) ]
+    if len( survivors ) == 1:
+        return survivors[0]
+    return None
+
+## The number of random points that test every trace candidate.
+verification_point_count = 3
+
+
+def random_point(curve):
+    """
+    Return a random finite point on the elliptic @p curve over a prime field;
+    return @c None if the curve has no finite point.
+    
+    The function tests the x-coordinates from a random start on; it gives up
+    after all @f$ p @f$ of them, which only happens for tiny fields.
+    """
+    field = curve.field()
+    p = field.characteristic()
+    A, B = [ field( c ) for c in curve.parameters() ]
+    start = random.randrange( 0, p )
+    for i in range( p ):
+        x = field( start + i )
+        rhs = x**3 + A*x + B
+        try:
+            y = field( square_root_modulo( rhs.remainder(), p ) )
+        except ValueError:
+            continue
+        return curve( x, y )
+    return None
+
+
+@contextmanager
+def parallel_trace_congruences(curve, primes, workers):
+    """
+    Compute the trace of the Frobenius endomorphism of @p curve modulo the
+    odd @p primes in a pool of @p workers processes; use it in a @c with
+    statement:
+    @code
+    with parallel_trace_congruences( curve, [ 3, 5, 7 ], 4 ) as congruences:
+        do_something_else()
+        # Iterating waits for the results.
+        for congruence in congruences:
+            print( congruence.modulus(), congruence.remainder() )
+    @endcode
+    
+    The tasks start when the statement begins; the calling process may do
+    other work in the meantime, and it may stop iterating early: leaving the
+    statement cancels the tasks that have not started.  Each task is a call of
+    frobenius_trace_mod_prime() with the integers @f$ (p, A, B, l) @f$, so
+    it is cheap to send; the workers build their own curve and division
+    polynomials.  The pool receives the @p primes in the given order (see
+    schedule_torsion_primes()); the iteration yields the results in the
+    order of completion.
+    
+    @note  Leaving the statement early terminates the worker processes;
+           the tasks that already run are lost.  This keeps timeouts and
+           interrupts of support.running.AlgorithmRunner from waiting for
+           a large prime, which may take minutes.
+    
+    @return    An iterable of congruence classes (elements of
+               @c QuotientRing( Integers, l ) ) for the @p primes.
+    """
+    field = curve.field()
+    p = field.characteristic()
+    A, B = [ field( c ).remainder() for c in curve.parameters() ]
+    
+    pool = ProcessPoolExecutor( max_workers=workers )
+    futures = [ pool.submit( frobenius_trace_mod_prime, p, A, B, l )
+                for l in primes ]
+    
+    def congruences():
+        for future in as_completed( futures ):
+            l, remainder = future.result()
+            yield QuotientRing( Integers, l )( remainder )
+    
+    try:
+        yield congruences()
+    finally:
+        if all( future.done() for future in futures ):
+            pool.shutdown()
+        else:
+            # The executor offers no way to stop running tasks: terminate
+            # the processes after cancelling the queued tasks.
+            processes = list( pool._processes.values() )
+            pool.shutdown( wait=False, cancel_futures=True )
+            for process in processes:
+                process.terminate()
+
+
+def schedule_torsion_primes(primes, modulus, search_range):
+    """
+    Return the odd @p primes in the order in which frobenius_trace()
+    submits them to the process pool.
+    
+    A prime is certainly needed if the congruences modulo all other primes
+    and the known @p modulus leave more than verification_candidates_limit
+    candidates in @p search_range; combine_trace_congruences() then cannot
+    stop without it.  The certainly needed primes come first, largest
+    first: the most expensive tasks start early, so that the workers finish
+    at about the same time.  The remaining primes follow smallest first;
+    their congruences are cheap and may suffice to stop early, so that the
+    expensive ones are still queued and get cancelled.  If
+    largest_primes_first is @c True, then all primes come largest first.
+    """
+    if largest_primes_first:
+        return sorted( primes, reverse=True )
+    
+    total_modulus = modulus
+    for l in primes:
+        total_modulus *= l
+    
+    needed = [ l for l in primes
+               if len( search_range ) // ( total_modulus // l )
+                   > verification_candidates_limit ]
+    optional = [ l for l in primes if l not in needed ]
+    return sorted( needed, reverse=True ) + sorted( optional )
+
+## If @c True, then schedule_torsion_primes() orders all primes largest
+#  first.  This balances the load of the workers best, but the expensive
+#  primes then run even if the cheap ones suffice to stop early.
+largest_primes_first = False
+
+
+def frobenius_trace_mod_prime(p, A, B, l):
+    """
+    Return the pair @f$ (l, t \bmod l) @f$ for the trace @f$ t @f$ of the
+    Frobenius endomorphism of the curve @f$ y^2 = x^3 + Ax + B @f$ over the
+    field with @p p elements and the odd prime @p l.  This is the task
+    that parallel_trace_congruences() sends to the worker processes; the
+    arguments and the result are plain integers.
+    """
+    curve = EllipticCurve( FiniteField( p ), A, B )
+    torsion_group = ProjectiveLTorsionGroup( curve )( l )
+    return l, frobenius_trace_mod_l( torsion_group ).remainder()
+
+
+## The exponent @f$ k @f$ of the power of two modulo which frobenius_trace()
+#  computes the trace with frobenius_trace_mod_2k().  The second bit costs
+#  less than the prime 3; the third bit already costs about as much as
+#  the prime 11, and the degree of the torsion polynomials quadruples with
+#  every further bit.
+two_power_exponent = 2
+
 
 def frobenius_trace_mod_2(curve):
     """
@@ -102,11 +545,16 @@ def frobenius_trace_mod_2(curve):
     A, B = curve.parameters()
 
     defining_polynomial = x**3 + A*x + B
-    rational_characteristic = x**curve.field().size() - x
+    # Reduce modulo the defining polynomial while exponentiating; this
+    # leaves the gcd unchanged and avoids a polynomial of degree q.
+    rational_characteristic = \
+        x.powmod( curve.field().size(), defining_polynomial ) - x
     
     # gcd() returns a gcd, which may have any unit as leading coefficient.
-    # For relatively prime polynomials, the gcd is constant. 
-    if gcd( rational_characteristic, defining_polynomial ).degree() == 0:
+    # For relatively prime polynomials, the gcd is constant.  A vanishing
+    # rational characteristic means that all zeros are rational.
+    if rational_characteristic \
+            and gcd( rational_characteristic, defining_polynomial ).degree() == 0:
         # The rational characteristic and the defining polynomial are
         # relatively prime. Thus there is no rational point of order 2.
         return QuotientRing( Integers, 2 )(1)
@@ -114,8 +562,55 @@ def frobenius_trace_mod_2(curve):
         return QuotientRing( Integers, 2 )(0)
 
 
-from rings.integers.naive import Integers
-from rings.quotients.naive import QuotientRing
+def frobenius_trace_mod_2k(curve, k):
+    """
+    Compute the trace of the Frobenius endomorphism modulo @f$ 2^k @f$.
+    
+    The function lifts the result of frobenius_trace_mod_2() one bit at a
+    time.  If @f$ t \equiv t_0 \pmod{2^{e-1}} @f$, then the candidates
+    modulo @f$ 2^e @f$ are @f$ t_0 @f$ and @f$ t_0 + 2^{e-1} @f$.  They
+    differ by @f$ 2^{e-1} @f$, so the Frobenius equation
+    @f$ \phi^2(P) + qP = t\phi(P) @f$ for a single point @f$ P @f$ of
+    order @f$ 2^e @f$ decides between them.
+    
+    The x-coordinates of the points of order exactly @f$ 2^e @f$ are the
+    zeros of @f$ f_{2^e} / f_{2^{e-1}} @f$, where @f$ f_n = \psi_n / y @f$
+    is the univariate part of the even division polynomial.  The function
+    takes its irreducible factor of least degree (see
+    support.factorization.smallest_factor()) and computes with the
+    implicitly represented points of
+    elliptic_curves.l_torsion_group.naive.ProjectiveTorsionFactor.  All
+    these points are conjugate, so the point formulas never mix cases.  The
+    quotient has degree @f$ 3 \cdot 4^{e-1} / 2 @f$; the factor is often
+    much smaller.
+    
+    @param k   A positive integer.
+    
+    @return    The congruence class of the trace of the Frobenius endomorphism.
+               This is an element of @c QuotientRing( Integers, 2**k ).
+    """
+    trace = frobenius_trace_mod_2( curve ).remainder()
+    q = curve.field().size()
+    Torsion = ProjectiveTorsionFactor( curve )
+    psi = Torsion._division_polynomial_list()
+    
+    for e in range( 2, k+1 ):
+        n = 2**e
+        primitive = psi[ n ].y_factor() // psi[ n//2 ].y_factor()
+        torsion_group = Torsion( n, smallest_factor( primitive ) )
+        point = torsion_group.elements()[0]
+        frobenius_point = torsion_group.frobenius_point( 1 )
+        point_sum = torsion_group.frobenius_point( 2 ) + ( q % n ) * point
+        
+        candidates = [ c for c in [ trace, trace + n//2 ]
+                       if point_sum == c * frobenius_point ]
+        if len( candidates ) != 1:
+            message = "Frobenius equation held for {0} trace candidates"
+            raise ArithmeticError( message.format( len( candidates ) ) )
+        trace = candidates[0]
+    
+    return QuotientRing( Integers, 2**k )( trace )
+
 
 def frobenius_trace_mod_l(torsion_group):
     """
@@ -144,118 +639,283 @@ def frobenius_trace_mod_l(torsion_group):
     #       filter the one candidate that worked for all points in the end.
     #       Luckily, there is only one point.
     for point in torsion_group.elements():
-        frobenius_point = frobenius( point, field_size )
-        frobenius2_point = frobenius( frobenius_point, field_size )
+        # The torsion group caches the Frobenius images of its only point.
+        frobenius_point = torsion_group.frobenius_point( 1 )
+        frobenius2_point = torsion_group.frobenius_point( 2 )
         determinant_point = ( field_size % torsion_group.torsion() ) * point
         
         point_sum = frobenius2_point + determinant_point
         if point_sum.is_infinite():
             return torsion_quotient_ring( 0 )
         
-        trace_point = frobenius_point
-        for trace_candidate in range( 1, (torsion_group.torsion()+1) // 2 ):
-            if point_sum.x() == trace_point.x():
-                if point_sum.y() == trace_point.y():
-                    return torsion_quotient_ring( trace_candidate )
-                else:
-                    return torsion_quotient_ring( -trace_candidate )
-            else:
-                trace_point += frobenius_point
+        # The point comparisons require a z-coordinate that is zero or a
+        # unit.  Every represented point determines the trace, so continue
+        # with the points for which the z-coordinate does not vanish.
+        factor = __unit_factor( point_sum.coordinates()[2] )
+        if factor is not None:
+            Factors = ProjectiveTorsionFactor( torsion_group.curve() )
+            return frobenius_trace_mod_l(
+                        Factors( torsion_group.torsion(), factor )
+                    )
+        
+        trace = multiple_search(
+                    point_sum, frobenius_point, torsion_group.torsion()
+                )
+        if trace is not None:
+            return torsion_quotient_ring( trace )
 
     message = "Frobenius equation held for no trace candidate"
     raise ArithmeticError( message )
 
 
-def frobenius(point, q):
+def multiple_search(point_sum, frobenius_point, torsion):
     """
-    The Frobenius endomorphism @f$ \phi @f$.
+    Return the integer @f$ \tau @f$ with @f$ |\tau| < l/2 @f$ such that
+    @p point_sum is @f$ \tau \cdot @f$ @p frobenius_point, or @c None if
+    there is no such integer; @f$ l @f$ is the @p torsion.
     
-    @return    The point @f$ (x^q, y^q) @f$ if @p point is @f$ (x, y) @f$.
+    The function chooses baby_step_giant_step_trace_search() for torsions
+    from baby_step_giant_step_threshold on, and sequential_trace_search()
+    otherwise.  It also falls back to the sequential search if some
+    z-coordinate shares a factor with the modulus; the sequential search
+    needs no inversions.
     """
-    return point.__class__( point.x() ** q, point.y() ** q )
+    if torsion >= baby_step_giant_step_threshold:
+        try:
+            return baby_step_giant_step_trace_search(
+                        point_sum, frobenius_point, torsion
+                    )
+        except ZeroDivisionError:
+            pass
+    return sequential_trace_search( point_sum, frobenius_point, torsion )
 
 
-from math import ceil, sqrt
+## The smallest torsion for which multiple_search() searches the trace
+#  with baby_step_giant_step_trace_search(); for fewer candidates, the
+#  canonical x-coordinates and the inversion cost more than the saved point
+#  additions.
+baby_step_giant_step_threshold = 47
 
-def hasse_frobenius_trace_range(field):
+
+def sequential_trace_search(point_sum, frobenius_point, torsion):
     """
-    Return the interval in which the trace of the Frobenius endomorphism
-    must reside (using Hasse's theorem).
+    Return the integer @f$ \tau @f$ with @f$ |\tau| < l/2 @f$ such that
+    @p point_sum is @f$ \tau \cdot @f$ @p frobenius_point, or @c None if
+    there is no such integer; @f$ l @f$ is the @p torsion.
     
-    Hasse's theorem gives a limit for the trace @f$ t @f$ of the Frobenius
-    endomorphism on an elliptic curve over a field with  @f$ q @f$ elements:
-    @f$ \left|t\right| \leq 2\sqrt{q} @f$.
+    The function walks through the multiples of @p frobenius_point, which
+    costs @f$ (l-1)/2 @f$ point additions.  It compares complete points so
+    that the search works for any point representation (projective points
+    compare without divisions).
+    """
+    trace_point = frobenius_point
+    for trace_candidate in range( 1, (torsion+1) // 2 ):
+        if point_sum == trace_point:
+            return trace_candidate
+        elif point_sum == -trace_point:
+            return -trace_candidate
+        else:
+            trace_point += frobenius_point
+    return None
+
+
+def baby_step_giant_step_trace_search(point_sum, frobenius_point, torsion):
+    """
+    Return the integer @f$ \tau @f$ with @f$ |\tau| < l/2 @f$ such that
+    @p point_sum is @f$ \tau \cdot @f$ @p frobenius_point, or @c None if
+    there is no such integer; @f$ l @f$ is the @p torsion.
     
-    @return    The interval that must contain the trace of the Frobenius
-               endomorphism according to Hasse's theorem.
+    The function uses baby steps and giant steps: with @f$ \phi = @f$
+    @p frobenius_point and @f$ Q = @f$ @p point_sum, it tabulates the
+    x-coordinates of the baby steps @f$ j\phi @f$ for @f$ 1 \leq j \leq m
+    @f$, and looks up the x-coordinates of the giant steps
+    @f$ Q - i(2m+1)\phi @f$ for @f$ |i| \leq k @f$, where
+    @f$ (2m+1)(2k+1) \geq l @f$.  A match of x-coordinates means
+    @f$ Q - i(2m+1)\phi = \pm j\phi @f$; a point comparison decides the
+    sign.  Thus the search costs @f$ O(\sqrt{l}) @f$ point additions instead
+    of @f$ (l-1)/2 @f$.
+    
+    The table requires canonical, hashable x-coordinates; for projective
+    points @f$ (X : Y : Z) @f$ this is @f$ X/Z @f$.  The function inverts
+    the norms of all @f$ Z @f$ with a single inversion (see
+    support.rings.batch_inverses()).
+    
+    @exception ZeroDivisionError   if a z-coordinate is no unit modulo the
+                                   division polynomial (which then is
+                                   reducible).
     """
-    # This only depends on the field and holds for any curve over it. 
-    l = 2 * ceil( sqrt( field.size() ) )
-    return range( -l, l+1 )
+    half = (torsion - 1) // 2
+    m = max( 1, isqrt( half ) )
+    step = 2*m + 1
+    k = (half + m) // step
+
+    baby_steps = [ frobenius_point ]
+    while len( baby_steps ) < m:
+        baby_steps.append( baby_steps[-1] + frobenius_point )
+    # (2m+1)phi = m*phi + (m+1)*phi costs two additions.
+    giant_step = baby_steps[-1] + ( baby_steps[-1] + frobenius_point )
+
+    giant_steps = [ (0, point_sum) ]
+    forward, backward = point_sum, point_sum
+    for i in range( 1, k+1 ):
+        forward = forward - giant_step
+        backward = backward + giant_step
+        giant_steps += [ (i, forward), (-i, backward) ]
+
+    for i, point in giant_steps:
+        if point.is_infinite():
+            return __symmetric_residue( i * step, torsion )
+
+    table = {}
+    x_coordinates = affine_x_coordinates( baby_steps + [ p for i, p in giant_steps ] )
+    for j, x in enumerate( x_coordinates[ : m ] ):
+        table[ x ] = j + 1
+
+    for (i, point), x in zip( giant_steps, x_coordinates[ m : ] ):
+        j = table.get( x )
+        if j is None:
+            continue
+        if point == baby_steps[ j-1 ]:
+            return __symmetric_residue( i * step + j, torsion )
+        elif point == -baby_steps[ j-1 ]:
+            return __symmetric_residue( i * step - j, torsion )
+    return None
+
+
+def affine_x_coordinates(points):
+    """
+    Return the list of x-coordinates @f$ X/Z @f$ of the projective
+    l-torsion @p points as canonical residue classes.
+    
+    The coordinates are residue classes of polynomials over the curve
+    modulo the (univariate) division polynomial @f$ \psi_l @f$.  A
+    z-coordinate @f$ Z @f$ is a unit if, and only if, its norm
+    @f$ N(Z) = Z \bar{Z} @f$, a polynomial in @f$ x @f$ alone, is a unit
+    modulo @f$ \psi_l @f$; then @f$ X/Z = X \bar{Z} / N(Z) @f$.  The
+    function inverts all norms at once with support.rings.batch_inverses().
+    
+    @exception ZeroDivisionError   if a z-coordinate is no unit.
+    """
+    S = points[0].coordinates()[0].__class__
+    R = S.ring()
+    U = QuotientRing( R.polynomial_ring(), S.modulus().x_factor() )
+
+    z_factors = [ p.coordinates()[2].remainder() for p in points ]
+    inverse_norms = batch_inverses( [ U( z.norm() ) for z in z_factors ] )
 
+    return [ S( p.coordinates()[0].remainder() * z.conjugate()
+                * R( n.remainder(), 0 ) )
+             for p, z, n in zip( points, z_factors, inverse_norms ) ]
 
-from support.primes import primes_range, inverse_primorial
 
-def greedy_prime_factors(n, shunned=0):
+def __unit_factor(z):
     """
-    Return a list of the first primes whose product is greater than, or equal
-    to @p n, but do not use @p shunned.
+    Return the factor of the (univariate) modulus of the residue class
+    @p z whose zeros are exactly the zeros of the modulus at which @p z
+    does not vanish; return @c None if @p z is a unit.  Modulo the factor,
+    @p z is a unit.
     
-    For example, if @p n is 14, then the returned list will consist of 3 and
-    5, but not 2, because 3 times 5 is greater than 14. The function behaves
-    like inverse_primorial() except that it removes unnecessary smaller primes.
+    The residue class @p z is a unit if, and only if, its norm
+    @f$ N(z) = z \bar{z} @f$ is relatively prime to the modulus; see
+    affine_x_coordinates().  The modulus is square-free, so the factor is
+    the modulus divided by the gcd.
     
-    @note      Canceling of unnecessary primes follows a greedy algorithm.
-               Therefore the choice of primes might be suboptimal; perfect
-               choice, however, is an NP-complete problem (KNAPSACK).
+    This function is not intended for direct use.
+    """
+    modulus = z.__class__.modulus().x_factor()
+    common_factor = gcd( z.remainder().norm(), modulus )
+    if common_factor.degree() == 0:
+        return None
+    return modulus // common_factor
+
+
+def __symmetric_residue(n, torsion):
+    """
+    Return the integer @f$ r @f$ with @f$ |r| < l/2 @f$ that is congruent
+    to @p n modulo the odd prime @f$ l = @f$ @p torsion.
+    
+    This function is not intended for direct use.
+    """
+    half = (torsion - 1) // 2
+    return (n + half) % torsion - half
+
+
+def __gaussian_product(u, v):
+    """
+    Return the product of the Gaussian integers @f$ u_0 + u_1 i @f$ and
+    @f$ v_0 + v_1 i @f$ as a pair.
     
-    @note      This function uses primes_range() to obtain a list of primes.
-               See the notes there for use case limitations.
+    This function is not intended for direct use.
     """
-    primes = primes_range( 2, n+1 )
+    return ( u[0]*v[0] - u[1]*v[1], u[0]*v[1] + u[1]*v[0] )
+
+
+def __eisenstein_product(u, v):
+    """
+    Return the product of the Eisenstein integers @f$ u_0 + u_1 \omega @f$
+    and @f$ v_0 + v_1 \omega @f$ as a pair; it is
+    @f$ \omega^2 = -1 - \omega @f$.
     
-    # Find the smallest product of primes that is at least n, but don't use
-    # the shunned prime.
-    product = 1
-    for index, prime in enumerate( primes ):
-        if prime != shunned:
-            product *= prime
-            if product >= n:
-                break
+    This function is not intended for direct use.
+    """
+    return ( u[0]*v[0] - u[1]*v[1], u[0]*v[1] + u[1]*v[0] - u[1]*v[1] )
+
+
+def __trace_moduli(field):
+    """
+    Return the pair @f$ (k, L) @f$ such that the congruences of the trace
+    modulo @f$ 2^k @f$ and the primes in the list @f$ L @f$ determine the
+    trace of the Frobenius endomorphism for curves over the @p field.
     
-    # Throw away excess primes
-    primes = primes[ : index+1 ]
-    if shunned in primes:
-        primes.remove( shunned )
+    This function is not intended for direct use.
+    """
+    search_range = hasse_frobenius_trace_range( field )
     
-    # Try to cancel unnecessary primes, largest first.
-    # (This greedy search is not optimal; however, we did not set out to solve
-    # the KNAPSACK problem, did we?)
-    for index, prime in enumerate( reversed( primes ) ):
-        canceled_product = product / prime
-        if canceled_product >= n:
-            product = canceled_product
-            primes[ -(index+1) ] = 0
+    # To avoid multivariate polynomial arithmetic, make powers of two a
+    # special case; each bit is cheaper than the odd primes it replaces.
+    exponent = min( two_power_exponent, ( len(search_range) - 1 ).bit_length() )
+    torsion_primes = select_torsion_primes(
+                                 -( -len(search_range) // 2**exponent ),
+                                 field.size(),
+                                 field.characteristic()
+                             )
+    return exponent, torsion_primes
+
+
+def hasse_frobenius_trace_range(field):
+    """
+    Return the interval in which the trace of the Frobenius endomorphism
+    must reside (using Hasse's theorem).
     
-    return list( filter( None, primes ) )
+    Hasse's theorem gives a limit for the trace @f$ t @f$ of the Frobenius
+    endomorphism on an elliptic curve over a field with  @f$ q @f$ elements:
+    @f$ \left|t\right| \leq 2\sqrt{q} @f$.
     
+    @return    The interval that must contain the trace of the Frobenius
+               endomorphism according to Hasse's theorem.
+    """
+    # This only depends on the field and holds for any curve over it. 
+    l = 2 * ceil( sqrt( field.size() ) )
+    return range( -l, l+1 )
 
-#------------------------------------------------------------------------------
 
-from fields.finite.naive import FiniteField
-from elliptic_curves.naive import EllipticCurve
+#------------------------------------------------------------------------------
 
 import sys
 from support.running import AlgorithmRunner
+from support.trace_cache import OrderCache
 
-def reduced_computation_schoof_algorithm( p, A, B, output=sys.stdout ):
+def reduced_computation_schoof_algorithm( p, A, B, output=sys.stdout, jobs=1,
+                                         checkpoint=None ):
     p, A, B = int(p), int(A), int(B)
     
     message = "Counting points of y^2 = x^3 + {A}x + {B} over GF<{p}>: "
     print( message.format( p=p, A=A, B=B ), end="", file=output )
     output.flush()
     
-    order = p + 1 - frobenius_trace( EllipticCurve( FiniteField(p), A, B ) )
+    curve = EllipticCurve( FiniteField(p), A, B )
+    trace = frobenius_trace( curve, workers=jobs, checkpoint=checkpoint )
+    order = p + 1 - trace
     print( order, file=output )
     return order
 
@@ -263,7 +923,8 @@ def reduced_computation_schoof_algorithm( p, A, B, output=sys.stdout ):
 if __name__ == "__main__":
     runner = AlgorithmRunner(
                      reduced_computation_schoof_algorithm,
-                     algorithm_version="$Rev$"
+                     algorithm_version="$Rev$",
+                     result_cache=OrderCache
                  ) 
     runner.run()
 
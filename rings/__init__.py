@@ -22,6 +22,8 @@ Ring related classes and functions (ring as in integers).
 @author    Peter Dinges <pdinges@acm.org>
 """
 
+from support.powers import sliding_window_power
+
 class CommutativeRing:
     """
     A base class for elements of commutative rings that provides default
@@ -178,28 +180,42 @@ class CommutativeRing:
         """
         return divmod( other, self )[1]
     
-    def __pow__(self, n):
+    def __pow__(self, n, modulus=None):
         """
         Return @p self taken to the @p n-th power.  The infix operator @c **
-        calls this method; for example:
+        and the built-in function @c pow() call this method; for example:
         @code
         result = self ** n
+        reduced_result = pow( self, n, modulus )
         @endcode
         
-        @note  The implementation uses the most naive by-the-book method for
-               exponentiation: the element is multiplied @p n-1 times with
-               itself.  This is slow (and might skin your cat!).  However, the
-               purpose of this code is to be easy to understand, not fast. 
+        @note  The exponentiation strategy is the static method
+               _power_algorithm(); it defaults to
+               support.powers.sliding_window_power(), which requires
+               @f$ O(\log n) @f$ multiplications.  Derived classes may
+               replace the strategy with any function from support.powers.
         
-        @param n   The exponent; it is expected to be a non-negative integer
-                   type.  Negative integers and floats are unsupported.
+        @param n   The exponent; it is expected to be an integer type.  Negative
+                   exponents require a multiplicative_inverse() method, as in
+                   quotient rings; floats are unsupported.
+        @param modulus If not @c None, then the result and all intermediate
+                       results are reduced modulo @p modulus.
         """
         # This only makes sense for integer arguments.
-        result = self
-        for i in range(1, int(n)):
-            result = result * self
+        n = int(n)
+        if n < 0:
+            if not hasattr( self, "multiplicative_inverse" ):
+                raise ValueError( "negative exponents require units" )
+            return self.multiplicative_inverse().__pow__( -n, modulus )
+        if n == 0:
+            result = self.one()
+            if modulus is not None:
+                result = result % modulus
+            return result
         
-        return result
+        return self._power_algorithm( self, n, modulus )
+    
+    _power_algorithm = staticmethod( sliding_window_power )
 
 
     #- Base Operations (Defined in Derived Classes) ---------------------------
@@ -22,11 +22,15 @@ A naive implementation of polynomial rings with coefficients from a field.
 @author    Peter Dinges <pdinges@acm.org>
 """
 
+import math
+
 from rings import CommutativeRing
 
 from support.types import template
 from support.operators import operand_casting
 from support.profiling import profiling_name, local_method_names
+from support.polynomials import product, PrecomputedDivisor, \
+                                linear_combinations, multiplication_thresholds
 
 @operand_casting
 @local_method_names
@@ -203,6 +207,17 @@ class Polynomials( CommutativeRing, metaclass=template( "_coefficient_field" ) )
         return True
 
 
+    def __hash__(self):
+        """
+        Return a hash value of the polynomial; equal polynomials have equal
+        hashes.  This allows polynomials as dictionary keys, for example
+        in tables of canonical representations.
+        
+        @note  The hash value requires hashable coefficients.
+        """
+        return hash( tuple( self.__coefficients ) )
+
+
     def __add__(self, other):
         """
         Return the sum of @p self and @p other. The infix operator @c + calls
@@ -244,17 +259,16 @@ class Polynomials( CommutativeRing, metaclass=template( "_coefficient_field" ) )
         coefficients: for polynomials @f$ \sum_{k} a_{k}x^{k} @f$ and
         @f$ \sum_{k} b_{k}x^{k} @f$, their product is the polynomial
         @f$ \sum_{k} \sum_{j=0}^{k}(a_{j} + b_{k-j})x^{k} @f$.
+        
+        @note  Large products use Kronecker substitution, Karatsuba, or
+               Toom-3 multiplication instead of the schoolbook convolution;
+               see support.polynomials.product() for the thresholds.  Squares
+               @c p*p pack the coefficients only once.
         """
-        # Initialize result as list of all zeros
         zero = self._coefficient_field.zero()
-        # Add 2 because degrees count from 0.
-        result = [ zero ] * (self.degree() + other.degree() + 2)
-        
-        for i, x in enumerate(self.__coefficients):
-            for j, y in enumerate(other.__coefficients):
-                result[i + j]  +=  x * y 
-        
-        return self.__class__( result )
+        return self.__class__(
+                    product( self.__coefficients, other.__coefficients, zero )
+                )
 
 
     def __divmod__(self, other):
@@ -298,6 +312,115 @@ class Polynomials( CommutativeRing, metaclass=template( "_coefficient_field" ) )
         return sum( [ c * point**i for i, c in enumerate(self.__coefficients) ] )
     
     
+    def powmod(self, exponent, modulus):
+        """
+        Return @p self taken to the @p exponent-th power modulo the polynomial
+        @p modulus.  The built-in function @c pow() with three arguments
+        computes the same result:
+        @code
+        pow( self, exponent, modulus ) == self.powmod( exponent, modulus )
+        @endcode
+        
+        The result is reduced after every multiplication.  Thus all
+        intermediate results have smaller degree than @p modulus, and the
+        method requires @f$ O(\log n) @f$ multiplications of such
+        polynomials.  In contrast, @c (self**exponent) @c % @c modulus first
+        builds a polynomial of degree @f$ n \cdot \deg(\mathtt{self}) @f$.
+        
+        @param exponent    A non-negative integer.
+        @param modulus     A non-zero polynomial.
+        """
+        return self.__pow__( exponent, self.__class__( modulus ) )
+    
+    
+    def compose_mod(self, inner, modulus):
+        """
+        Return the composition of @p self with the polynomial @p inner modulo
+        the polynomial @p modulus: for @f$ f = @f$ @p self, this is
+        @f$ f(g) \bmod m @f$ with @f$ g = @f$ @p inner and @f$ m = @f$
+        @p modulus.  The result is the same as
+        @code
+        self( inner ) % modulus
+        @endcode
+        but it never builds a polynomial of degree @f$ \deg f \cdot \deg g @f$.
+        
+        The method uses the baby-step giant-step algorithm of Brent and Kung.
+        For @f$ k = \lceil \sqrt{\deg f + 1}\,\rceil @f$, it computes the
+        powers @f$ g^0, \ldots, g^k \bmod m @f$ and splits @f$ f @f$ into
+        blocks of @f$ k @f$ coefficients.  The blocks evaluated at @f$ g @f$
+        are linear combinations of the powers (a matrix product; see
+        support.polynomials.linear_combinations()).  Horner's rule in
+        @f$ g^k @f$ combines the blocks.  Thus the method requires about
+        @f$ 2\sqrt{\deg f} @f$ multiplications modulo @f$ m @f$.
+        
+        @param inner       A polynomial.
+        @param modulus     A non-zero polynomial.
+        
+        @see   Brent, R. P., and Kung, H. T., "Fast Algorithms for
+               Manipulating Formal Power Series", Journal of the ACM 25
+               (1978), pp. 581--595
+        """
+        polynomials = self.__class__
+        reduce = polynomials( modulus ).remainder_function()
+        inner = reduce( inner )
+        
+        coefficients = self.__coefficients
+        if len( coefficients ) < 2:
+            return reduce( self )
+        
+        k = math.isqrt( len( coefficients ) - 1 ) + 1
+        powers = [ self.one(), inner ]
+        while len( powers ) <= k:
+            powers.append( reduce( powers[-1] * inner ) )
+        giant_step = powers.pop()
+        
+        zero = self._coefficient_field.zero()
+        blocks = linear_combinations(
+                    [ coefficients[ i : i+k ]
+                      for i in range( 0, len( coefficients ), k ) ],
+                    [ p.__coefficients for p in powers ],
+                    zero
+                )
+        
+        result = polynomials( blocks.pop() )
+        for block in reversed( blocks ):
+            result = reduce( result * giant_step ) + polynomials( block )
+        return result
+    
+    
+    def remainder_function(self):
+        """
+        Return a function that maps polynomials to their remainders modulo
+        @p self; that is, the returned function @c f satisfies
+        @code
+        f( p ) == p % self
+        @endcode
+        for all polynomials @c p.
+        
+        The function divides with support.polynomials.PrecomputedDivisor: it
+        computes the reciprocal of @p self once and then reduces with two
+        multiplications per call.  Callers that repeatedly reduce modulo
+        the same polynomial, such as rings.quotients.naive.QuotientRing,
+        should keep the function instead of using the @c % operator.
+        
+        @note  Below the "division" entry of
+               support.polynomials.multiplication_thresholds, long division
+               is faster; then the function uses the @c % operator.
+        """
+        polynomials = self.__class__
+        if len( self.__coefficients ) < multiplication_thresholds[ "division" ]:
+            return lambda dividend: polynomials( dividend ) % self
+        
+        zero = self._coefficient_field.zero()
+        divisor = PrecomputedDivisor( self.__coefficients, zero )
+        
+        def remainder(dividend):
+            dividend = polynomials( dividend )
+            return polynomials( divisor.divmod( dividend.__coefficients )[1] )
+        
+        return remainder
+    
+    
     #- Class Methods----------------------------------------------------------- 
     
     @classmethod
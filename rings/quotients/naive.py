@@ -107,10 +107,10 @@ class QuotientRing( CommutativeRing, metaclass=template( "_ring", "_modulus" ) )
         if isinstance( representative, self.__class__ ):
             self.__remainder = representative.__remainder
         elif isinstance( representative, self._modulus.__class__ ):
-            self.__remainder = representative % self._modulus
+            self.__remainder = self.__reduce( representative )
         else:
             m = self._modulus
-            self.__remainder = m.__class__( representative ) % m
+            self.__remainder = self.__reduce( m.__class__( representative ) )
 
 
     def remainder(self):
@@ -151,6 +151,16 @@ class QuotientRing( CommutativeRing, metaclass=template( "_ring", "_modulus" ) )
         return self.__remainder == other.remainder()
 
 
+    def __hash__(self):
+        """
+        Return a hash value of the residue class; equal residue classes have
+        equal hashes because their remainders are equal.
+        
+        @note  The hash value requires a hashable source ring().
+        """
+        return hash( self.__remainder )
+
+
     def __add__(self, other):
         """
         Return the sum of @p self and @p other. The infix operator @c + calls
@@ -216,6 +226,58 @@ class QuotientRing( CommutativeRing, metaclass=template( "_ring", "_modulus" ) )
         return other * self.multiplicative_inverse()
     
 
+    def __pow__(self, n, modulus=None):
+        """
+        Return @p self taken to the @p n-th power.  The infix operator @c **
+        and the built-in function @c pow() call this method.
+        
+        The power of a residue class @f$ [x] @f$ is @f$ [x^n] @f$.  The
+        method multiplies residue classes with the _power_algorithm(), so
+        that every intermediate result is reduced modulo modulus() with the
+        precomputed reduction (see __init__()).  Negative exponents yield
+        powers of the multiplicative_inverse().
+        
+        @param modulus If not @c None, then the generic
+                       CommutativeRing.__pow__() computes the power and
+                       reduces all intermediate results modulo @p modulus.
+        
+        @exception ZeroDivisionError   if @p n is negative and @p self is not
+                                       a unit.
+        """
+        if modulus is not None:
+            return CommutativeRing.__pow__( self, n, modulus )
+        n = int(n)
+        if n < 0:
+            return self.multiplicative_inverse() ** -n
+        if n == 0:
+            return self.one()
+        
+        return self._power_algorithm( self, n )
+
+
+    def compose(self, inner):
+        """
+        Return the residue class @f$ [f(g)] @f$, where @f$ f @f$ is the
+        remainder of @p self and @f$ [g] = @f$ @p inner: substitute @p inner
+        for the indeterminate in the remainder of @p self.
+        
+        The source ring must be a polynomial ring; the method uses
+        rings.polynomials.naive.Polynomials.compose_mod().
+        
+        @note  The result is independent of the representative of @p inner.
+               It depends on the representative of @p self, however, unless
+               @f$ m(g) \equiv 0 @f$ for the modulus @f$ m @f$.  An example
+               is the Frobenius map @f$ g = x^q @f$ on the polynomials over
+               the field with @f$ q @f$ elements, where
+               @f$ m(x^q) = m^q @f$.
+        """
+        inner = self.__class__( inner )
+        return self.__class__(
+                    self.__remainder.compose_mod( inner.__remainder,
+                                                  self._modulus )
+                )
+
+
     def multiplicative_inverse(self):
         """
         Return an residue class (QuotientRing element) @c n such that
@@ -232,12 +294,43 @@ class QuotientRing( CommutativeRing, metaclass=template( "_ring", "_modulus" ) )
     
         if gcd == self._ring.one():
             return self.__class__( inverse )
+        elif hasattr( gcd, "degree" ) and gcd.degree() == 0:
+            # Polynomial gcds may have any unit as leading coefficient.
+            unit = gcd.leading_coefficient().multiplicative_inverse()
+            return self.__class__( inverse * unit )
         else:
             message = "element has no inverse: representative and modulus " \
                       "are not relatively prime"
             raise ZeroDivisionError( message ) 
 
 
+    def __reduce(self, representative):
+        """
+        Return the remainder of the source ring element @p representative
+        modulo modulus().
+        
+        If the modulus provides a @c remainder_function() method, as
+        rings.polynomials.naive.Polynomials does, then the class computes
+        that function once, for its first element, and reuses it for all
+        reductions.  This saves the precomputation for every element.
+        Otherwise, the method uses the @c % operator.
+        
+        @note  This method should not be called directly.
+        """
+        cls = self.__class__
+        if cls.__reduction is None:
+            m = self._modulus
+            if hasattr( m, "remainder_function" ):
+                cls.__reduction = m.remainder_function()
+            else:
+                cls.__reduction = lambda x: x % m
+        return cls.__reduction( representative )
+    
+    ## The cached function that reduces source ring elements modulo modulus();
+    #  see __reduce().
+    __reduction = None
+    
+    
     #- Class Methods----------------------------------------------------------- 
     
     @classmethod
@@ -0,0 +1,621 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+An implementation of the Schoof-Elkies-Atkin (SEA) algorithm for counting
+the points of elliptic curves over prime fields.
+
+Schoof's algorithm computes the trace @f$ t @f$ of the Frobenius
+endomorphism modulo small primes @f$ l @f$ in the ring of polynomials
+modulo the division polynomial @f$ \psi_l @f$, which has degree
+@f$ (l^2 - 1)/2 @f$.  The modular polynomial @f$ \Phi_l(X, j) @f$ of degree
+@f$ l+1 @f$ tells whether there is a smaller alternative:
+ - If @f$ \Phi_l(X, j) @f$ has a zero in the field, then @f$ l @f$ is an
+   @em Elkies prime.  The Frobenius endomorphism @f$ \phi @f$ then has an
+   eigenvalue @f$ \lambda @f$ on a subgroup of order @f$ l @f$, the kernel
+   of an l-isogeny.  The kernel polynomial of degree @f$ (l-1)/2 @f$
+   divides @f$ \psi_l @f$ and replaces it in the computation.  The trace
+   is @f$ t \equiv \lambda + q/\lambda \pmod{l} @f$.
+ - Otherwise, @f$ l @f$ is an @em Atkin prime.  The degree @f$ r @f$ of
+   the irreducible factors of @f$ \Phi_l(X, j) @f$ restricts @f$ t @f$ to
+   a small set of candidates modulo @f$ l @f$.  Checking which
+   combination of candidates yields the group order of random points
+   decides.
+
+For the curves with @f$ j \in \{0, 1728\} @f$, the formulas for the kernel
+polynomial break down; the module then uses Schoof's algorithm from
+reduced_computation_schoof.  It also falls back to the division polynomial
+for single primes @f$ l @f$ if the computation of the kernel polynomial
+fails.
+
+@note  The modular polynomials for small primes are bundled with the
+       repository (see elliptic_curves.modular_polynomials.classical); the
+       others are computed when needed, which takes long beyond
+       @f$ l \approx 40 @f$.
+
+@see   Schoof, R., "Counting Points on Elliptic Curves over Finite Fields",
+       Journal de Theorie des Nombres de Bordeaux 7 (1995), pp. 219--254
+@see   Blake, I., Seroussi, G., and Smart, N., "Elliptic Curves in
+       Cryptography", Cambridge University Press, 1999, chapter VII
+
+@package   schoof.sea
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+from elliptic_curves.l_torsion_group.naive import ProjectiveLTorsionGroup, \
+                                                  ProjectiveIsogenyKernel
+from elliptic_curves.modular_polynomials.classical import modular_polynomial
+from elliptic_curves.naive import EllipticCurve
+from rings.integers.naive import Integers
+from rings.polynomials.naive import Polynomials
+from rings.quotients.naive import QuotientRing
+from support.factorization import find_root
+from support.multiples import PrecomputedMultiples
+from support.primes import primes_range
+from support.quotients import solve_congruence_equations, representative_in_range
+from support.quotients import square_root_modulo, inverse_modulo
+from support.rings import gcd
+
+import reduced_computation_schoof
+from reduced_computation_schoof import frobenius_trace_mod_2k, \
+                                       frobenius_trace_mod_l, \
+                                       hasse_frobenius_trace_range, \
+                                       multiple_search, random_point, \
+                                       verify_trace_candidates
+
+def frobenius_trace(curve):
+    """
+    Compute the trace of the Frobenius endomorphism for the given EllipticCurve
+    @p curve.
+
+    The function determines the trace modulo a power of two with
+    reduced_computation_schoof.frobenius_trace_mod_2k(), and the candidates
+    for the trace modulo the odd primes @f$ l = 3, 5, 7, \ldots @f$ with trace_candidates() until
+    their combinations leave at most atkin_candidates_limit candidates in
+    the Hasse interval.  Then it tests the candidates against the orders
+    of random points.  If the primes whose product is the square of the
+    number of candidates do not suffice, then the function falls back to
+    reduced_computation_schoof.frobenius_trace().
+
+    @return    The trace @f$ t @f$ of the Frobenius endomorphism. The number of
+               points on the curve then is @f$ q + 1 - t @f$, where @f$ q @f$
+               is the size of the finite field over which the curve was defined.
+    """
+    field = curve.field()
+    if j_invariant( curve ) in [ field( 0 ), field( 1728 ) ]:
+        return reduced_computation_schoof.frobenius_trace( curve )
+
+    search_range = hasse_frobenius_trace_range( curve.field() )
+    q = curve.field().size()
+
+    congruences = [ frobenius_trace_mod_2k(
+                            curve, reduced_computation_schoof.two_power_exponent
+                        ) ]
+    atkin_congruences = []
+    for l in __odd_primes( search_range ):
+        if l == q:
+            continue
+        candidates = trace_candidates( curve, l )
+        if len( candidates ) == 1:
+            congruences += candidates
+        else:
+            atkin_congruences.append( candidates )
+
+        modulus = 1
+        for congruence in congruences:
+            modulus *= congruence.modulus()
+        for candidates in atkin_congruences:
+            modulus *= candidates[0].modulus()
+
+        combinations = 1
+        for candidates in atkin_congruences:
+            combinations *= len( candidates )
+        candidate_count = combinations * -( -len( search_range ) // modulus )
+
+        if combinations == 1 and modulus >= len( search_range ):
+            trace_congruence = solve_congruence_equations(
+                    congruences + [ c[0] for c in atkin_congruences ]
+                )
+            return representative_in_range( trace_congruence, search_range )
+
+        if candidate_count <= atkin_candidates_limit:
+            trace = match_trace_candidates(
+                        curve, congruences, atkin_congruences, search_range
+                    )
+            if trace is not None:
+                return trace
+
+    # Too many Atkin primes, or the point order tests failed repeatedly.
+    return reduced_computation_schoof.frobenius_trace( curve )
+
+
+## The maximal number of trace candidates that frobenius_trace() checks
+#  with random points.  The check costs about twice the square root of the
+#  number in scalar multiplications; see match_trace_candidates().
+atkin_candidates_limit = 2**16
+
+
+def trace_candidates(curve, l):
+    """
+    Return the list of candidates for the trace of the Frobenius
+    endomorphism of @p curve modulo the odd prime @p l.
+
+    The list has a single element if @p l is an Elkies prime; the function
+    then computes the kernel polynomial with kernel_polynomial(), and the
+    eigenvalue with elkies_trace().  For Atkin primes, the list is
+    atkin_candidates().  If @p l is an Elkies prime, but the kernel
+    polynomial is unavailable (for instance, because @f$ \Phi_l(X, j) @f$
+    has a double zero), then the function falls back to
+    reduced_computation_schoof.frobenius_trace_mod_l().
+
+    @return    A list of congruence classes, that is, elements of
+               @c QuotientRing( Integers, l ).
+    """
+    field = curve.field()
+    q = field.size()
+    R = Polynomials( field )
+    x = R( 0, 1 )
+
+    modular = modular_equation( l, j_invariant( curve ), R )
+    x_q = x.powmod( q, modular )
+    # If all zeros are rational, then x^q - x vanishes modulo the polynomial.
+    if x_q == x:
+        rational_factor = modular
+    else:
+        rational_factor = gcd( x_q - x, modular )
+
+    if rational_factor.degree() > 0:
+        try:
+            isogenous_j = find_root( rational_factor )
+            kernel = kernel_polynomial( curve, l, isogenous_j )
+            return [ elkies_trace( curve, l, kernel ) ]
+        except ArithmeticError:
+            pass
+    else:
+        # Atkin prime: all irreducible factors have the same degree r, the
+        # order of x -> x^q modulo the modular polynomial.
+        x_power = x_q
+        for r in range( 1, l+2 ):
+            if x_power == x:
+                return atkin_candidates( q, l, r )
+            x_power = x_power.compose_mod( x_q, modular )
+
+    return [ frobenius_trace_mod_l( ProjectiveLTorsionGroup( curve )( l ) ) ]
+
+
+def j_invariant(curve):
+    """
+    Return the @f$ j @f$-invariant @f$ 1728 \cdot 4A^3 / (4A^3 + 27B^2) @f$
+    of the elliptic @p curve as element of its field.
+    """
+    A, B = [ curve.field()( c ) for c in curve.parameters() ]
+    return 1728 * 4 * A**3 / ( 4 * A**3 + 27 * B**2 )
+
+
+def modular_equation(l, j, polynomial_ring):
+    """
+    Return the polynomial @f$ \Phi_l(X, j) @f$ as element of
+    @p polynomial_ring, where @f$ \Phi_l @f$ is the classical modular
+    polynomial and @p j is a field element.
+
+    The zeros of @f$ \Phi_l(X, j(E)) @f$ are the @f$ j @f$-invariants of
+    the curves that are l-isogenous to @f$ E @f$.
+    """
+    field = polynomial_ring.coefficient_field()
+    p = field.characteristic()
+    j = field( j ).remainder()
+    powers = [ 1 ]
+    for k in range( l+1 ):
+        powers.append( powers[-1] * j % p )
+    return polynomial_ring( [ field( sum( c * j_k for c, j_k in zip( row, powers ) ) )
+                              for row in modular_polynomial( l ) ] )
+
+
+def kernel_polynomial(curve, l, isogenous_j):
+    """
+    Return the kernel polynomial of the normalized l-isogeny from @p curve
+    to a curve with @f$ j @f$-invariant @p isogenous_j; this is the monic
+    polynomial of degree @f$ (l-1)/2 @f$ whose zeros are the x-coordinates
+    of the finite points in the kernel.
+
+    The derivatives of @f$ \Phi_l @f$ at @f$ (j, \tilde{j}) @f$ determine
+    the coefficients @f$ \tilde{A}, \tilde{B} @f$ of the isogenous curve
+    and the sum @f$ s_1 @f$ of the x-coordinates of the kernel points
+    (Elkies' formulas).  With @f$ E_4 = -A/3 @f$ and @f$ E_6 = -B/2 @f$,
+    they are
+    @f{align*}{
+     j' &= -j E_6 / E_4, &
+     \tilde{j}' &= -j' \Phi_X / (l \Phi_Y), \\
+     \tilde{E}_4 &= \tilde{j}'^2 / \bigl(\tilde{j}(\tilde{j} - 1728)\bigr), &
+     \tilde{E}_6 &= -\tilde{j}'^3 / \bigl(\tilde{j}^2(\tilde{j} - 1728)\bigr), \\
+     \tilde{A} &= -3 l^4 \tilde{E}_4, &
+     \tilde{B} &= -2 l^6 \tilde{E}_6,
+    @f}
+    and @f$ s_1 = -3lJ - \frac{3l}{2}(E_4^2/E_6 - l\tilde{E}_4^2/\tilde{E}_6)
+    - 2l(E_6/E_4 - l\tilde{E}_6/\tilde{E}_4) @f$ with
+    @f$ J = -(j'^2 \Phi_{XX} + 2lj'\tilde{j}'\Phi_{XY}
+    + l^2\tilde{j}'^2\Phi_{YY}) / (j'\Phi_X) @f$.  Vélu's formulas then
+    relate the Laurent coefficients of the Weierstrass functions of the two
+    curves to the power sums of the x-coordinates; Newton's identities
+    yield the polynomial.
+
+    @exception ZeroDivisionError   if the formulas do not apply, for example,
+                                   if @p isogenous_j is a double zero of
+                                   @f$ \Phi_l(X, j) @f$ or in 0 or 1728, or
+                                   if the field characteristic is at most
+                                   @f$ l + 2 @f$.
+    """
+    field = curve.field()
+    A, B = [ field( c ) for c in curve.parameters() ]
+    j = j_invariant( curve )
+    jt = field( isogenous_j )
+
+    phi = modular_polynomial( l )
+    phi_x, phi_y, phi_xx, phi_xy, phi_yy = [
+            __partial_derivative( phi, field, j, jt, dx, dy )
+            for dx, dy in [ (1, 0), (0, 1), (2, 0), (1, 1), (0, 2) ]
+        ]
+
+    e4, e6 = -A / 3, -B / 2
+    dj = -j * e6 / e4
+    djt = -dj * phi_x / ( l * phi_y )
+    e4t = djt**2 / ( jt * (jt - 1728) )
+    e6t = -djt**3 / ( jt**2 * (jt - 1728) )
+    At, Bt = -3 * l**4 * e4t, -2 * l**6 * e6t
+
+    J = -( dj**2 * phi_xx + 2 * l * dj * djt * phi_xy + l**2 * djt**2 * phi_yy ) \
+            / ( dj * phi_x )
+    abscissa_sum = -3 * l * J \
+                   - field( 3 * l ) / 2 * ( e4**2 / e6 - l * e4t**2 / e6t ) \
+                   - 2 * l * ( e6 / e4 - l * e6t / e4t )
+
+    return __kernel_from_power_sums( curve, l, At, Bt, abscissa_sum )
+
+
+def elkies_trace(curve, l, kernel):
+    """
+    Return the trace of the Frobenius endomorphism of @p curve modulo the
+    Elkies prime @p l, given the @p kernel polynomial of an l-isogeny
+    (as returned by kernel_polynomial()).
+
+    The Frobenius endomorphism @f$ \phi @f$ maps the kernel onto itself,
+    so it acts as multiplication with some @f$ \lambda @f$.  The function
+    finds @f$ \lambda @f$ with
+    reduced_computation_schoof.multiple_search() in the ring of polynomials
+    modulo the @p kernel polynomial; the trace then is
+    @f$ \lambda + q/\lambda @f$.
+
+    @exception ArithmeticError     if there is no eigenvalue, that is, if
+                                   the @p kernel is no kernel polynomial.
+
+    @return    The congruence class of the trace; this is an element of
+               @c QuotientRing( Integers, l ).
+    """
+    torsion_group = ProjectiveIsogenyKernel( curve )( l, kernel )
+    point = torsion_group.elements()[0]
+    eigenvalue = multiple_search( torsion_group.frobenius_point(), point, l )
+    if not eigenvalue:
+        raise ArithmeticError( "Frobenius endomorphism has no eigenvalue" )
+
+    Z = QuotientRing( Integers, l )
+    eigenvalue = Z( eigenvalue )
+    return eigenvalue + Z( curve.field().size() ) / eigenvalue
+
+
+def atkin_candidates(q, l, r):
+    """
+    Return the list of candidates for the trace of the Frobenius
+    endomorphism modulo the Atkin prime @p l, given that the irreducible
+    factors of the modular polynomial @f$ \Phi_l(X, j) @f$ have the degree
+    @p r.
+
+    The eigenvalues @f$ \lambda_1, \lambda_2 @f$ of the Frobenius
+    endomorphism on the l-torsion lie in @f$ \mathbb{F}_{l^2} @f$ and their
+    quotient @f$ \gamma @f$ has order @p r.  With
+    @f$ \lambda_1 \lambda_2 = q @f$ and @f$ \lambda_1 + \lambda_2 = t @f$,
+    this means @f$ t^2 = q(\gamma + \gamma^{-1} + 2) @f$.  The function
+    collects the square roots for all @f$ \gamma @f$ of order @p r.
+
+    @return    A list of elements of @c QuotientRing( Integers, l ).
+    """
+    # F_{l^2} = F_l[a] / (a^2 - n) for a non-square n; elements are pairs.
+    n = next( n for n in range( 2, l ) if pow( n, (l-1) // 2, l ) == l-1 )
+    def multiply(u, v):
+        return ( (u[0]*v[0] + n*u[1]*v[1]) % l, (u[0]*v[1] + u[1]*v[0]) % l )
+    def power(u, e):
+        result = (1, 0)
+        while e:
+            if e & 1:
+                result = multiply( result, u )
+            u, e = multiply( u, u ), e >> 1
+        return result
+
+    group_order = l*l - 1
+    prime_divisors = [ s for s in primes_range( 2, l+2 ) if group_order % s == 0 ]
+    generator = next( (a, b) for a in range( l ) for b in range( 1, l )
+                      if all( power( (a, b), group_order // s ) != (1, 0)
+                              for s in prime_divisors ) )
+
+    residues = set()
+    gamma_base = power( generator, group_order // r )
+    for k in range( 1, r ):
+        if gcd( k, r ) != 1:
+            continue
+        gamma = power( gamma_base, k )
+        # gamma + 1/gamma = gamma + conjugate(gamma)/norm(gamma) lies in F_l.
+        inverse = power( gamma, r-1 )
+        square = q * ( gamma[0] + inverse[0] + 2 ) % l
+        try:
+            root = square_root_modulo( square, l )
+        except ValueError:
+            continue
+        residues.update( [ root, -root % l ] )
+
+    Z = QuotientRing( Integers, l )
+    return [ Z( t ) for t in sorted( residues ) ]
+
+
+def match_trace_candidates(curve, congruences, atkin_congruences, search_range):
+    """
+    Return the unique trace candidate in @p search_range that satisfies the
+    @p congruences and one of the candidates from each list in
+    @p atkin_congruences, and that passes the point order test; return
+    @c None if there is no unique candidate.
+
+    The point order test is
+    reduced_computation_schoof.verify_trace_candidates(): a candidate
+    @f$ t @f$ passes if @f$ (q + 1 - t)P @f$ is the point at infinity for
+    a few random points @f$ P @f$.
+
+    The function avoids testing all combinations with Atkin's
+    match-and-sort idea.  By the Chinese remainder theorem, every candidate
+    is @f$ t = b + u + v + kM @f$, where @f$ M @f$ is the product of all
+    moduli, @f$ b @f$ stems from the @p congruences, and @f$ u, v @f$ are
+    sums of contributions from two halves of the @p atkin_congruences.
+    The condition becomes @f$ (q + 1 - b - u)P = (v + kM)P @f$: the function
+    tabulates the left hand sides and looks up the right hand sides.  This
+    costs a scalar multiplication per @f$ u @f$ and per @f$ v @f$ (and a
+    point addition per @f$ k @f$), instead of one per combination.  All
+    multiplications share the doublings of @f$ P @f$ through a
+    support.multiples.PrecomputedMultiples table.
+
+    @note  Small groups with few point orders might leave several candidates;
+           more primes then reduce their number.
+    """
+    q = curve.field().size()
+    exact = solve_congruence_equations( congruences )
+    moduli = [ exact.modulus() ] + [ c[0].modulus() for c in atkin_congruences ]
+    M = 1
+    for m in moduli:
+        M *= m
+
+    def contributions(congruence_lists):
+        # All sums of one CRT contribution from each list, modulo M.
+        sums = [ 0 ]
+        for candidates in congruence_lists:
+            m = candidates[0].modulus()
+            idempotent = (M // m) * inverse_modulo( M // m, m ) % M
+            sums = [ (s + c.remainder() * idempotent) % M
+                     for s in sums for c in candidates ]
+        return sums
+
+    # t = b + u + v + kM lies in the range only for few k, since b, u, v
+    # are remainders modulo M.
+    k_start = search_range[0] // M - 2
+    steps = len( search_range ) // M + 3
+
+    # Balance the table size against the lookups: |U| ~ |V| * steps.
+    first_half, second_half = [], []
+    first_size, second_size = 1, steps
+    for candidates in sorted( atkin_congruences, key=len, reverse=True ):
+        if first_size <= second_size:
+            first_half.append( candidates )
+            first_size *= len( candidates )
+        else:
+            second_half.append( candidates )
+            second_size *= len( candidates )
+
+    base = contributions( [ [ exact ] ] )[0]
+    point = random_point( curve )
+    if point is None:
+        # Only the point at infinity: the order is 1.
+        return q if q in search_range else None
+    multiples = PrecomputedMultiples( point )
+    table = {}
+    for u in contributions( first_half ):
+        key = __point_key( multiples( q + 1 - base - u ) )
+        table.setdefault( key, [] ).append( u )
+
+    step_point = multiples( M )
+    candidates = set()
+    for v in contributions( second_half ):
+        giant_point = multiples( v + k_start * M )
+        for k in range( k_start, k_start + steps + 1 ):
+            for u in table.get( __point_key( giant_point ), [] ):
+                trace = base + u + v + k*M
+                if trace in search_range:
+                    candidates.add( trace )
+            giant_point = giant_point + step_point
+
+    return verify_trace_candidates( curve, candidates )
+
+
+#- Auxiliary Functions --------------------------------------------------------
+
+def __odd_primes(search_range):
+    """
+    Return the list of the smallest odd primes whose product is at least the
+    square of the number of trace candidates in @p search_range.
+
+    Elkies primes determine the trace modulo @f$ l @f$; Atkin primes leave
+    several candidates.  The square leaves room for about as many Atkin
+    primes as Elkies primes.
+
+    This function is not intended for direct use.
+    """
+    target = len( search_range )**2
+    primes, product = [], 1
+    # The product of the primes below n is about e^n.
+    for l in primes_range( 3, 2 * target.bit_length() + 16 ):
+        if product >= target:
+            break
+        primes.append( l )
+        product *= l
+    return primes
+
+
+def __point_key(point):
+    """
+    Return a hashable key of the @p point: its coordinate remainders, or
+    @c None for the point at infinity.
+
+    This function is not intended for direct use.
+    """
+    if point.is_infinite():
+        return None
+    return ( point.x().remainder(), point.y().remainder() )
+
+
+def __partial_derivative(phi, field, x, y, dx, dy):
+    """
+    Return the partial derivative @f$ \partial^{dx+dy} \Phi /
+    \partial X^{dx} \partial Y^{dy} @f$ of the modular polynomial with the
+    coefficients @p phi at the point @f$ (x, y) @f$.
+
+    This function is not intended for direct use.
+    """
+    p = field.characteristic()
+    x, y = field( x ).remainder(), field( y ).remainder()
+    total = 0
+    for i, row in enumerate( phi ):
+        if i < dx:
+            continue
+        factor_i = 1
+        for s in range( dx ):
+            factor_i *= i - s
+        x_power = pow( x, i - dx, p )
+        for k, c in enumerate( row ):
+            if k < dy or not c:
+                continue
+            factor_k = 1
+            for s in range( dy ):
+                factor_k *= k - s
+            total += c * factor_i * factor_k * x_power * pow( y, k - dy, p )
+    return field( total )
+
+
+def __kernel_from_power_sums(curve, l, At, Bt, abscissa_sum):
+    """
+    Return the kernel polynomial of the normalized l-isogeny from @p curve
+    to @f$ y^2 = x^3 + \tilde{A}x + \tilde{B} @f$, given the sum of the
+    x-coordinates @f$ s_1 @f$ of the kernel points.
+
+    The Weierstrass functions @f$ \wp(z) = z^{-2} + \sum_k c_k z^{2k} @f$ of
+    the curves differ by @f$ \sum_Q (\wp(z + Q) - \wp(Q)) @f$, where
+    @f$ Q @f$ runs through the finite kernel points (Vélu).  Comparing
+    coefficients gives @f$ \tilde{c}_k - c_k = 2 \sum_i P_k(x_i) / (2k)! @f$
+    with the polynomials @f$ P_k @f$ that express
+    @f$ \wp^{(2k)} = P_k(\wp) @f$.  The power sums
+    @f$ s_m = \sum_i x_i^m @f$ follow successively.
+
+    This function is not intended for direct use.
+    """
+    field = curve.field()
+    A, B = [ field( c ) for c in curve.parameters() ]
+    d = (l - 1) // 2
+    R = Polynomials( field )
+
+    def laurent_coefficients(a, b):
+        c = [ None, -a / 5, -b / 7 ]
+        for k in range( 3, d ):
+            total = sum( [ c[h] * c[k-1-h] for h in range( 1, k-1 ) ], field.zero() )
+            c.append( 3 * total / ( (k-2) * (2*k + 3) ) )
+        return c
+
+    c, ct = laurent_coefficients( A, B ), laurent_coefficients( At, Bt )
+
+    # P_1 = 6x^2 + 2A; P_{k+1} = P_k'' * 4(x^3 + Ax + B) + P_k' * (6x^2 + 2A)
+    curve_equation = R( 4*B, 4*A, 0, 4 )
+    second_derivative = R( 2*A, 0, 6 )
+    P = second_derivative
+    power_sums = [ field( d ), abscissa_sum ]
+    factorial = field( 2 )
+    for k in range( 1, d ):
+        coefficients = P.coefficients()
+        known = sum( [ a * s for a, s in zip( coefficients, power_sums ) ],
+                     field.zero() )
+        target = ( ct[k] - c[k] ) * factorial / 2
+        power_sums.append( ( target - known ) / coefficients[-1] )
+
+        derivative = __derivative( P )
+        P = __derivative( derivative ) * curve_equation \
+                + derivative * second_derivative
+        factorial *= (2*k + 1) * (2*k + 2)
+
+    # Newton's identities: k e_k = sum_{i=1}^{k} (-1)^(i-1) e_{k-i} s_i
+    elementary = [ field.one() ]
+    for k in range( 1, d+1 ):
+        total = field.zero()
+        for i in range( 1, k+1 ):
+            term = elementary[ k-i ] * power_sums[i]
+            total += term if i % 2 else -term
+        elementary.append( total / k )
+
+    return R( [ e if k % 2 == 0 else -e
+                for k, e in reversed( list( enumerate( elementary ) ) ) ] )
+
+
+def __derivative(polynomial):
+    """
+    Return the formal derivative of the @p polynomial.
+
+    This function is not intended for direct use.
+    """
+    coefficients = polynomial.coefficients()
+    return polynomial.__class__( [ k * c for k, c in enumerate( coefficients ) ][ 1: ]
+                                 or [ 0 ] )
+
+
+#------------------------------------------------------------------------------
+
+from fields.finite.compact import FiniteField
+
+import sys
+from support.running import AlgorithmRunner
+from support.trace_cache import OrderCache
+
+def sea_schoof_algorithm( p, A, B, output=sys.stdout ):
+    p, A, B = int(p), int(A), int(B)
+
+    message = "Counting points of y^2 = x^3 + {A}x + {B} over GF<{p}>: "
+    print( message.format( p=p, A=A, B=B ), end="", file=output )
+    output.flush()
+
+    curve = EllipticCurve( FiniteField(p), A, B )
+    trace = frobenius_trace( curve )
+    order = p + 1 - trace
+    print( order, file=output )
+    return order
+
+
+if __name__ == "__main__":
+    runner = AlgorithmRunner(
+                     sea_schoof_algorithm,
+                     algorithm_version="$Rev$",
+                     result_cache=OrderCache
+                 )
+    runner.run()
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Factorization of polynomials over finite prime fields with the algorithm
+of Cantor and Zassenhaus.
+
+The algorithm has two stages.  The distinct-degree factorization splits a
+square-free polynomial into products of irreducible factors of equal
+degree; it uses that @f$ x^{p^d} - x @f$ is the product of all monic
+irreducible polynomials whose degree divides @f$ d @f$.  The equal-degree
+factorization then splits these products with gcds of random polynomials
+of the form @f$ a^{(p^d - 1)/2} - 1 @f$, which share about half of the
+factors with the product.
+
+All functions work with rings.polynomials.naive.Polynomials over
+@c FiniteField(p) for odd primes @f$ p @f$; they rely on the fast
+exponentiation in rings.quotients.naive.QuotientRing, the composition
+modulo polynomials (Polynomials.compose_mod()), and the gcd from
+support.rings.
+
+@see   von zur Gathen, J., and Gerhard, J., "Modern Computer Algebra",
+       second edition, Cambridge University Press, 2003, chapter 14
+
+@package   support.factorization
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+import random
+
+from rings.quotients.naive import QuotientRing
+from support.rings import gcd
+
+def distinct_degree_factorization(polynomial):
+    """
+    Return the list of pairs @f$ (d, g_d) @f$ such that @f$ g_d @f$ is the
+    (monic) product of all irreducible factors of degree @f$ d @f$ of the
+    square-free @p polynomial.  The list is sorted by degree and contains
+    only the degrees that occur.
+
+    The function computes @f$ h_d = x^{p^d} @f$ modulo the remaining
+    polynomial @f$ f @f$; the gcd of @f$ h_d - x @f$ and @f$ f @f$ collects
+    the factors of degree @f$ d @f$.  The first power comes from
+    exponentiation in the quotient ring, the following from composition
+    with it: @f$ h_{d+1} = h_d(x^p) @f$.  The search stops as soon as the
+    remaining polynomial has degree below @f$ 2(d+1) @f$, since it is
+    irreducible then.
+
+    @note  The input must be square-free; otherwise, the factors of
+           repeated irreducible factors remain incomplete.  Use
+           square_free_part() if necessary.
+
+    @exception ValueError  if @p polynomial is constant.
+    """
+    return list( __distinct_degree_factors( polynomial ) )
+
+
+def smallest_factor(polynomial):
+    """
+    Return a monic irreducible factor of least degree of the square-free
+    @p polynomial.
+
+    The function stops the distinct-degree factorization at the first
+    degree that occurs and splits the product like find_root(): it
+    continues only with the smaller factor after every split.
+
+    @exception ValueError  if @p polynomial is constant.
+    """
+    degree, f = next( __distinct_degree_factors( polynomial ) )
+    while f.degree() > degree:
+        factor = __split( f, degree )
+        cofactor = f // factor
+        f = factor if factor.degree() <= cofactor.degree() else cofactor
+    return f
+
+
+def equal_degree_factorization(polynomial, degree):
+    """
+    Return the list of monic irreducible factors of the square-free
+    @p polynomial, all of whose irreducible factors have the given
+    @p degree.
+
+    The function splits the polynomial with the gcd of
+    @f$ a^{(p^d - 1)/2} - 1 @f$ for random polynomials @f$ a @f$; every
+    attempt splits with probability at least one half.  It then recurses
+    into both factors.
+
+    @exception ValueError  if the characteristic of the coefficient field is
+                           two, or if the degree of the @p polynomial is
+                           not a multiple of @p degree.
+    """
+    if polynomial.degree() % degree:
+        raise ValueError( "polynomial degree must be a multiple of the degree" )
+
+    polynomials = polynomial.__class__
+    p = polynomials.coefficient_field().characteristic()
+    if p == 2:
+        raise ValueError( "factorization requires odd characteristic" )
+
+    pending = [ __monic( polynomial ) ]
+    factors = []
+    while pending:
+        f = pending.pop()
+        if f.degree() <= degree:
+            factors.append( f )
+            continue
+        factor = __split( f, degree )
+        pending += [ factor, f // factor ]
+    return factors
+
+
+def square_free_part(polynomial):
+    """
+    Return the monic product of the distinct irreducible factors of the
+    @p polynomial, that is, the polynomial divided by its gcd with the
+    derivative.
+
+    @note  The derivative vanishes for polynomials in @f$ x^p @f$, so the
+           result is correct only if the degree of @p polynomial is smaller
+           than the characteristic; for the fields of this project, that
+           is always the case.
+    """
+    polynomials = polynomial.__class__
+    coefficients = polynomial.coefficients()
+    derivative = polynomials( [ k * c for k, c in enumerate( coefficients ) ][ 1: ]
+                              or [ 0 ] )
+    if not derivative:
+        return __monic( polynomial )
+    return __monic( polynomial // gcd( polynomial, derivative ) )
+
+
+def factor(polynomial):
+    """
+    Return the list of monic irreducible factors of the @p polynomial
+    without multiplicities, sorted by degree.
+
+    The function combines square_free_part(), distinct_degree_factorization(),
+    and equal_degree_factorization().
+    """
+    factors = []
+    for degree, product in distinct_degree_factorization(
+                                        square_free_part( polynomial ) ):
+        factors += equal_degree_factorization( product, degree )
+    return factors
+
+
+def roots(polynomial):
+    """
+    Return the list of distinct zeros of the @p polynomial in its
+    coefficient field.
+
+    The gcd of @f$ x^p - x @f$ and the @p polynomial is the product of its
+    distinct linear factors; equal_degree_factorization() splits it.
+    """
+    rational_part = __rational_part( polynomial )
+    if rational_part.degree() < 1:
+        return []
+    return [ -f.coefficients()[0]
+             for f in equal_degree_factorization( rational_part, 1 ) ]
+
+
+def find_root(polynomial):
+    """
+    Return a single zero of the @p polynomial in its coefficient field.
+
+    Like roots(), the function starts with the product of the distinct
+    linear factors.  Instead of splitting it completely, it continues only
+    with the smaller factor after every split; thus the cost is about that
+    of the first split.
+
+    @exception ValueError  if the @p polynomial has no zero in the field.
+    """
+    f = __rational_part( polynomial )
+    if f.degree() < 1:
+        raise ValueError( "polynomial has no zero in the coefficient field" )
+    while f.degree() > 1:
+        factor = __split( f, 1 )
+        cofactor = f // factor
+        f = factor if factor.degree() <= cofactor.degree() else cofactor
+    return -f.coefficients()[0]
+
+
+#- Auxiliary Functions --------------------------------------------------------
+
+def __distinct_degree_factors(polynomial):
+    """
+    Iterate over the pairs of distinct_degree_factorization(); compute each
+    pair only on request.
+
+    This function is not intended for direct use.
+    """
+    if polynomial.degree() < 1:
+        raise ValueError( "constant polynomials have no factors" )
+
+    polynomials = polynomial.__class__
+    p = polynomials.coefficient_field().characteristic()
+    x = polynomials( 0, 1 )
+
+    remaining = __monic( polynomial )
+    x_p = ( QuotientRing( polynomials, remaining )( x ) ** p ).remainder()
+    h = x_p
+    d = 1
+    while remaining.degree() >= 2*d:
+        # If h = x, then all remaining factors have degree d.
+        if h == x:
+            factor = remaining
+        else:
+            factor = __monic( gcd( h - x, remaining ) )
+        if factor.degree() > 0:
+            yield ( d, factor )
+            remaining = remaining // factor
+            h = h % remaining
+            x_p = x_p % remaining
+        d += 1
+        if remaining.degree() >= 2*d:
+            h = h.compose_mod( x_p, remaining )
+
+    if remaining.degree() > 0:
+        yield ( remaining.degree(), remaining )
+
+
+def __monic(polynomial):
+    """
+    Return the @p polynomial divided by its leading coefficient.
+
+    This function is not intended for direct use.
+    """
+    leading_coefficient = polynomial.leading_coefficient()
+    return polynomial.__class__( [ c / leading_coefficient
+                                   for c in polynomial.coefficients() ] )
+
+
+def __rational_part(polynomial):
+    """
+    Return the monic gcd of @f$ x^p - x @f$ and the @p polynomial, the
+    product of its distinct linear factors.
+
+    This function is not intended for direct use.
+    """
+    if polynomial.degree() < 1:
+        raise ValueError( "constant polynomials have no zeros" )
+
+    polynomials = polynomial.__class__
+    p = polynomials.coefficient_field().characteristic()
+    x = polynomials( 0, 1 )
+    difference = ( QuotientRing( polynomials, polynomial )( x ) ** p ).remainder() - x
+    if not difference:
+        # All zeros are rational; only the multiplicities must go.
+        return square_free_part( polynomial )
+    return __monic( gcd( difference, polynomial ) )
+
+
+def __split(polynomial, degree):
+    """
+    Return a proper monic factor of the square-free @p polynomial of degree
+    greater than @p degree whose irreducible factors all have the given
+    @p degree.
+
+    This function is not intended for direct use.
+    """
+    polynomials = polynomial.__class__
+    field = polynomials.coefficient_field()
+    p = field.characteristic()
+    exponent = ( p**degree - 1 ) // 2
+    one = polynomials.one()
+    S = QuotientRing( polynomials, polynomial )
+    while True:
+        a = polynomials( [ field( random.randrange( p ) )
+                           for i in range( polynomial.degree() ) ] )
+        if a.degree() < 1:
+            continue
+        difference = ( S( a ) ** exponent ).remainder() - one
+        if not difference:
+            continue
+        factor = gcd( difference, polynomial )
+        if 0 < factor.degree() < polynomial.degree():
+            return __monic( factor )
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Scalar multiplication algorithms for elements of additive groups, such as
+points on elliptic curves.
+
+The functions in this module compute @f$ nP @f$ with @f$ O(\log n) @f$ group
+operations.  They only require the @p point to support the @c + operator and
+negation with the unary @c - operator.  The functions share a common
+signature
+@code
+multiplication_algorithm( point, n )
+@endcode
+so that they can serve as multiplication strategy of
+elliptic_curves.naive.EllipticCurve.  Since negation is cheap on elliptic
+curves, signed digit representations of @f$ n @f$ (non-adjacent forms) save
+additions compared to the plain binary representation.
+
+@see   Hankerson, D., Menezes, A. J., and Vanstone, S., "Guide to Elliptic
+       Curve Cryptography", Springer 2004, section 3.3
+
+@package   support.multiples
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+def double_and_add_multiple(point, n):
+    """
+    Return the @p n-th multiple of @p point; scan the binary representation
+    of @p n from the most significant to the least significant bit.
+
+    @param point   The group element to multiply.
+    @param n       A positive integer.
+
+    @exception ValueError  if @p n is not positive.
+    """
+    __check_factor( n )
+
+    result = point
+    # Skip the '0b' prefix and the leading one bit.
+    for bit in bin( n )[3:]:
+        result = result + result
+        if bit == "1":
+            result = result + point
+
+    return result
+
+
+def naf_multiple(point, n):
+    """
+    Return the @p n-th multiple of @p point; use the non-adjacent form (NAF)
+    of @p n.
+
+    The NAF has digits -1, 0, and 1, and no two adjacent digits are non-zero.
+    On average, only a third of the digits is non-zero, compared to half of
+    the digits in the binary representation.
+
+    @see   double_and_add_multiple() for a description of the parameters.
+    """
+    return wnaf_multiple( point, n, 2 )
+
+
+def wnaf_multiple(point, n, width=None):
+    """
+    Return the @p n-th multiple of @p point; use the width-@f$ w @f$
+    non-adjacent form (wNAF) of @p n.
+
+    The method precomputes the odd multiples @f$ P, 3P, \ldots,
+    (2^{w-1} - 1)P @f$.  Afterwards, every digit costs one doubling; only
+    about one in @f$ w+1 @f$ digits costs an additional addition.
+
+    @param width   The width @f$ w \geq 2 @f$ of the NAF.  The default
+                   (@c None) chooses the width according to the length
+                   of @p n.
+
+    @see   double_and_add_multiple() for a description of the other
+           parameters.
+    """
+    __check_factor( n )
+    if width is None:
+        width = __naf_width( n.bit_length() )
+
+    odd_multiples = __odd_multiples( point, 2**(width - 2) )
+    digits = naf_digits( n, width )
+
+    result = __signed_multiple( odd_multiples, digits.pop() )
+    for digit in reversed( digits ):
+        result = result + result
+        if digit:
+            result = result + __signed_multiple( odd_multiples, digit )
+
+    return result
+
+
+def naf_digits(n, width=2):
+    """
+    Return the width-@p width non-adjacent form of the non-negative integer
+    @p n as list of digits, least significant digit first.
+
+    Every non-zero digit @f$ d @f$ is odd and satisfies
+    @f$ |d| < 2^{w-1} @f$; of any @f$ w @f$ consecutive digits, at most one is
+    non-zero.  The digits @f$ d_i @f$ represent @f$ n = \sum_i d_i 2^i @f$.
+    The default width 2 yields the ordinary non-adjacent form.
+
+    @exception ValueError  if @p width is smaller than 2.
+    """
+    if width < 2:
+        raise ValueError( "NAF width must be at least 2" )
+
+    modulus = 2**width
+    digits = []
+    while n > 0:
+        if n & 1:
+            digit = n % modulus
+            if digit >= modulus // 2:
+                digit -= modulus
+            n -= digit
+        else:
+            digit = 0
+        digits.append( digit )
+        n >>= 1
+
+    return digits
+
+
+class PrecomputedMultiples:
+    """
+    A table of the multiples @f$ 2^i P @f$ of a fixed point @f$ P @f$ for
+    points that are multiplied repeatedly with different factors.
+
+    Use it, for example, as follows:
+    @code
+    multiples = PrecomputedMultiples( P )
+    multiples(5) == 5 * P      # This is true
+    multiples(-3) == -3 * P    # So is this
+    @endcode
+
+    The table grows on demand.  Once it covers the bit length of @f$ n @f$,
+    the computation of @f$ nP @f$ requires no doublings: it sums (or
+    subtracts) the table entries for the non-zero digits of the NAF of
+    @f$ n @f$.
+    """
+
+    def __init__(self, point):
+        """
+        Construct a new table of multiples of @p point.
+        """
+        self.__point = point
+        self.__doublings = [ point ]
+
+
+    def point(self):
+        """
+        Return the point whose multiples the table contains.
+        """
+        return self.__point
+
+
+    def __call__(self, n):
+        """
+        Return the @p n-th multiple of point().
+
+        @param n   An integer; zero yields @c 0 * point() and negative factors
+                   yield multiples of @c -point().
+        """
+        n = int(n)
+        if n == 0:
+            return 0 * self.__point
+        if n < 0:
+            return -self( -n )
+
+        digits = naf_digits( n )
+        while len( self.__doublings ) < len( digits ):
+            last = self.__doublings[-1]
+            self.__doublings.append( last + last )
+
+        result = None
+        for digit, multiple in zip( digits, self.__doublings ):
+            if not digit:
+                continue
+            if digit < 0:
+                multiple = -multiple
+            if result is None:
+                result = multiple
+            else:
+                result = result + multiple
+
+        return result
+
+
+#- Auxiliary Functions --------------------------------------------------------
+
+def __check_factor(n):
+    """
+    Raise a ValueError if @p n is not a positive integer.
+
+    This function is not intended for direct use.
+    """
+    if n < 1:
+        raise ValueError( "factor must be a positive integer" )
+
+
+def __odd_multiples(point, count):
+    """
+    Return the list @f$ [P, 3P, \ldots, (2 \cdot count - 1)P] @f$.
+
+    This function is not intended for direct use.
+    """
+    multiples = [ point ]
+    if count > 1:
+        double = point + point
+        for i in range( 1, count ):
+            multiples.append( multiples[-1] + double )
+    return multiples
+
+
+def __signed_multiple(odd_multiples, digit):
+    """
+    Return the multiple of the point for the odd, possibly negative @p digit.
+
+    This function is not intended for direct use.
+    """
+    if digit > 0:
+        return odd_multiples[ digit // 2 ]
+    else:
+        return -odd_multiples[ -digit // 2 ]
+
+
+def __naf_width(bit_length):
+    """
+    Return a NAF width that balances precomputation and additions for
+    factors with @p bit_length bits.
+
+    This function is not intended for direct use.
+    """
+    # Width w costs 2^(w-2) precomputed additions and n/(w+1) further ones.
+    for width, bound in [ (2, 24), (3, 40), (4, 120), (5, 336) ]:
+        if bit_length <= bound:
+            return width
+    return 6
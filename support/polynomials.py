@@ -0,0 +1,549 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Multiplication algorithms for polynomials given as lists of coefficients.
+
+All functions in this module operate on coefficient lists in ascending
+order (the constant coefficient first), as returned by
+rings.polynomials.naive.Polynomials.coefficients().  The coefficients must
+support the ring operations @c +, @c -, and @c *.  The entry point is
+product(); it selects the algorithm by the length of the factors:
+- kronecker_product() above the Kronecker threshold, provided the
+  coefficients come from a prime field (such as
+  fields.finite.naive.FiniteField);
+- otherwise schoolbook_product() below the Karatsuba threshold,
+- karatsuba_product() up to the Toom-3 threshold, and
+- toom3_product() above it, provided the coefficients come from a field
+  whose characteristic is neither 2 nor 3.
+
+Use set_multiplication_thresholds() to tune the crossover points for a
+machine; the program tools/calibrate_multiplication.py measures them.
+
+Repeated divisions by the same polynomial reduce to multiplications with a
+PrecomputedDivisor, which stores the reciprocal() of the divisor.
+
+@see   Knuth, D. E., "The Art of Computer Programming", volume 2, second
+       edition, section 4.3.3; and Bodrato, M., "Towards Optimal Toom-Cook
+       Multiplication for Univariate and Multivariate Polynomials in
+       Characteristic 2 and 0", WAIFI 2007; and Harvey, D., "Faster
+       Polynomial Multiplication via Multipoint Kronecker Substitution",
+       Journal of Symbolic Computation 44 (2009), pp. 1502--1510
+
+@package   support.polynomials
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+## The minimal number of coefficients of the shorter factor for each
+#  multiplication algorithm; product() uses the fastest applicable one.  The
+#  entry "division" is the minimal number of coefficients of a divisor for
+#  which repeated divisions should use a PrecomputedDivisor.
+multiplication_thresholds = {
+    "kronecker": 4,
+    "karatsuba": 16,
+    "toom3": 32,
+    "division": 8,
+}
+
+
+def set_multiplication_thresholds(karatsuba=None, toom3=None, kronecker=None,
+                                  division=None):
+    """
+    Set the minimal number of coefficients that the shorter factor needs for
+    product() to use Karatsuba, Toom-3, or Kronecker multiplication, and
+    that a divisor needs for division with a PrecomputedDivisor.
+    Arguments that are @c None leave the respective threshold unchanged.
+
+    @return    The dictionary of previous thresholds; passing it as keyword
+               arguments restores them.
+
+    @exception ValueError  if a threshold is smaller than 2.
+    """
+    previous = dict( multiplication_thresholds )
+    for name, value in [ ("karatsuba", karatsuba),
+                         ("toom3", toom3),
+                         ("kronecker", kronecker),
+                         ("division", division) ]:
+        if value is None:
+            continue
+        if value < 2:
+            raise ValueError( "multiplication thresholds must be at least 2" )
+        multiplication_thresholds[ name ] = int( value )
+    return previous
+
+
+def product(a, b, zero):
+    """
+    Return the coefficient list of the product of the polynomials with
+    coefficient lists @p a and @p b.
+
+    The function chooses the multiplication algorithm according to the
+    multiplication_thresholds and the coefficient field; see the module
+    description.
+
+    @note  The choice of kronecker_product() deliberately ignores the size
+           of the coefficients.  Its cost grows with the bit length of
+           @f$ p @f$ just like the cost of the other algorithms; measured
+           with fields.finite.compact.FiniteField, it is faster from about
+           four coefficients on for all fields from 4 to 4423 bits, and
+           two to eleven times faster than toom3_product() for 32 to 128
+           coefficients.
+
+    @param a       A list of coefficients in ascending order.
+    @param b       A list of coefficients in ascending order.
+    @param zero    The zero element of the coefficients; it is the filler
+                   for otherwise empty positions.
+    """
+    if min( len(a), len(b) ) >= multiplication_thresholds[ "kronecker" ] \
+            and __allows_kronecker( zero ):
+        return kronecker_product( a, b, zero )
+    return __product( a, b, zero, __allows_toom3( zero ) )
+
+
+def schoolbook_product(a, b, zero):
+    """
+    Return the coefficient list of the product of @p a and @p b; use the
+    convolution of the coefficients with @f$ O(mn) @f$ multiplications.
+
+    @see   product() for a description of the parameters.
+    """
+    if not a or not b:
+        return []
+
+    result = [ zero ] * (len(a) + len(b) - 1)
+    for i, x in enumerate( a ):
+        for j, y in enumerate( b ):
+            result[ i + j ] += x * y
+    return result
+
+
+def karatsuba_product(a, b, zero):
+    """
+    Return the coefficient list of the product of @p a and @p b; use
+    Karatsuba's method that replaces four half-size products by three.
+    The recursion uses product() for the partial products.
+
+    @see   product() for a description of the parameters.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) < 2:
+        return schoolbook_product( a, b, zero )
+
+    toom3 = __allows_toom3( zero )
+    m = (len(a) + 1) // 2
+    a0, a1 = a[ : m ], a[ m : ]
+    b0, b1 = b[ : m ], b[ m : ]
+    if not b1:
+        return __combine( [ __product( a0, b, zero, toom3 ),
+                            __product( a1, b, zero, toom3 ) ], m, zero )
+
+    z0 = __product( a0, b0, zero, toom3 )
+    z2 = __product( a1, b1, zero, toom3 )
+    z1 = __product( __add( a0, a1, zero ), __add( b0, b1, zero ), zero, toom3 )
+    z1 = __subtract( __subtract( z1, z0, zero ), z2, zero )
+
+    return __combine( [ z0, z1, z2 ], m, zero )
+
+
+def toom3_product(a, b, zero):
+    """
+    Return the coefficient list of the product of @p a and @p b; use the
+    Toom-3 method that replaces nine third-size products by five.  The
+    recursion uses product() for the partial products.
+
+    The method evaluates the factors at @f$ 0, 1, -1, -2, \infty @f$ and
+    interpolates the product with Bodrato's sequence, which divides by 2 and
+    3.  Therefore the coefficients must come from a field of characteristic
+    greater than 3.
+
+    @see   product() for a description of the parameters.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    k = (len(a) + 2) // 3
+    if len(b) <= 2 * k:
+        # The factors are too unbalanced for a three-way split.
+        return karatsuba_product( a, b, zero )
+
+    two = zero + 2
+    half = two.multiplicative_inverse()
+    third = (zero + 3).multiplicative_inverse()
+
+    a0, a1, a2 = a[ : k ], a[ k : 2*k ], a[ 2*k : ]
+    b0, b1, b2 = b[ : k ], b[ k : 2*k ], b[ 2*k : ]
+
+    # Evaluation
+    values = []
+    for p0, p1, p2 in [ (a0, a1, a2), (b0, b1, b2) ]:
+        p02 = __add( p0, p2, zero )
+        at_one = __add( p02, p1, zero )
+        at_minus_one = __subtract( p02, p1, zero )
+        at_minus_two = __subtract(
+                            __scale( __add( at_minus_one, p2, zero ), two ),
+                            p0,
+                            zero
+                        )
+        values.append( [ p0, at_one, at_minus_one, at_minus_two, p2 ] )
+
+    r0, r1, r_1, r_2, r_inf = [ __product( x, y, zero, True )
+                                for x, y in zip( *values ) ]
+
+    # Interpolation
+    c3 = __scale( __subtract( r_2, r1, zero ), third )
+    c1 = __scale( __subtract( r1, r_1, zero ), half )
+    c2 = __subtract( r_1, r0, zero )
+    c3 = __add( __scale( __subtract( c2, c3, zero ), half ),
+                __scale( r_inf, two ), zero )
+    c2 = __subtract( __add( c2, c1, zero ), r_inf, zero )
+    c1 = __subtract( c1, c3, zero )
+
+    return __combine( [ r0, c1, c2, c3, r_inf ], k, zero )
+
+
+def kronecker_product(a, b, zero):
+    """
+    Return the coefficient list of the product of @p a and @p b; use
+    Kronecker substitution, which reduces the polynomial product to a single
+    product of (big) integers.
+
+    The function packs the coefficient remainders into integers, one slot
+    of @f$ k @f$ bits per coefficient; that is, it evaluates the polynomials
+    at @f$ 2^k @f$.  The slots are wide enough to hold the coefficients of
+    the integer product of the polynomials without carries, so that
+    unpacking the integer product and reducing the slots modulo @f$ p @f$
+    yields the coefficients of the product.  The integer multiplication runs
+    in compiled code (with Karatsuba's method for large numbers).  If @p a
+    and @p b are the same list, then the function squares the packed integer.
+
+    @note  The coefficients must be elements of a prime field: they must
+           provide the methods @c remainder() and @c characteristic(), and
+           their class must accept integers.
+
+    @see   product() for a description of the parameters.
+    """
+    if not a or not b:
+        return []
+
+    p = zero.characteristic()
+    length = len(a) + len(b) - 1
+    # Every product coefficient is a sum of at most min(len(a), len(b))
+    # products of remainders smaller than p.
+    bound = min( len(a), len(b) ) * (p - 1)**2
+    slot_bytes = (bound.bit_length() + 8) // 8
+
+    packed_a = __pack( a, slot_bytes )
+    if a is b:
+        packed_product = packed_a * packed_a
+    else:
+        packed_product = packed_a * __pack( b, slot_bytes )
+
+    field = zero.__class__
+    data = packed_product.to_bytes( length * slot_bytes, "little" )
+    return [ field( int.from_bytes( data[ i : i+slot_bytes ], "little" ) % p )
+             for i in range( 0, length * slot_bytes, slot_bytes ) ]
+
+
+def linear_combinations(rows, vectors, zero):
+    """
+    Return the list of linear combinations @f$ \sum_j r_j v_j @f$ of the
+    coefficient lists @f$ v_j @f$ in @p vectors, one for each list of
+    scalars @f$ (r_j) @f$ in @p rows; that is, return the matrix product of
+    @p rows and @p vectors.  Missing entries count as zero.
+
+    For coefficients from a prime field, the function packs each vector
+    into an integer with carry-free slots, as kronecker_product() does.
+    Then every linear combination is a sum of integer multiples of the packed
+    vectors, which runs in compiled code.  This is the matrix product in
+    the modular composition of Brent and Kung.
+
+    @param rows        A list of lists of scalars (coefficients).
+    @param vectors     A list of coefficient lists.
+
+    @see   product() for a description of the other parameters.
+    """
+    if not vectors or not rows:
+        return [ [] for row in rows ]
+    length = max( [ len(v) for v in vectors ] )
+
+    if not __allows_kronecker( zero ):
+        combinations = []
+        for row in rows:
+            combination = [ zero ] * length
+            for scalar, vector in zip( row, vectors ):
+                if not scalar:
+                    continue
+                for i, c in enumerate( vector ):
+                    combination[i] += scalar * c
+            combinations.append( combination )
+        return combinations
+
+    p = zero.characteristic()
+    bound = min( len(vectors), max( [ len(row) for row in rows ] ) ) * (p - 1)**2
+    slot_bytes = (bound.bit_length() + 8) // 8
+    packed_vectors = [ __pack( v, slot_bytes ) for v in vectors ]
+
+    field = zero.__class__
+    combinations = []
+    for row in rows:
+        packed = sum( [ s.remainder() * v for s, v in zip( row, packed_vectors ) ] )
+        data = packed.to_bytes( length * slot_bytes, "little" )
+        combinations.append(
+            [ field( int.from_bytes( data[ i : i+slot_bytes ], "little" ) % p )
+              for i in range( 0, length * slot_bytes, slot_bytes ) ]
+        )
+    return combinations
+
+
+def reciprocal(series, precision, zero, start=None):
+    """
+    Return the first @p precision coefficients of the power series inverse
+    of @p series: the coefficient list of the polynomial @f$ g @f$ of degree
+    less than @f$ k = @f$ @p precision such that @f$ f g \equiv 1
+    \pmod{x^k} @f$, where @f$ f @f$ is the polynomial with coefficient list
+    @p series.
+
+    The function uses Newton iteration @f$ g \leftarrow g (2 - f g) @f$,
+    which doubles the number of correct coefficients in every step.  Thus
+    the inverse costs a constant number of products of length
+    @f$ k @f$; with fast multiplication, this is sub-quadratic.
+
+    @param series      A list of coefficients in ascending order; the
+                       constant coefficient must be a unit.
+    @param precision   The number of coefficients to compute.
+    @param start       The result of a previous call with smaller
+                       precision; the iteration continues from there.  The
+                       default (@c None) starts from scratch.
+
+    @see   product() for a description of the other parameters.
+    """
+    if start:
+        inverse = list( start )
+    else:
+        inverse = [ (zero + 1) / series[0] ]
+
+    while len( inverse ) < precision:
+        known = len( inverse )
+        length = min( 2 * known, precision )
+        # The error e = fg - 1 vanishes below x^known; the new coefficients
+        # of g - ge are those of -g (e / x^known).
+        error = product( series[ : length ], inverse, zero )[ known : length ]
+        correction = product( inverse[ : length - known ], error, zero )
+        inverse += [ -c for c in correction[ : length - known ] ]
+        inverse += [ zero ] * (length - len( inverse ))
+
+    return inverse
+
+
+class PrecomputedDivisor:
+    """
+    A divisor polynomial with precomputed reciprocal for repeated divisions
+    with remainder by the same polynomial, for instance, the reductions
+    modulo the polynomial that defines a quotient ring.
+
+    Use it, for example, as follows:
+    @code
+    divisor = PrecomputedDivisor( b, zero )
+    quotient, remainder = divisor.divmod( a )
+    @endcode
+
+    The division of @f$ a @f$ by @f$ b @f$ with @f$ \deg a = m + n @f$ and
+    @f$ \deg b = n @f$ reverses the coefficient lists: the reversed quotient
+    is the product of the reversed @f$ a @f$ with the power series inverse
+    of the reversed @f$ b @f$, modulo @f$ x^{m+1} @f$.  The remainder is
+    @f$ a - qb @f$ (Barrett reduction).  Therefore every division costs two
+    multiplications once the reciprocal() is known.  The reciprocal grows
+    on demand if a dividend requires more precision.
+
+    @see   von zur Gathen, J., and Gerhard, J., "Modern Computer Algebra",
+           second edition, Cambridge University Press 2003, section 9.1
+    """
+
+    def __init__(self, divisor, zero):
+        """
+        Construct a new divisor from the coefficient list @p divisor; the
+        leading coefficient must be a unit.  The reciprocal has enough
+        precision for dividends of less than twice the length of
+        @p divisor.
+
+        @see   product() for a description of the parameters.
+        """
+        self.__divisor = list( divisor )
+        self.__reversed_divisor = self.__divisor[ ::-1 ]
+        self.__zero = zero
+        self.__reciprocal = reciprocal(
+                                self.__reversed_divisor,
+                                max( 1, len( self.__divisor ) - 1 ),
+                                zero
+                            )
+
+
+    def divisor(self):
+        """
+        Return the coefficient list of the divisor.
+        """
+        return self.__divisor
+
+
+    def divmod(self, dividend):
+        """
+        Return the coefficient lists of the quotient and remainder of the
+        polynomial with coefficient list @p dividend divided by divisor().
+        """
+        n = len( self.__divisor ) - 1
+        if len( dividend ) <= n:
+            return [], list( dividend )
+
+        zero = self.__zero
+        k = len( dividend ) - n
+        if len( self.__reciprocal ) < k:
+            self.__reciprocal = reciprocal(
+                                    self.__reversed_divisor,
+                                    k,
+                                    zero,
+                                    self.__reciprocal
+                                )
+
+        reversed_quotient = product(
+                                dividend[ n : ][ ::-1 ],
+                                self.__reciprocal[ : k ],
+                                zero
+                            )[ : k ]
+        quotient = reversed_quotient[ ::-1 ]
+
+        # Only the coefficients below the divisor degree are non-zero.
+        low_product = product( quotient[ : n ], self.__divisor[ : n ], zero )
+        low_product += [ zero ] * (n - len( low_product ))
+        remainder = [ x - y for x, y in zip( dividend[ : n ], low_product ) ]
+        return quotient, remainder
+
+
+#- Auxiliary Functions --------------------------------------------------------
+
+def __pack(coefficients, slot_bytes):
+    """
+    Return the integer whose @p slot_bytes wide slots (least significant
+    first) contain the remainders of the @p coefficients.
+
+    This function is not intended for direct use.
+    """
+    return int.from_bytes(
+                b"".join( [ c.remainder().to_bytes( slot_bytes, "little" )
+                            for c in coefficients ] ),
+                "little"
+            )
+
+
+def __allows_kronecker(zero):
+    """
+    Test whether the coefficients belong to a prime field whose elements
+    provide their integer remainders.
+
+    This function is not intended for direct use.
+    """
+    try:
+        return zero.power() == 1 \
+                and isinstance( zero.remainder(), int ) \
+                and zero.characteristic() > 1
+    except AttributeError:
+        return False
+
+
+def __product(a, b, zero, toom3):
+    """
+    Return the product of @p a and @p b; choose the algorithm according to
+    the thresholds.  Use Toom-3 only if @p toom3 is @c True.
+
+    This function is not intended for direct use.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    n = len(b)
+    if n < multiplication_thresholds[ "karatsuba" ]:
+        return schoolbook_product( a, b, zero )
+
+    if len(a) >= 2 * n:
+        # Unbalanced factors: multiply blocks of the longer factor.
+        blocks = [ __product( a[ i : i+n ], b, zero, toom3 )
+                   for i in range( 0, len(a), n ) ]
+        return __combine( blocks, n, zero )
+
+    if toom3 and n >= multiplication_thresholds[ "toom3" ]:
+        return toom3_product( a, b, zero )
+    return karatsuba_product( a, b, zero )
+
+
+def __allows_toom3(zero):
+    """
+    Test whether the coefficients belong to a field whose characteristic is
+    neither 2 nor 3; Toom-3 interpolation requires division by 2 and 3.
+
+    This function is not intended for direct use.
+    """
+    try:
+        return zero.characteristic() > 3 \
+                and hasattr( zero, "multiplicative_inverse" )
+    except AttributeError:
+        return False
+
+
+def __add(a, b, zero):
+    """
+    Return the coefficient-wise sum of @p a and @p b.
+
+    This function is not intended for direct use.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    return [ x + y for x, y in zip( a, b ) ] + a[ len(b) : ]
+
+
+def __subtract(a, b, zero):
+    """
+    Return the coefficient-wise difference of @p a and @p b.
+
+    This function is not intended for direct use.
+    """
+    if len(a) >= len(b):
+        return [ x - y for x, y in zip( a, b ) ] + a[ len(b) : ]
+    else:
+        return [ x - y for x, y in zip( a, b ) ] + [ -y for y in b[ len(a) : ] ]
+
+
+def __scale(a, factor):
+    """
+    Return the list @p a with all coefficients multiplied by @p factor.
+
+    This function is not intended for direct use.
+    """
+    return [ x * factor for x in a ]
+
+
+def __combine(parts, shift, zero):
+    """
+    Return the sum of the polynomials @f$ p_i x^{i \cdot shift} @f$, where
+    @f$ p_i @f$ are the coefficient lists in @p parts.
+
+    This function is not intended for direct use.
+    """
+    length = max( [ i * shift + len(part) for i, part in enumerate( parts ) ] )
+    result = [ zero ] * length
+    for i, part in enumerate( parts ):
+        offset = i * shift
+        for j, x in enumerate( part ):
+            result[ offset + j ] += x
+    return result
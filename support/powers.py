@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Exponentiation algorithms for elements of rings and fields.
+
+All functions in this module compute @f$ b^n @f$ with @f$ O(\log n) @f$
+multiplications.  They only require the @p base to support the @c * operator;
+if a @p modulus is given, then every intermediate result is reduced with the
+@c % operator.  The functions share a common signature
+@code
+power_algorithm( base, exponent, modulus=None )
+@endcode
+so that they can serve as exponentiation strategy of rings.CommutativeRing
+and fields.Field.  For example, to make a polynomial ring use right-to-left
+exponentiation, derive a class from it:
+@code
+R = rings.polynomials.naive.Polynomials( fields.finite.naive.FiniteField(7) )
+class RightToLeftR(R):
+    _power_algorithm = staticmethod( right_to_left_power )
+@endcode
+
+@note  The strategy must be a plain function; the class decorator
+       support.profiling.local_method_names() copies it like a method.
+@note  Do not assign the strategy to @c R itself: equal template
+       specializations are the same class object (see
+       support.types.specialization_cache_info()), so the assignment would
+       change the exponentiation of every other user of @c R as well.
+
+@see   Knuth, D. E., "The Art of Computer Programming", volume 2, second
+       edition, section 4.6.3; and Menezes, A. J., van Oorschot, P. C., and
+       Vanstone, S. A., "Handbook of Applied Cryptography", section 14.6.1
+
+@package   support.powers
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+def left_to_right_power(base, exponent, modulus=None):
+    """
+    Return @p base taken to the @p exponent-th power; use binary
+    exponentiation that scans the exponent bits from the most significant to
+    the least significant bit (square-and-multiply).
+
+    @param base        The element to exponentiate.
+    @param exponent    A positive integer.
+    @param modulus     If not @c None, then all intermediate results are
+                       reduced modulo @p modulus.
+
+    @exception ValueError  if @p exponent is not positive.
+    """
+    __check_exponent( exponent )
+    base = __reduced( base, modulus )
+
+    result = base
+    # Skip the '0b' prefix and the leading one bit.
+    for bit in bin( exponent )[3:]:
+        result = __reduced( result * result, modulus )
+        if bit == "1":
+            result = __reduced( result * base, modulus )
+
+    return result
+
+
+def right_to_left_power(base, exponent, modulus=None):
+    """
+    Return @p base taken to the @p exponent-th power; use binary
+    exponentiation that scans the exponent bits from the least significant to
+    the most significant bit.
+
+    @see   left_to_right_power() for a description of the parameters.
+    """
+    __check_exponent( exponent )
+    square = __reduced( base, modulus )
+
+    result = None
+    while exponent:
+        if exponent & 1:
+            if result is None:
+                result = square
+            else:
+                result = __reduced( result * square, modulus )
+        exponent >>= 1
+        if exponent:
+            square = __reduced( square * square, modulus )
+
+    return result
+
+
+def k_ary_power(base, exponent, modulus=None, window_size=4):
+    """
+    Return @p base taken to the @p exponent-th power; use the @f$ 2^k @f$-ary
+    method that processes the exponent in digits of @p window_size bits.
+
+    The method precomputes the powers @f$ b^1, \ldots, b^{2^k - 1} @f$;
+    afterwards every digit costs @f$ k @f$ squarings and at most one
+    multiplication.
+
+    @param window_size The number @f$ k @f$ of exponent bits per digit.
+
+    @see   left_to_right_power() for a description of the other parameters.
+    """
+    __check_exponent( exponent )
+    base = __reduced( base, modulus )
+
+    digit_count = 2**window_size
+    table = [ None, base ]
+    for i in range( 2, digit_count ):
+        table.append( __reduced( table[-1] * base, modulus ) )
+
+    digits = []
+    while exponent:
+        exponent, digit = divmod( exponent, digit_count )
+        digits.append( digit )
+
+    result = table[ digits.pop() ]
+    for digit in reversed( digits ):
+        for i in range( window_size ):
+            result = __reduced( result * result, modulus )
+        if digit:
+            result = __reduced( result * table[ digit ], modulus )
+
+    return result
+
+
+def sliding_window_power(base, exponent, modulus=None, window_size=None):
+    """
+    Return @p base taken to the @p exponent-th power; use the sliding window
+    method.
+
+    The method precomputes the odd powers @f$ b^1, b^3, \ldots, b^{2^k - 1} @f$
+    and then scans the exponent from the most significant bit.  Runs of zero
+    bits cost one squaring each; windows of at most @f$ k @f$ bits that end
+    in a one bit cost one multiplication.  This is the default exponentiation
+    strategy of rings.CommutativeRing and fields.Field.
+
+    @param window_size The maximal number @f$ k @f$ of bits per window.  The
+                       default (@c None) chooses the size according to the
+                       length of the @p exponent.
+
+    @see   left_to_right_power() for a description of the other parameters.
+    """
+    __check_exponent( exponent )
+    base = __reduced( base, modulus )
+
+    bits = bin( exponent )[2:]
+    if window_size is None:
+        window_size = __window_size( len(bits) )
+
+    odd_powers = [ base ]
+    if window_size > 1:
+        square = __reduced( base * base, modulus )
+        for i in range( 1, 2**(window_size - 1) ):
+            odd_powers.append( __reduced( odd_powers[-1] * square, modulus ) )
+
+    result = None
+    i = 0
+    while i < len(bits):
+        if bits[i] == "0":
+            # The leading bit is a one; thus result is set at this point.
+            result = __reduced( result * result, modulus )
+            i += 1
+        else:
+            # Find the longest window of at most window_size bits that ends
+            # with a one bit.
+            j = min( i + window_size, len(bits) )
+            while bits[ j-1 ] == "0":
+                j -= 1
+            window_power = odd_powers[ int( bits[ i : j ], 2 ) // 2 ]
+
+            if result is None:
+                result = window_power
+            else:
+                for k in range( i, j ):
+                    result = __reduced( result * result, modulus )
+                result = __reduced( result * window_power, modulus )
+            i = j
+
+    return result
+
+
+#- Auxiliary Functions --------------------------------------------------------
+
+def __check_exponent(exponent):
+    """
+    Raise a ValueError if @p exponent is not a positive integer.
+
+    This function is not intended for direct use.
+    """
+    if exponent < 1:
+        raise ValueError( "exponent must be a positive integer" )
+
+
+def __reduced(element, modulus):
+    """
+    Return @p element modulo @p modulus, or @p element itself if @p modulus
+    is @c None.
+
+    This function is not intended for direct use.
+    """
+    if modulus is None:
+        return element
+    return element % modulus
+
+
+def __window_size(bit_length):
+    """
+    Return a window size for sliding window exponentiation that balances
+    precomputation and multiplications for exponents with @p bit_length bits.
+
+    This function is not intended for direct use.
+    """
+    # Thresholds from the Handbook of Applied Cryptography, table 14.16
+    for size, bound in [ (1, 8), (2, 24), (3, 80), (4, 240), (5, 672) ]:
+        if bit_length <= bound:
+            return size
+    return 6
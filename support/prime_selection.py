@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+Selection of the torsion primes for Schoof's algorithm by a cost model.
+
+Schoof's algorithm needs primes @f$ l @f$ whose product exceeds the length
+of the Hasse interval.  The smallest primes are not necessarily the
+cheapest choice: the effort for @f$ l @f$ grows much faster than the
+information @f$ \log l @f$ it yields, and dropping a small prime
+sometimes allows a cheaper combination.  The module predicts the time for
+a prime @f$ l @f$ over the field with @f$ q @f$ elements as
+@f[
+ c \cdot l^e \cdot \log_2 q,
+@f]
+where the coefficient @f$ c @f$ and the exponent @f$ e @f$ come from
+cost_model.  The program tools/calibrate_prime_costs.py measures them for
+a machine; set_cost_model() installs them.  select_torsion_primes() then
+solves the covering problem exactly.
+
+@package   support.prime_selection
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+from math import log, log2
+
+## The parameters of the predicted time (in seconds) for computing the
+#  trace modulo a prime; see torsion_prime_cost().  The defaults stem from
+#  tools/calibrate_prime_costs.py for 61-bit fields.
+cost_model = {
+    "coefficient": 1.4e-5,
+    "exponent": 2.5,
+}
+
+
+def set_cost_model(coefficient=None, exponent=None):
+    """
+    Set the parameters of the cost model; omitted parameters keep their
+    value.
+
+    @return    The dictionary of previous parameters; pass it to the
+               function as keyword arguments to restore them.
+
+    @exception ValueError  if a parameter is not positive.
+    """
+    previous = dict( cost_model )
+    for name, value in [ ("coefficient", coefficient), ("exponent", exponent) ]:
+        if value is None:
+            continue
+        if value <= 0:
+            raise ValueError( "cost model parameters must be positive" )
+        cost_model[ name ] = float( value )
+    return previous
+
+
+def torsion_prime_cost(l, q):
+    """
+    Return the predicted time in seconds for computing the trace of the
+    Frobenius endomorphism modulo the prime @p l on a curve over the field
+    with @p q elements.
+    """
+    return cost_model[ "coefficient" ] * l**cost_model[ "exponent" ] * log2( q )
+
+
+def select_torsion_primes(n, q, shunned=0, smallest=3):
+    """
+    Return the sorted list of primes from @p smallest on, without
+    @p shunned, whose product is at least @p n and whose total predicted
+    cost (see torsion_prime_cost()) is minimal.
+
+    The function solves the covering problem exactly with branch and bound.
+    The first solution is the set of the smallest primes; its cost bounds
+    the candidates, since no solution contains a prime that alone costs
+    more.  The search includes or excludes the candidates in ascending
+    order.  It prunes a branch if the cost so far plus a lower bound for
+    the rest exceeds the best solution: the missing information
+    @f$ \log(n / \prod l) @f$ times the least cost per information among
+    the remaining candidates.  Unlike a sieve up to @p n, the search stays
+    cheap for large @p n.
+
+    @param n       The bound for the product; for Schoof's algorithm, the
+                   length of the Hasse interval divided by the modulus of
+                   the known congruences.
+    @param q       The size of the field.
+    """
+    if n <= 1:
+        return []
+
+    candidates = []
+    product, best_cost = 1, 0.0
+    for l in __primes( smallest ):
+        if l == shunned:
+            continue
+        candidates.append( l )
+        product *= l
+        best_cost += torsion_prime_cost( l, q )
+        if product >= n:
+            break
+    best = list( candidates )
+
+    # Larger primes qualify while they alone cost less than the best solution.
+    for l in __primes( candidates[-1] + 1 ):
+        if torsion_prime_cost( l, q ) >= best_cost:
+            break
+        if l != shunned:
+            candidates.append( l )
+
+    costs = [ torsion_prime_cost( l, q ) for l in candidates ]
+    # ratios[i] is the least cost per information among candidates[i:].
+    ratios = [ c / log( l ) for l, c in zip( candidates, costs ) ]
+    for i in range( len( ratios ) - 2, -1, -1 ):
+        ratios[i] = min( ratios[i], ratios[i+1] )
+
+    def search(index, chosen, product, cost):
+        nonlocal best, best_cost
+        if product >= n:
+            if cost < best_cost:
+                best, best_cost = list( chosen ), cost
+            return
+        if index == len( candidates ):
+            return
+        if cost + log( n / product ) * ratios[ index ] >= best_cost:
+            return
+
+        chosen.append( candidates[ index ] )
+        search( index+1, chosen, product * candidates[ index ],
+                cost + costs[ index ] )
+        chosen.pop()
+        search( index+1, chosen, product, cost )
+
+    search( 0, [], 1, 0.0 )
+    return sorted( best )
+
+
+#- Auxiliary Functions --------------------------------------------------------
+
+def __primes(lower_bound):
+    """
+    Iterate over the primes from @p lower_bound on in ascending order; test
+    each number by trial division.
+
+    This function is not intended for direct use.
+    """
+    n = max( 2, int( lower_bound ) )
+    while True:
+        if all( n % d for d in range( 2, int( n**0.5 ) + 1 ) ):
+            yield n
+        n += 1
@@ -78,3 +78,46 @@ def inverse_primorial(n, shunned = 0):
                 return prime
     # Return the smallest prime if n is too small
     return 2
+
+
+import random
+
+def is_probable_prime(n, rounds=20):
+    """
+    Test whether the integer @p n is a prime with the Miller-Rabin test.
+    
+    The function first tries the primes below 50 as witnesses, which
+    decides the question for all @f$ n < 3.3 \cdot 10^{24} @f$; for larger
+    @p n, it additionally tries @p rounds random witnesses.  A composite
+    number then passes with probability at most @f$ 4^{-rounds} @f$.
+    
+    @return    @c False if @p n is composite; @c True if @p n is (probably)
+               a prime.
+    """
+    small_primes = primes_range( 2, 50 )
+    if n < 2:
+        return False
+    for prime in small_primes:
+        if n % prime == 0:
+            return n == prime
+    
+    # Write n - 1 = 2^s * d with odd d.
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    
+    witnesses = list( small_primes )
+    if n >= 3317044064679887385961981:
+        witnesses += [ random.randrange( 2, n - 1 ) for i in range( rounds ) ]
+    
+    for a in witnesses:
+        x = pow( a, d, n )
+        if x == 1 or x == n - 1:
+            continue
+        for i in range( s - 1 ):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
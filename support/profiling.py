@@ -152,22 +152,12 @@ def rename_function( function, name, filename=None, firstlineno=-1 ):
     if firstlineno == -1:
         firstlineno = code.co_firstlineno
     
-    renamed_code = types.CodeType(
-                      code.co_argcount,
-                      code.co_kwonlyargcount,
-                      code.co_nlocals,
-                      code.co_stacksize,
-                      code.co_flags,
-                      code.co_code,
-                      code.co_consts,
-                      code.co_names,
-                      code.co_varnames,
-                      str( filename ),
-                      str( name ),
-                      int( firstlineno ),
-                      code.co_lnotab,
-                      code.co_freevars,
-                      code.co_cellvars
+    # CodeType.replace() (Python 3.8+) copies all remaining fields; the
+    # positional CodeType constructor changes with every Python release.
+    renamed_code = code.replace(
+                      co_filename = str( filename ),
+                      co_name = str( name ),
+                      co_firstlineno = int( firstlineno )
                   )
 
     function.__name__ = str( name )
@@ -261,23 +251,7 @@ def __copy_function( function ):
         function = function.__func__
 
     code = function.__code__
-    code_copy = types.CodeType(
-                      code.co_argcount,
-                      code.co_kwonlyargcount,
-                      code.co_nlocals,
-                      code.co_stacksize,
-                      code.co_flags,
-                      code.co_code,
-                      code.co_consts,
-                      code.co_names,
-                      code.co_varnames,
-                      code.co_filename,
-                      code.co_name,
-                      code.co_firstlineno,
-                      code.co_lnotab,
-                      code.co_freevars,
-                      code.co_cellvars
-                  )
+    code_copy = code.replace()
     
     function_copy = types.FunctionType(
                           code_copy,
@@ -56,10 +56,25 @@ def representative_in_range( quotient_class, valid_range ):
         raise ValueError("no solution")
 
 
-#------------------------------------------------------------------------------ 
+def representatives_in_range( quotient_class, valid_range ):
+    """
+    Return all representatives of @p quotient_class in @p valid_range as a
+    range() object; its length is the number of representatives.  For
+    example, the representatives of @c (3 mod 7) in @c range(0, 20) are
+    @c range(3, 20, 7), that is, 3, 10, and 17.
+    
+    @param     quotient_class  A QuotientClass over the Integers.
+    @param     valid_range     The range() object describing the interval
+                               that contains the returned representatives.
+    
+    @see       representative_in_range()
+    """
+    m = quotient_class.modulus()
+    first = valid_range[0] + ( quotient_class.remainder() - valid_range[0] ) % m
+    return range( first, valid_range[-1] + 1, m )
 
-from functools import reduce
-from operator import mul
+
+#------------------------------------------------------------------------------ 
 
 from rings.integers.naive import Integers
 from rings.quotients.naive import QuotientRing
@@ -73,21 +88,25 @@ def solve_congruence_equations( congruences ):
     
     All representatives of the returned congruence have the remainders of
     @p congruences when taken modulo the respective moduli. The result is a
-    congruence modulo the product of all moduli. Thus the function returns a
-    number @f$ z \mod \prod_{i} m_i @f$ such that
+    congruence modulo the least common multiple of all moduli. Thus the
+    function returns a number @f$ z \mod \mathrm{lcm}( m_1, \ldots, m_k ) @f$
+    such that
     @f{align*}{
      z &\equiv a_1 \mod m_1 \\
      \vdots \\
      z &\equiv a_k \mod m_k
     @f}
     
-    @note The moduli @f$ m_i @f$ of all congruences must be relatively prime.
+    The moduli need not be relatively prime; the congruences then must agree
+    modulo the common divisors.  For example, @c (1 mod 4) and @c (3 mod 6)
+    yield @c (9 mod 12), whereas @c (1 mod 4) and @c (2 mod 6) have no
+    common solution.
+    
+    @exception ValueError      if @p congruences is empty or has no common
+                               solution.
     
-    @exception ValueError      if @p congruences is empty.
-
     @param     congruences     An iterable of objects of QuotientClass over the
-                               Integers. Every pair of two different moduli
-                               must have a greatest common divisor (gcd()) of 1.
+                               Integers.
     
     @return    An instance of rings.quotients.naive.QuotientRing over the
                rings.integers.naive.Integers solving the @p congruences.
@@ -97,21 +116,22 @@ def solve_congruence_equations( congruences ):
     # The Chinese remainder theorem
     if not congruences:
         raise ValueError( "cannot solve empty equation system" )
-        
-    if __debug__:
-        # This test is expensive; remove it in optimized execution
-        pairs = [ (c1, c2) for c1 in congruences for c2 in congruences if c1 != c2 ]
-        pairwise_gcds = [ gcd( c1.modulus(), c2.modulus() ) for c1, c2 in pairs ]
-    
-        assert set( pairwise_gcds ) == set([ 1 ]), \
-            "the Chinese Remainder Theorem requires relatively prime moduli"
     
-    common_modulus = reduce( mul, [ c.modulus() for c in congruences ] )
+    # Add one congruence (a mod n) at a time to the solution (z mod m):
+    # z + k*m solves both if k*m/d == (a - z)/d modulo n/d for d = gcd(m, n).
+    common_modulus = 1
     common_representative = 0
     for c in congruences:
-        neutralizer = common_modulus // c.modulus()
-        common_representative += c.remainder() * neutralizer  \
-                                    * inverse_modulo( neutralizer, c.modulus() )
+        divisor = gcd( common_modulus, c.modulus() )
+        difference = c.remainder() - common_representative
+        if difference % divisor:
+            raise ValueError( "the congruences have no common solution" )
+    
+        step = c.modulus() // divisor
+        k = ( difference // divisor ) \
+                * inverse_modulo( common_modulus // divisor, step ) % step
+        common_representative += k * common_modulus
+        common_modulus *= step
     
     quotient_ring = QuotientRing( Integers, common_modulus )
     return quotient_ring( common_representative )
@@ -139,3 +159,79 @@ def inverse_modulo(representative, modulus):
         return inverse
     else:
         raise ValueError( "representative and modulus must be relatively prime" ) 
+
+
+def square_root_modulo(representative, prime):
+    """
+    Return an integer @c r such that @c r*r has the same remainder as
+    @p representative if divided by the odd @p prime.
+
+    The function uses the algorithm of Tonelli and Shanks.  For primes
+    @f$ p \equiv 3 \pmod{4} @f$, it simply returns @f$ a^{(p+1)/4} @f$.
+
+    @exception ValueError      if @p representative is no square modulo
+                               @p prime.
+
+    @see       Cohen, H., "A Course in Computational Algebraic Number Theory",
+               Springer 1993, algorithm 1.5.1
+    """
+    a = representative % prime
+    if a == 0 or prime == 2:
+        return a
+    if pow( a, (prime - 1) // 2, prime ) != 1:
+        raise ValueError( "representative must be a square modulo prime" )
+    if prime % 4 == 3:
+        return pow( a, (prime + 1) // 4, prime )
+
+    # Write p - 1 = 2^e * q with odd q, and find a non-residue n.
+    q, e = prime - 1, 0
+    while q % 2 == 0:
+        q, e = q // 2, e + 1
+    n = 2
+    while pow( n, (prime - 1) // 2, prime ) != prime - 1:
+        n += 1
+
+    # Invariants: a*b = x^2, y^(2^(r-1)) = -1, and b^(2^(r-1)) = 1.
+    y, r = pow( n, q, prime ), e
+    x, b = pow( a, (q + 1) // 2, prime ), pow( a, q, prime )
+    while b != 1:
+        m, power = 1, b * b % prime
+        while power != 1:
+            m, power = m + 1, power * power % prime
+        t = pow( y, 2**(r - m - 1), prime )
+        y, r = t * t % prime, m
+        x, b = x * t % prime, b * y % prime
+    return x
+
+
+from math import isqrt
+
+def cornacchia(d, prime):
+    """
+    Return a pair of non-negative integers @f$ (x, y) @f$ with
+    @f$ x^2 + d y^2 = p @f$ for the odd @p prime @f$ p @f$ and the positive
+    integer @f$ d < p @f$.
+
+    The algorithm of Cornacchia runs the Euclidean algorithm on @f$ p @f$
+    and a square root of @f$ -d @f$ modulo @f$ p @f$ until the remainder
+    drops below @f$ \sqrt{p} @f$; the remainder then is @f$ x @f$.
+
+    @exception ValueError      if there is no solution.
+
+    @see       Cohen, H., "A Course in Computational Algebraic Number Theory",
+               Springer 1993, algorithm 1.5.2
+    """
+    r = square_root_modulo( -d, prime )
+    if 2*r < prime:
+        r = prime - r
+    a, b = prime, r
+    bound = isqrt( prime )
+    while b > bound:
+        a, b = b, a % b
+
+    x = b
+    y2, remainder = divmod( prime - x*x, d )
+    y = isqrt( y2 )
+    if remainder or y*y != y2:
+        raise ValueError( "prime is not of the form x^2 + d*y^2" )
+    return x, y
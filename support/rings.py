@@ -25,6 +25,31 @@ not meant for high performance computing, but for instructive purposes.
 @author    Peter Dinges <pdinges@acm.org>
 """
 
+import math
+
+## The minimal degree of both polynomials for which
+#  extended_euclidean_algorithm() switches to half_gcd(); below it, the
+#  textbook remainder sequence is faster.
+half_gcd_threshold = 32
+
+
+def set_half_gcd_threshold(degree):
+    """
+    Set the minimal degree of the polynomials for which
+    extended_euclidean_algorithm() uses half_gcd().
+
+    @return    The previous threshold.
+
+    @exception ValueError  if @p degree is smaller than 1.
+    """
+    global half_gcd_threshold
+    if degree < 1:
+        raise ValueError( "the half-gcd threshold must be at least 1" )
+    previous = half_gcd_threshold
+    half_gcd_threshold = int( degree )
+    return previous
+
+
 def extended_euclidean_algorithm(u, v):
     """
     Return a tuple @c (m, n, d) such that @c u*m + v*n = d, where @c d is the
@@ -34,11 +59,25 @@ def extended_euclidean_algorithm(u, v):
     Thus, elements from other rings that support the @c divmod() operations as
     well as the operators @c //, @c * and @c - should work as well.
 
+    The function chooses the algorithm by the type of its arguments:
+    - For plain @c int arguments, the gcd comes from @c math.gcd() and the
+      factor @c m from the built-in modular inverse @c pow(x, -1, y); both
+      run in compiled code.
+    - Polynomials (objects with a @c degree() method) of degree at least
+      half_gcd_threshold use half_gcd() to skip through the first half of
+      the remainder sequence with few large multiplications.  This takes
+      @f$ O(M(n) \log n) @f$ operations for multiplication cost
+      @f$ M(n) @f$, instead of @f$ O(n^2) @f$.
+    - All other arguments use the textbook remainder sequence.
+
     @note      If @p u and @p v are Polynomials, then the returned gcd
                polynomial is not necessarily a monic polynomial; that means the
                gcd may have a leading coefficient other than one. To check
                whether two polynomials are relatively prime, test whether the
-               result has degree() zero.
+               result has degree() zero.  Both polynomial algorithms return
+               the same gcd.
+    @note      For integer arguments (including subclasses of @c int), the
+               gcd is positive regardless of the signs of @p u and @p v.
     
     @exception ZeroDivisionError   if one of @p u or @p v is zero.
     
@@ -47,7 +86,191 @@ def extended_euclidean_algorithm(u, v):
     """
     if not (u and v):
         raise ZeroDivisionError( "cannot determine the gcd of zero" )
+
+    if type(u) is int and type(v) is int:
+        return __integer_extended_euclidean_algorithm( u, v )
+
+    try:
+        degree = min( u.degree(), v.degree() )
+    except AttributeError:
+        degree = None
+    if degree is not None and degree >= half_gcd_threshold:
+        return __half_gcd_extended_euclidean_algorithm( u, v )
+
+    m, n, d = __remainder_sequence( u, v )
+    # Match the sign convention of math.gcd() in the integer fast path.
+    if isinstance( d, int ) and d < 0:
+        return ( -m, -n, -d )
+    return ( m, n, d )
+
+
+def gcd(u, v):
+    """
+    Determine the greatest common divisor of @p u and @p v.
+    
+    @note      If @p u and @p v are Polynomials, then the returned polynomial
+               is not necessarily monic; that means it may have a leading
+               coefficient other than one. To check whether two polynomials are
+               relatively prime, test whether the result has degree() zero.
     
+    @see       extended_euclidean_algorithm() for a description of working
+               input types.
+    """
+    return extended_euclidean_algorithm( u, v )[2]
+
+
+def batch_inverses(elements):
+    """
+    Return the list of multiplicative inverses of @p elements; compute them
+    with a single inversion and three multiplications per element.
+
+    The method (Montgomery's trick) inverts the product of all elements and
+    recovers the single inverses from the partial products.  It pays off
+    whenever an inversion is much more expensive than a multiplication, as
+    in quotient rings of polynomials.
+
+    @param elements    A list of ring elements that provide the method
+                       @c multiplicative_inverse().
+
+    @exception ZeroDivisionError   if one of the @p elements has no
+                                   multiplicative inverse.
+
+    @see       Montgomery, P. L., "Speeding the Pollard and Elliptic Curve
+               Methods of Factorization", Mathematics of Computation 48
+               (1987), pp. 243--264, section 10.3.1
+    """
+    if not elements:
+        return []
+
+    partial_products = [ elements[0] ]
+    for element in elements[ 1: ]:
+        partial_products.append( partial_products[-1] * element )
+
+    inverse = partial_products[-1].multiplicative_inverse()
+    inverses = [ None ] * len( elements )
+    for i in range( len( elements ) - 1, 0, -1 ):
+        inverses[i] = inverse * partial_products[ i-1 ]
+        inverse = inverse * elements[i]
+    inverses[0] = inverse
+    return inverses
+
+
+def half_gcd(a, b):
+    """
+    Return a matrix @f$ M @f$ (as pair of rows) that maps the polynomials
+    @p a and @p b to two consecutive remainders @f$ c, d @f$ of their
+    Euclidean remainder sequence:
+    @f[
+     \left(\begin{array}{c} c \\ d \end{array}\right)
+      = M \left(\begin{array}{c} a \\ b \end{array}\right),
+     \qquad \deg c \geq \lceil \deg(a) / 2 \rceil > \deg d.
+    @f]
+
+    The leading half of the coefficients of @p a and @p b determines the
+    quotients in the first half of the remainder sequence.  Thus the
+    function recurses twice on polynomials of half the degree and combines
+    the results with matrix multiplications.
+
+    @param a   A polynomial (an object with methods @c degree() and
+               @c coefficients()) over a field.
+    @param b   A polynomial over the same field with smaller degree than
+               @p a.
+
+    @see       von zur Gathen, J., and Gerhard, J., "Modern Computer
+               Algebra", second edition, Cambridge University Press 2003,
+               section 11.1; and Thull, K., and Yap, C. K., "A Unified
+               Approach to HGCD Algorithms for polynomials and integers",
+               manuscript, 1990.
+    """
+    one, zero = a.__class__.one(), a.__class__.zero()
+    m = (a.degree() + 1) // 2
+    matrix = ( (one, zero), (zero, one) )
+    if a.degree() < half_gcd_threshold:
+        # Small degrees: plain division steps are faster.
+        while b.degree() >= m:
+            quotient, remainder = divmod( a, b )
+            matrix = __euclidean_step( quotient, matrix )
+            a, b = b, remainder
+        return matrix
+    if b.degree() < m:
+        return matrix
+
+    # The first half of the quotients depends only on the leading
+    # coefficients above x^m.
+    matrix = half_gcd( __shift( a, m ), __shift( b, m ) )
+    c, d = __apply( matrix, a, b )
+    if d.degree() < m:
+        return matrix
+
+    quotient, remainder = divmod( c, d )
+    matrix = __euclidean_step( quotient, matrix )
+    c, d = d, remainder
+    if d.degree() < m:
+        return matrix
+
+    k = 2*m - c.degree()
+    return __multiply( half_gcd( __shift( c, k ), __shift( d, k ) ), matrix )
+
+
+#- Auxiliary Functions --------------------------------------------------------
+
+def __integer_extended_euclidean_algorithm(u, v):
+    """
+    Return the tuple @c (m, n, d) of extended_euclidean_algorithm() for the
+    plain integers @p u and @p v.
+
+    This function is not intended for direct use.
+    """
+    d = math.gcd( u, v )
+    # u/d is a unit modulo |v|/d; its inverse is the factor of u.
+    m = pow( u // d, -1, abs( v ) // d )
+    n = (d - u * m) // v
+    return ( m, n, d )
+
+
+def __half_gcd_extended_euclidean_algorithm(u, v):
+    """
+    Return the tuple @c (m, n, d) of extended_euclidean_algorithm() for the
+    polynomials @p u and @p v; alternate between half_gcd() and single
+    division steps until the remainders fall below half_gcd_threshold.
+
+    This function is not intended for direct use.
+    """
+    one, zero = u.__class__.one(), u.__class__.zero()
+    matrix = ( (one, zero), (zero, one) )
+    a, b = u, v
+
+    # half_gcd() requires deg a > deg b; the first division ensures that.
+    if a.degree() <= b.degree():
+        quotient, remainder = divmod( a, b )
+        matrix = __euclidean_step( quotient, matrix )
+        a, b = b, remainder
+
+    while b and b.degree() >= half_gcd_threshold:
+        step = half_gcd( a, b )
+        a, b = __apply( step, a, b )
+        matrix = __multiply( step, matrix )
+        if not b:
+            break
+        quotient, remainder = divmod( a, b )
+        matrix = __euclidean_step( quotient, matrix )
+        a, b = b, remainder
+
+    while b:
+        quotient, remainder = divmod( a, b )
+        matrix = __euclidean_step( quotient, matrix )
+        a, b = b, remainder
+
+    return ( matrix[0][0], matrix[0][1], a )
+
+
+def __remainder_sequence(u, v):
+    """
+    Return the tuple @c (m, n, d) of extended_euclidean_algorithm(); use the
+    textbook remainder sequence.
+
+    This function is not intended for direct use.
+    """
     # It does not matter which one is larger: if v > u, then the first shift
     # switches u and v.
     larger_remainder, lesser_remainder = u, v
@@ -72,17 +295,45 @@ def extended_euclidean_algorithm(u, v):
     return ( larger_scalar, other_scalar, larger_remainder )
 
 
-def gcd(u, v):
+def __shift(polynomial, k):
     """
-    Determine the greatest common divisor of @p u and @p v.
-    
-    @note      If @p u and @p v are Polynomials, then the returned polynomial
-               is not necessarily monic; that means it may have a leading
-               coefficient other than one. To check whether two polynomials are
-               relatively prime, test whether the result has degree() zero.
-    
-    @see       extended_euclidean_algorithm() for a description of working
-               input types.
+    Return the quotient of @p polynomial divided by @f$ x^k @f$: drop the
+    @p k lowest coefficients.
+
+    This function is not intended for direct use.
     """
-    return extended_euclidean_algorithm( u, v )[2]
+    return polynomial.__class__( polynomial.coefficients()[ k : ] )
+
+
+def __apply(matrix, a, b):
+    """
+    Return the pair @f$ M (a, b)^T @f$ for the 2x2 @p matrix @f$ M @f$.
+
+    This function is not intended for direct use.
+    """
+    (m00, m01), (m10, m11) = matrix
+    return ( m00 * a + m01 * b, m10 * a + m11 * b )
+
+
+def __multiply(left, right):
+    """
+    Return the product of the 2x2 matrices @p left and @p right.
+
+    This function is not intended for direct use.
+    """
+    (a00, a01), (a10, a11) = left
+    (b00, b01), (b10, b11) = right
+    return ( ( a00 * b00 + a01 * b10, a00 * b01 + a01 * b11 ),
+             ( a10 * b00 + a11 * b10, a10 * b01 + a11 * b11 ) )
+
+
+def __euclidean_step(quotient, matrix):
+    """
+    Return the product of the matrix of one division step with
+    @p quotient, @f$ ((0, 1), (1, -q)) @f$, and @p matrix.
+
+    This function is not intended for direct use.
+    """
+    (m00, m01), (m10, m11) = matrix
+    return ( ( m10, m11 ), ( m00 - quotient * m10, m01 - quotient * m11 ) )
 
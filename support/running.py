@@ -24,6 +24,7 @@ furthermore support for the profiling of algorithms.
 """
 
 import cProfile
+import inspect
 import os
 import platform
 import resource
@@ -374,7 +375,87 @@ class ParallelParser:
             # Flush the update to disk to circumvent caching, which might delay
             # propagation of the update to other parsers.
             self.__pipe.flush()
-        
+
+
+class Checkpoint:
+    """
+    A Checkpoint stores the intermediate results of an algorithm pass in a
+    file, so that a later pass with the same input may skip their
+    computation.
+
+    The results are pairs of integers @f$ (k, v) @f$, for example the
+    congruence @f$ t \equiv v \pmod{k} @f$ of Schoof's algorithm.  The file
+    is append-only: every record() writes a single line "k v" and flushes it
+    to disk before it returns.  If a crash interrupts the writing, then only
+    the last line lacks its line break; the constructor discards such a
+    line, so earlier records never get lost.
+
+    For example, the following code skips the keys that a previous,
+    interrupted pass already solved:
+    @code
+    checkpoint = Checkpoint( "curve.checkpoint", resume=True )
+    solved = checkpoint.records()
+    for k in keys:
+        if k not in solved:
+            checkpoint.record( k, compute( k ) )
+    @endcode
+
+    @note      Records with the same key overwrite each other; records()
+               returns the last value.
+    """
+
+    def __init__(self, filename, resume=False):
+        """
+        Construct a new Checkpoint that stores its records in the file
+        @p filename.
+
+        @param     filename    The name of the checkpoint file.
+        @param     resume      If @c True, keep the records of an existing
+                               file; otherwise, start with an empty file.
+        """
+        self.__records = {}
+        if resume and os.path.exists( filename ):
+            with open( filename, "rt" ) as checkpoint_file:
+                contents = checkpoint_file.read()
+            # Everything after the last line break stems from an
+            # interrupted write.
+            complete = contents[ : contents.rfind( "\n" ) + 1 ]
+            for line in complete.splitlines():
+                try:
+                    key, value = map( int, line.split() )
+                except ValueError:
+                    continue
+                self.__records[ key ] = value
+            self.__file = open( filename, "at" )
+            self.__file.truncate( len( complete.encode() ) )
+        else:
+            self.__file = open( filename, "wt" )
+
+
+    def records(self):
+        """
+        Return a dictionary that maps the keys of all records to their values.
+        """
+        return dict( self.__records )
+
+
+    def record(self, key, value):
+        """
+        Append the record @f$ (k, v) @f$ = (@p key, @p value) to the file and
+        make sure it reaches the disk.
+        """
+        print( int( key ), int( value ), file=self.__file )
+        self.__file.flush()
+        os.fsync( self.__file.fileno() )
+        self.__records[ key ] = value
+
+
+    def close(self):
+        """
+        Close the checkpoint file; further calls of record() fail.
+        """
+        self.__file.close()
+
 
 import os
 import signal
@@ -420,10 +501,20 @@ class AlgorithmRunner:
     it. It will then properly shut down, unregistering its ParallelParser etc.,
     all of which does not happen if it is just killed.
     
-    @see ParallelParser and DataRecorder
+    With the "-c" or "-r" switch, the runner passes a Checkpoint for every
+    parameter set to the algorithm (as keyword argument @c checkpoint). After
+    a time out or a crash, a run with "-r" continues from the stored
+    intermediate results.
+    
+    With the "-C" switch, the runner answers parameter sets from a result
+    cache instead of applying the algorithm, and stores new results there;
+    see the @c result_cache argument of the constructor.
+    
+    @see ParallelParser, DataRecorder, and Checkpoint
     """
     
-    def __init__(self, algorithm, arguments=sys.argv[1:], algorithm_version="<unknown>" ):
+    def __init__(self, algorithm, arguments=sys.argv[1:], algorithm_version="<unknown>",
+                 result_cache=None ):
         """
         Construct a new AlgorithmRunner for executing the given @p algorithm.
         
@@ -441,6 +532,15 @@ class AlgorithmRunner:
                                        Use it to recall which revision of an
                                        algorithm was used in a particular
                                        profile.
+        @param     result_cache    A callable that takes the file name of
+                                   the "-C" switch and returns a cache with
+                                   the methods @c lookup(item) and
+                                   @c store(item, result), where @c item is
+                                   the tuple of parameters; or @c None if
+                                   the results of @p algorithm cannot be
+                                   cached.  For example, the point counting
+                                   programs use
+                                   support.trace_cache.OrderCache.
         """
         self.__algorithm = algorithm
         self.__algorithm_version = algorithm_version
@@ -464,6 +564,34 @@ class AlgorithmRunner:
         self.__profile_directory = options.profile_directory
         self.__timelimit = options.timelimit
         
+        # Pass the number of jobs only if asked to; the algorithm must
+        # accept the keyword argument 'jobs' then.
+        self.__algorithm_options = {}
+        if options.jobs > 1:
+            parameters = inspect.signature( algorithm ).parameters
+            if "jobs" not in parameters:
+                self.__parser.error( "the algorithm supports no parallel jobs" )
+            self.__algorithm_options[ "jobs" ] = options.jobs
+        
+        # Likewise, the algorithm must accept the keyword argument
+        # 'checkpoint' to store intermediate results.
+        self.__checkpoint_directory = options.checkpoint_directory
+        self.__resume = options.resume
+        if self.__resume and not self.__checkpoint_directory:
+            self.__checkpoint_directory = os.getcwd()
+        if self.__checkpoint_directory:
+            parameters = inspect.signature( algorithm ).parameters
+            if "checkpoint" not in parameters:
+                self.__parser.error( "the algorithm supports no checkpoints" )
+            self._ensure_directory( self.__checkpoint_directory )
+        
+        # Answer repeated parameters from the cache without the algorithm.
+        self.__result_cache = None
+        if options.cache_file:
+            if result_cache is None:
+                self.__parser.error( "the algorithm supports no result cache" )
+            self.__result_cache = result_cache( options.cache_file )
+        
         if self.__create_profile:
             self._ensure_directory( options.profile_directory )
 
@@ -494,8 +622,28 @@ class AlgorithmRunner:
                                         self.__profile_directory,
                                         
                                     )
+                    algorithm_options = dict( self.__algorithm_options )
+                    if self.__checkpoint_directory:
+                        checkpoint = Checkpoint(
+                                         self._checkpoint_filename( *item ),
+                                         self.__resume
+                                     )
+                        algorithm_options[ "checkpoint" ] = checkpoint
                     try:
-                        result = self.__algorithm( *item, output=self.__output)
+                        result = None
+                        if self.__result_cache:
+                            result = self.__result_cache.lookup( item )
+                        if result is not None:
+                            message = "Cached result for {args}: {result}"
+                            print( message.format( args = " ".join( item ),
+                                                   result = result ),
+                                   file = self.__output )
+                        else:
+                            result = self.__algorithm( *item,
+                                                       output=self.__output,
+                                                       **algorithm_options )
+                            if self.__result_cache:
+                                self.__result_cache.store( item, result )
                     
                     except TimeOutException:
                         terminated = "timeout after {0}s".format( self.__timelimit )
@@ -503,6 +651,10 @@ class AlgorithmRunner:
                     except SoftKillException:
                         terminated = "killed by user signal"
                     
+                    finally:
+                        if self.__checkpoint_directory:
+                            checkpoint.close()
+                    
                     if self.__create_profile:
                         recorder.stop()
                         extra_information = {
@@ -577,6 +729,15 @@ class AlgorithmRunner:
         return name
 
 
+    def _checkpoint_filename(self, *input_item):
+        """
+        Return the name of the checkpoint file for the given input; unlike
+        the profile names, it is the same in every run.
+        """
+        name = "{args}.checkpoint".format( args = "_".join( input_item ) )
+        return os.path.join( self.__checkpoint_directory, name )
+
+
     def _parse_arguments( self, arguments, algorithm_version ):
         """
         Parse the command line arguments and set the options accordingly.
@@ -596,6 +757,16 @@ class AlgorithmRunner:
                            "longer than SECONDS seconds."
                        )
 
+        parser.add_option( "-j",
+                           "--jobs",
+                           dest="jobs",
+                           type="int",
+                           default=1,
+                           metavar="N",
+                           help="distribute the work of every algorithm pass "
+                           "to N processes (if the algorithm supports it)."
+                       )
+
         io_group = OptionGroup(parser, "Input and Output")
         io_group.add_option( "-i", "--input-file", metavar="FILE",
                              dest="input_file",
@@ -628,6 +799,33 @@ class AlgorithmRunner:
         
         parser.add_option_group( profiling_group )
         
+        
+        checkpoint_group = OptionGroup(parser, "Checkpoints")
+        checkpoint_group.add_option( "-c", "--checkpoint-directory", metavar="DIR",
+                           dest="checkpoint_directory",
+                           type="string",
+                           default=None,
+                           help="store the intermediate results of each "
+                           "algorithm run in directory DIR (if the algorithm "
+                           "supports it)")
+        
+        checkpoint_group.add_option( "-r", "--resume",
+                           action="store_true", dest="resume",
+                           default=False,
+                           help="continue from the intermediate results of "
+                           "earlier runs; implies checkpoints in the current "
+                           "directory unless -c is given")
+        
+        checkpoint_group.add_option( "-C", "--cache-file", metavar="FILE",
+                           dest="cache_file",
+                           type="string",
+                           default=None,
+                           help="answer repeated inputs from the results "
+                           "cached in FILE and add new results to it (if the "
+                           "algorithm supports it)")
+        
+        parser.add_option_group( checkpoint_group )
+        
         self.__parser = parser
         return parser.parse_args( arguments )
     
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+A persistent cache for the traces of the Frobenius endomorphism of elliptic
+curves over prime fields.
+
+For @f$ c \neq 0 @f$, the curves @f$ y^2 = x^3 + Ax + B @f$ and
+@f$ y^2 = x^3 + c^2 A x + c^3 B @f$ are isomorphic if @f$ c @f$ is a
+square; otherwise, the second curve is a quadratic twist of the first.  The
+trace of the Frobenius endomorphism thus changes by the Legendre symbol
+@f$ (c/p) @f$.  If @f$ AB \neq 0 @f$, then @f$ c = A/B @f$ maps the curve
+to @f$ A' = B' = m @f$ with @f$ m = A^3/B^2 @f$; the value @f$ m @f$ only
+depends on the class of the curve under these transformations.  The cache
+stores the trace of this representative once, which answers for all
+isomorphic curves and their twists.
+
+The curves with @f$ A = 0 @f$ or @f$ B = 0 @f$ have more automorphisms; the
+cache ignores them since
+reduced_computation_schoof.complex_multiplication_trace() computes their
+traces faster than a lookup.
+
+@package   support.trace_cache
+@author    Peter Dinges <pdinges@acm.org>
+"""
+
+import fcntl
+import os
+
+from contextlib import contextmanager
+
+class TraceCache:
+    """
+    A TraceCache stores the traces of the Frobenius endomorphism of elliptic
+    curves in a file that persists between program runs; use it in front of
+    a point counting algorithm:
+    @code
+    cache = TraceCache( "traces.cache" )
+    trace = cache.lookup( curve )
+    if trace is None:
+        trace = frobenius_trace( curve )
+        cache.store( curve, trace )
+    @endcode
+
+    The file has one line "p m t" for every class of curves (see the module
+    documentation).  Like support.running.Checkpoint, the cache only appends
+    complete lines and discards a trailing line without line break, which
+    stems from an interrupted write.  The writes lock the file, so several
+    processes may share it; a lookup that misses reads the lines that other
+    processes appended in the meantime.
+    """
+
+    def __init__(self, filename):
+        """
+        Construct a new TraceCache that stores its entries in the file
+        @p filename; create the file if it does not exist.
+        """
+        self.__traces = {}
+        self.__offset = 0
+        self.__file = open( filename, "ab+" )
+
+        with self.__lock():
+            self.__file.seek( 0 )
+            contents = self.__file.read()
+            complete_length = contents.rfind( b"\n" ) + 1
+            if complete_length < len( contents ):
+                self.__file.truncate( complete_length )
+        self.__read_entries()
+
+
+    def lookup(self, curve):
+        """
+        Return the cached trace of the Frobenius endomorphism of @p curve, or
+        @c None if it is unknown.
+        """
+        return self.__lookup( self.__curve_key( curve ) )
+
+
+    def store(self, curve, trace):
+        """
+        Store the @p trace of the Frobenius endomorphism of @p curve; this
+        also stores the traces of all isomorphic curves and their twists.
+        """
+        self.__store( self.__curve_key( curve ), trace )
+
+
+    def lookup_parameters(self, p, A, B):
+        """
+        Return the cached trace of the Frobenius endomorphism of the curve
+        @f$ y^2 = x^3 + Ax + B @f$ over the prime field with @p p elements,
+        or @c None if it is unknown.
+        """
+        return self.__lookup( self.__key( p, A, B ) )
+
+
+    def store_parameters(self, p, A, B, trace):
+        """
+        Store the @p trace of the Frobenius endomorphism of the curve
+        @f$ y^2 = x^3 + Ax + B @f$ over the prime field with @p p elements.
+        """
+        self.__store( self.__key( p, A, B ), trace )
+
+
+    def close(self):
+        """
+        Close the cache file; further calls of store() fail.
+        """
+        self.__file.close()
+
+
+    def __lookup(self, key):
+        """
+        Return the cached trace for the @p key (see __key()), or @c None.
+        """
+        if key is None:
+            return None
+
+        p, m, sign = key
+        if ( p, m ) not in self.__traces:
+            self.__read_entries()
+        if ( p, m ) not in self.__traces:
+            return None
+        return sign * self.__traces[ ( p, m ) ]
+
+
+    def __store(self, key, trace):
+        """
+        Append the @p trace for the @p key (see __key()) to the file unless
+        the cache knows it already.
+        """
+        if key is None:
+            return
+
+        p, m, sign = key
+        if ( p, m ) in self.__traces:
+            return
+        line = "{0} {1} {2}\n".format( p, m, sign * trace )
+        with self.__lock():
+            self.__file.write( line.encode() )
+            self.__file.flush()
+            os.fsync( self.__file.fileno() )
+        self.__traces[ ( p, m ) ] = sign * trace
+
+
+    def __read_entries(self):
+        """
+        Read the complete lines after the last read position.
+        """
+        self.__file.seek( self.__offset )
+        contents = self.__file.read()
+        complete = contents[ : contents.rfind( b"\n" ) + 1 ]
+        self.__offset += len( complete )
+        for line in complete.decode().splitlines():
+            try:
+                p, m, trace = map( int, line.split() )
+            except ValueError:
+                continue
+            self.__traces[ ( p, m ) ] = trace
+
+
+    @contextmanager
+    def __lock(self):
+        """
+        Hold an exclusive lock on the cache file; use it with the @c with
+        statement.
+        """
+        fcntl.lockf( self.__file, fcntl.LOCK_EX )
+        try:
+            yield
+        finally:
+            fcntl.lockf( self.__file, fcntl.LOCK_UN )
+
+
+    @classmethod
+    def __curve_key(cls, curve):
+        """
+        Return the key of @p curve (see __key()), or @c None if the curve is
+        not defined over a prime field.
+        """
+        field = curve.field()
+        p = field.characteristic()
+        if field.size() != p:
+            return None
+
+        A, B = [ field( c ).remainder() for c in curve.parameters() ]
+        return cls.__key( p, A, B )
+
+
+    @staticmethod
+    def __key(p, A, B):
+        """
+        Return the triple @f$ (p, m, s) @f$ such that the trace of the curve
+        @f$ y^2 = x^3 + Ax + B @f$ over the field with @f$ p @f$ elements
+        is @f$ s @f$ times the trace of @f$ y^2 = x^3 + mx + m @f$; return
+        @c None if the cache does not cover the curve.
+        """
+        A, B = A % p, B % p
+        if A == 0 or B == 0:
+            return None
+
+        m = pow( A, 3, p ) * pow( B*B, p-2, p ) % p
+        # The Legendre symbol of c = A/B equals that of AB.
+        sign = 1 if pow( A*B, (p-1) // 2, p ) == 1 else -1
+        return p, m, sign
+
+
+## The TraceCache instances of trace_cache() by file name.
+__open_caches = {}
+
+def trace_cache(filename):
+    """
+    Return the TraceCache for the file @p filename; all calls with the same
+    name share one instance.
+    """
+    if filename not in __open_caches:
+        __open_caches[ filename ] = TraceCache( filename )
+    return __open_caches[ filename ]
+
+
+class OrderCache:
+    """
+    An OrderCache answers the inputs @f$ (p, A, B) @f$ of the point counting
+    programs with the group orders from a TraceCache.  It is the result
+    cache of support.running.AlgorithmRunner for these programs:
+    @code
+    runner = AlgorithmRunner( algorithm, result_cache=OrderCache )
+    @endcode
+    The curve @f$ y^2 = x^3 + Ax + B @f$ over the field with @f$ p @f$
+    elements has @f$ p + 1 - t @f$ points if @f$ t @f$ is the trace of the
+    Frobenius endomorphism.
+    """
+
+    def __init__(self, filename):
+        """
+        Construct a new OrderCache that uses the trace_cache() of the file
+        @p filename.
+        """
+        self.__traces = trace_cache( filename )
+
+
+    def lookup(self, item):
+        """
+        Return the cached group order for the input @p item, a tuple of the
+        strings @f$ (p, A, B) @f$, or @c None if it is unknown.
+        """
+        p, A, B = map( int, item )
+        trace = self.__traces.lookup_parameters( p, A, B )
+        if trace is None:
+            return None
+        return p + 1 - trace
+
+
+    def store(self, item, order):
+        """
+        Store the group @p order for the input @p item, a tuple of the
+        strings @f$ (p, A, B) @f$.
+        """
+        p, A, B = map( int, item )
+        self.__traces.store_parameters( p, A, B, p + 1 - order )
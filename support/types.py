@@ -26,6 +26,79 @@ or fields.finite.naive.FiniteField
 @author    Peter Dinges <pdinges@acm.org>
 """
 
+import weakref
+from collections import namedtuple
+from types import MemberDescriptorType
+
+## Specialized template classes by template and parameter map.  The cache
+#  holds weak references, so that unused specializations are discarded.
+#  Since equal specializations share one class object, changing a class
+#  attribute of a specialization affects all its users; derive a class
+#  instead (see support.powers for an example).
+_specialization_cache = weakref.WeakValueDictionary()
+_specialization_statistics = { "hits": 0, "misses": 0 }
+
+SpecializationCacheInfo = namedtuple(
+                              "SpecializationCacheInfo",
+                              [ "hits", "misses", "size" ]
+                          )
+
+def specialization_cache_info():
+    """
+    Return the statistics of the template specialization cache as named tuple
+    @c (hits, misses, size).
+    
+    Hits count the specializations that returned an existing class object;
+    misses count the specializations that created a new class object.  The
+    size is the number of cached class objects.
+    
+    @note  A hit returns the class object that other code uses as well:
+           assignments to its class attributes, such as
+           @c _power_algorithm, leak into all these users.  Derive a class
+           to change the behavior locally.
+    @note  Specializations with unhashable parameters (for example
+           polynomials) cannot be cached; they always count as misses.
+    
+    @see   TypeTemplate.__call__()
+    """
+    return SpecializationCacheInfo(
+                   _specialization_statistics[ "hits" ],
+                   _specialization_statistics[ "misses" ],
+                   len( _specialization_cache )
+               )
+
+
+def clear_specialization_cache():
+    """
+    Empty the template specialization cache and reset its statistics.
+    
+    Subsequent specializations create new class objects, even if a class
+    object with the same parameters still exists.
+    """
+    _specialization_cache.clear()
+    _specialization_statistics[ "hits" ] = 0
+    _specialization_statistics[ "misses" ] = 0
+
+
+def _specialization_key( template_class, parameter_map ):
+    """
+    Return the key of the specialization of @p template_class with
+    parameters @p parameter_map in the specialization cache; return @c None
+    if some parameter is unhashable.
+    
+    The key includes the parameter types; for example, the specializations
+    for @c 1 and @c True differ even though @c 1 == @c True.
+    
+    This function is not intended for direct use.
+    """
+    try:
+        parameters = frozenset( [ (name, type(value), value)
+                                  for name, value in parameter_map.items() ] )
+    except TypeError:
+        return None
+    return ( template_class, parameters )
+
+
 def template( *parameters ):
     """
     Factory function to create template meta-classes.  The function arguments
@@ -161,6 +234,18 @@ class TypeTemplate(type):
             extended_dict = meta_class.__parameter_map__.copy()
             extended_dict.update( class_dict )
             extended_dict[ "__plain_name__" ] = class_name
+            # The extended name would change the mangling of private slot
+            # names; mangle them with the plain name instead.  Moreover,
+            # specializations re-create classes from their dictionary; drop
+            # the descriptors of __slots__ because type() re-creates them.
+            if "__slots__" in extended_dict:
+                extended_dict[ "__slots__" ] = meta_class.__mangled_slots(
+                                                   class_name,
+                                                   extended_dict[ "__slots__" ]
+                                               )
+            for name, value in class_dict.items():
+                if isinstance( value, MemberDescriptorType ):
+                    del extended_dict[ name ]
             return type.__new__(
                         meta_class,
                         extended_name,
@@ -176,6 +261,10 @@ class TypeTemplate(type):
         Note that this bends python's usual semantics: calling a template
         class may return types and instances, rather than always returning
         instances.
+        
+        Specializing a template twice with equal parameters returns the same
+        class object (unless a parameter is unhashable); see
+        specialization_cache_info().
         """
         unbound_parameters = self.__unbound_parameters__ 
         if unbound_parameters:
@@ -198,13 +287,25 @@ class TypeTemplate(type):
             parameter_map = kw_arguments.copy()
             parameter_map.update( zip( pos_parameters, arguments ) )
             
-            return self.__class__.__new__(
-                            self.__class__,
-                            self.__plain_name__,
-                            self.__bases__,
-                            self.__dict__,
-                            **parameter_map
-                        )
+            # Identical specializations yield the identical class object.
+            key = _specialization_key( self, parameter_map )
+            if key is not None:
+                specialization = _specialization_cache.get( key )
+                if specialization is not None:
+                    _specialization_statistics[ "hits" ] += 1
+                    return specialization
+            _specialization_statistics[ "misses" ] += 1
+            
+            specialization = self.__class__.__new__(
+                                    self.__class__,
+                                    self.__plain_name__,
+                                    self.__bases__,
+                                    self.__dict__,
+                                    **parameter_map
+                                )
+            if key is not None:
+                _specialization_cache[ key ] = specialization
+            return specialization
         else:
             # All parameters are set; create an instance.
             return type.__call__( self, *arguments, **kw_arguments )
@@ -242,6 +343,20 @@ class TypeTemplate(type):
             raise TypeError( message )
             
             
+    @staticmethod
+    def __mangled_slots(class_name, slots):
+        """
+        Return the tuple of @p slots with private names (such as @c __x)
+        mangled for the class @p class_name (for example @c _C__x).
+        """
+        if isinstance( slots, str ):
+            slots = [ slots ]
+        prefix = "_" + class_name.lstrip( "_" )
+        return tuple( [ prefix + s if s.startswith( "__" ) and not s.endswith( "__" )
+                                   else s
+                        for s in slots ] )
+    
+    
     @staticmethod
     def __template_name(class_name, parameters, parameter_map):
         """
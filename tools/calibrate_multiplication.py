@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+__description = \
+"""
+Measure the crossover points between schoolbook, Karatsuba, Toom-3, and
+Kronecker multiplication of polynomials over the finite field with p elements
+on this machine. The program prints the thresholds for
+support.polynomials.set_multiplication_thresholds(). Run it from the
+repository root as 'python3 -m tools.calibrate_multiplication'.
+"""
+__doc__ = __description
+
+
+import random
+import timeit
+
+from fields.finite.compact import FiniteField
+from support import polynomials
+
+def random_coefficients(field, length):
+    """
+    Return a list of @p length random elements of the finite @p field.
+    """
+    return [ field( random.randrange( 0, field.size() ) ) for i in range( length ) ]
+
+
+def product_time(function, field, length, repetitions):
+    """
+    Return the minimal time in seconds that @p function takes to multiply
+    two random coefficient lists of the given @p length.
+    """
+    a = random_coefficients( field, length )
+    b = random_coefficients( field, length )
+    zero = field.zero()
+    timer = timeit.Timer( lambda: function( a, b, zero ) )
+    return min( timer.repeat( repeat=repetitions, number=1 ) )
+
+
+def crossover(fast, slow, field, lengths, repetitions):
+    """
+    Return the first length in @p lengths for which the function @p fast
+    multiplies faster than the function @p slow; return @c None if there is
+    no such length.
+    """
+    for length in lengths:
+        if product_time( fast, field, length, repetitions ) \
+                < product_time( slow, field, length, repetitions ):
+            return length
+    return None
+
+
+def calibrate(p, maximal_length, repetitions, output):
+    """
+    Measure the multiplication thresholds for polynomials over the field with
+    @p p elements and print them to @p output.
+
+    Each measurement compares one level of the faster method, whose partial
+    products use the slower method, with the slower method alone.
+
+    @return    The dictionary of measured thresholds.
+    """
+    field = FiniteField( p )
+    lengths = list( range( 4, 32, 2 ) ) + list( range( 32, maximal_length+1, 8 ) )
+    unreachable = 2 * maximal_length
+
+    previous = polynomials.set_multiplication_thresholds(
+                                    karatsuba=unreachable,
+                                    toom3=unreachable,
+                                    kronecker=unreachable
+                                )
+    try:
+        kronecker = crossover(
+                        polynomials.kronecker_product,
+                        polynomials.schoolbook_product,
+                        field, list( range( 2, 17 ) ), repetitions
+                    ) or unreachable
+        print( "Kronecker threshold: {0}".format( kronecker ), file=output )
+        output.flush()
+
+        karatsuba = crossover(
+                        polynomials.karatsuba_product,
+                        polynomials.schoolbook_product,
+                        field, lengths, repetitions
+                    ) or unreachable
+        print( "Karatsuba threshold: {0}".format( karatsuba ), file=output )
+        output.flush()
+
+        polynomials.set_multiplication_thresholds( karatsuba=karatsuba )
+        toom3 = crossover(
+                    polynomials.toom3_product,
+                    polynomials.karatsuba_product,
+                    field, [ n for n in lengths if n >= karatsuba ], repetitions
+                ) or unreachable
+        print( "Toom-3 threshold: {0}".format( toom3 ), file=output )
+
+    finally:
+        polynomials.set_multiplication_thresholds( **previous )
+
+    message = "\nsupport.polynomials.set_multiplication_thresholds( " \
+              "karatsuba={0}, toom3={1}, kronecker={2} )"
+    print( message.format( karatsuba, toom3, kronecker ), file=output )
+    return { "karatsuba": karatsuba, "toom3": toom3, "kronecker": kronecker }
+
+
+import optparse
+import sys
+
+def main(arguments):
+    usage_string = "%prog [options]"
+    parser = optparse.OptionParser(
+                               usage=usage_string,
+                               description=__description.strip()
+                           )
+
+    parser.add_option(  "-p",
+                        "--prime",
+                        metavar="P",
+                        dest="prime",
+                        help="Use coefficients from the field with P elements",
+                        default=2**89 - 1
+                    )
+
+    parser.add_option(  "-m",
+                        "--maximal-length",
+                        metavar="N",
+                        dest="maximal_length",
+                        help="Measure polynomials with up to N coefficients",
+                        default=256
+                    )
+
+    parser.add_option(  "-r",
+                        "--repetitions",
+                        metavar="R",
+                        dest="repetitions",
+                        help="Take the best of R measurements per length",
+                        default=5
+                    )
+
+    options, arguments = parser.parse_args( arguments )
+
+    if arguments:
+        parser.print_usage()
+        return 2
+
+    calibrate(
+        int( options.prime ),
+        int( options.maximal_length ),
+        int( options.repetitions ),
+        sys.stdout
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit( main( sys.argv[ 1: ] ) )
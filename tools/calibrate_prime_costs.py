@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+__description = \
+"""
+Measure the time for computing the trace of the Frobenius endomorphism
+modulo small primes on this machine and fit the cost model of
+support.prime_selection to it. The program prints the parameters for
+support.prime_selection.set_cost_model(). Run it from the repository root
+as 'python3 -m tools.calibrate_prime_costs'.
+"""
+__doc__ = __description
+
+
+import math
+import random
+import time
+
+from fields.finite.compact import FiniteField
+from elliptic_curves.naive import EllipticCurve
+from elliptic_curves.l_torsion_group.naive import ProjectiveLTorsionGroup
+from reduced_computation_schoof import frobenius_trace_mod_l
+from support.primes import primes_range
+
+def trace_time(p, l, curves):
+    """
+    Return the average time in seconds for computing the trace modulo @p l
+    on @p curves random curves over the field with @p p elements.
+    """
+    field = FiniteField( p )
+    total = 0.0
+    for i in range( curves ):
+        curve = EllipticCurve( field, random.randrange( 1, p ),
+                                      random.randrange( 1, p ) )
+        start = time.time()
+        frobenius_trace_mod_l( ProjectiveLTorsionGroup( curve )( l ) )
+        total += time.time() - start
+    return total / curves
+
+
+def calibrate(p, maximal_prime, curves, output):
+    """
+    Measure the time for the odd primes up to @p maximal_prime over the
+    field with @p p elements, print the measurements to @p output, and fit
+    @f$ t = c \cdot l^e \cdot \log_2 p @f$ by least squares on the
+    logarithms.
+
+    @return    The pair @f$ (c, e) @f$.
+    """
+    points = []
+    for l in primes_range( 3, maximal_prime+1 ):
+        if l == p:
+            continue
+        seconds = trace_time( p, l, curves )
+        print( "l = {0:3d}: {1:.3f}s".format( l, seconds ), file=output )
+        output.flush()
+        points.append( ( math.log( l ), math.log( seconds / math.log2( p ) ) ) )
+
+    mean_x = sum( x for x, y in points ) / len( points )
+    mean_y = sum( y for x, y in points ) / len( points )
+    exponent = sum( (x - mean_x) * (y - mean_y) for x, y in points ) \
+                / sum( (x - mean_x)**2 for x, y in points )
+    coefficient = math.exp( mean_y - exponent * mean_x )
+
+    message = "\nsupport.prime_selection.set_cost_model( " \
+              "coefficient={0:.3g}, exponent={1:.3g} )"
+    print( message.format( coefficient, exponent ), file=output )
+    return coefficient, exponent
+
+
+import optparse
+import sys
+
+def main(arguments):
+    usage_string = "%prog [options]"
+    parser = optparse.OptionParser(
+                               usage=usage_string,
+                               description=__description.strip()
+                           )
+
+    parser.add_option(  "-p",
+                        "--prime",
+                        metavar="P",
+                        dest="prime",
+                        help="Measure over the field with P elements",
+                        default=2**61 - 1
+                    )
+
+    parser.add_option(  "-l",
+                        "--maximal-prime",
+                        metavar="L",
+                        dest="maximal_prime",
+                        help="Measure the primes up to L",
+                        default=23
+                    )
+
+    parser.add_option(  "-c",
+                        "--curves",
+                        metavar="N",
+                        dest="curves",
+                        help="Average over N random curves",
+                        default=2
+                    )
+
+    options, arguments = parser.parse_args( arguments )
+
+    if arguments:
+        parser.print_usage()
+        return 2
+
+    calibrate( int( options.prime ), int( options.maximal_prime ),
+               int( options.curves ), sys.stdout )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit( main( sys.argv[ 1: ] ) )
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+__description = \
+"""
+Search random elliptic curves over the finite field with p elements for
+curves of prime order (or prime order times a small cofactor). Every curve
+passes the stages 2-torsion test, screening with small primes, full point
+count, and primality test of the order; most curves drop out in the cheap
+first stages. The program prints the parameters of the accepted curves in
+the format of tools/paramter_generator.py and reports the rejections per
+stage. Run it from the repository root as 'python3 -m tools.curve_search'.
+"""
+__doc__ = __description
+
+
+import random
+import time
+
+from fields.finite.compact import FiniteField
+from elliptic_curves.naive import EllipticCurve
+from reduced_computation_schoof import screen_curve
+from tools.paramter_generator import non_singular
+
+## The stages of the search in the order that curves pass them.
+stages = [ "2-torsion", "small primes", "full count", "primality" ]
+
+
+def examine_curve(p, A, B, max_cofactor):
+    """
+    Return the pair @f$ (s, N) @f$ of the stage @f$ s @f$ that rejects the
+    curve @f$ y^2 = x^3 + Ax + B @f$ over the field with @p p elements, or
+    @c "accepted", and the number of points @f$ N @f$ of an accepted curve
+    (@c None otherwise).  The worker processes of search() execute this
+    function; the arguments and the result are plain values.
+    """
+    rejections = []
+    curve = EllipticCurve( FiniteField( p ), A, B )
+    order = screen_curve( curve, max_cofactor, rejections.append )
+    if rejections:
+        return rejections[0], None
+    return "accepted", order
+
+
+def random_curves(p):
+    """
+    Iterate over random parameter pairs @f$ (A, B) @f$ of non-singular
+    elliptic curves over the field with @p p elements.
+    """
+    while True:
+        A = random.randrange( 0, p )
+        B = random.randrange( 0, p )
+        if non_singular( p, A, B ):
+            yield A, B
+
+
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+def examinations(p, max_cofactor, jobs):
+    """
+    Iterate over the triples @f$ (A, B, r) @f$ of random curves and their
+    results @f$ r @f$ from examine_curve().  With more than one job, a
+    pool of @p jobs processes examines the curves; the iteration yields the
+    results in the order of completion.  Stopping the iteration cancels the
+    pending examinations.
+    """
+    curves = random_curves( p )
+    if jobs < 2:
+        for A, B in curves:
+            yield A, B, examine_curve( p, A, B, max_cofactor )
+        return
+
+    with ProcessPoolExecutor( max_workers=jobs ) as pool:
+        # Keep every process busy without queueing too many curves.
+        pending = {}
+        try:
+            while True:
+                while len( pending ) < 2 * jobs:
+                    A, B = next( curves )
+                    future = pool.submit( examine_curve, p, A, B, max_cofactor )
+                    pending[ future ] = ( A, B )
+                done, not_done = wait( pending, return_when=FIRST_COMPLETED )
+                for future in done:
+                    A, B = pending.pop( future )
+                    yield A, B, future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def search(p, number, max_cofactor, jobs, output, log):
+    """
+    Examine random curves over the field with @p p elements until @p number
+    of them have a prime order times a cofactor of at most @p max_cofactor.
+    Print the accepted curves to @p output and the statistics of the stages
+    to @p log.
+
+    @return    The list of triples @f$ (A, B, N) @f$ of the accepted curves.
+    """
+    rejected = dict( ( stage, 0 ) for stage in stages )
+    accepted = []
+    start = time.time()
+
+    for A, B, ( stage, order ) in examinations( p, max_cofactor, jobs ):
+        if stage != "accepted":
+            rejected[ stage ] += 1
+            continue
+        accepted.append( ( A, B, order ) )
+        print( "# order {0}".format( order ), file=output )
+        print( p, A, B, file=output )
+        output.flush()
+        if len( accepted ) >= number:
+            break
+
+    seconds = time.time() - start
+    examined = sum( rejected.values() ) + len( accepted )
+    entered = examined
+    print( "{0:>14s} {1:>9s} {2:>9s} {3:>7s}".format(
+                "stage", "entered", "rejected", "rate" ), file=log )
+    for stage in stages:
+        rate = rejected[ stage ] / entered if entered else 0.0
+        print( "{0:>14s} {1:9d} {2:9d} {3:6.1%}".format(
+                    stage, entered, rejected[ stage ], rate ), file=log )
+        entered -= rejected[ stage ]
+    message = "{0} curves in {1:.1f}s: {2:.2f} curves/s, {3:.1f}s per accepted curve"
+    print( message.format( examined, seconds, examined / seconds,
+                           seconds / max( 1, len( accepted ) ) ), file=log )
+    return accepted
+
+
+import optparse
+import sys
+
+def main(arguments):
+    usage_string = "%prog [options]"
+    parser = optparse.OptionParser(
+                               usage=usage_string,
+                               description=__description.strip()
+                           )
+
+    parser.add_option(  "-p",
+                        "--prime",
+                        metavar="P",
+                        dest="prime",
+                        help="Search curves over the field with P elements",
+                        default=1000000007
+                    )
+
+    parser.add_option(  "-n",
+                        "--curves",
+                        metavar="N",
+                        dest="curves",
+                        help="Stop after N accepted curves",
+                        default=1
+                    )
+
+    parser.add_option(  "-c",
+                        "--max-cofactor",
+                        metavar="H",
+                        dest="max_cofactor",
+                        help="Accept orders that are a prime times at most H",
+                        default=1
+                    )
+
+    parser.add_option(  "-j",
+                        "--jobs",
+                        metavar="J",
+                        dest="jobs",
+                        help="Examine the curves in J processes",
+                        default=1
+                    )
+
+    parser.add_option(  "-o",
+                        "--output-name",
+                        metavar="FILE",
+                        dest="output_name",
+                        help="Write the accepted curves to FILE instead of console",
+                        default=None
+                    )
+
+    options, arguments = parser.parse_args( arguments )
+
+    if arguments:
+        parser.print_usage()
+        return 2
+
+    p = int( options.prime )
+    if p <= 3:
+        print( "ERROR: The field must have more than 3 elements.", file=sys.stderr )
+        return 1
+
+    output = open( options.output_name, "wt" ) if options.output_name else sys.stdout
+    try:
+        search( p, int( options.curves ), int( options.max_cofactor ),
+                int( options.jobs ), output, sys.stderr )
+    finally:
+        if options.output_name:
+            output.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit( main( sys.argv[ 1: ] ) )
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2010--2012  Peter Dinges <pdinges@acm.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+__description = \
+"""
+Compute the classical modular polynomials for the odd primes up to a bound
+and write them to the gzip-compressed data file that
+elliptic_curves.modular_polynomials.classical reads.  Run it from the
+repository root as 'python3 -m tools.modular_polynomials'.
+"""
+__doc__ = __description
+
+
+import gzip
+import sys
+import time
+
+from elliptic_curves.modular_polynomials.classical import \
+        compute_modular_polynomial, write_modular_polynomials, data_filename
+from support.primes import primes_range
+
+def generate(bound, filename, log):
+    """
+    Compute the modular polynomials for the odd primes up to @p bound and
+    write them to the gzip-compressed file with the given @p filename.
+    Report the progress to @p log.
+    """
+    polynomials = {}
+    for l in primes_range( 3, bound+1 ):
+        start = time.time()
+        polynomials[ l ] = compute_modular_polynomial( l )
+        message = "Phi_{0}: {1:.1f}s"
+        print( message.format( l, time.time() - start ), file=log )
+        log.flush()
+
+    with gzip.open( filename, "wt" ) as output:
+        print( "# Classical modular polynomials Phi_l(X, Y) = sum a_ik X^i Y^k",
+               file=output )
+        print( "# Format: l i k a_ik for i >= k; a_ki = a_ik", file=output )
+        write_modular_polynomials( polynomials, output )
+
+
+import optparse
+
+def main(arguments):
+    usage_string = "%prog [options]"
+    parser = optparse.OptionParser(
+                               usage=usage_string,
+                               description=__description.strip()
+                           )
+
+    parser.add_option(  "-b",
+                        "--bound",
+                        metavar="L",
+                        dest="bound",
+                        help="Compute the polynomials for all primes up to L",
+                        default=31
+                    )
+
+    parser.add_option(  "-o",
+                        "--output",
+                        metavar="FILE",
+                        dest="output",
+                        help="Write the data to FILE instead of the bundled file",
+                        default=data_filename
+                    )
+
+    options, arguments = parser.parse_args( arguments )
+
+    if arguments:
+        parser.print_usage()
+        return 2
+
+    generate( int( options.bound ), options.output, sys.stderr )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit( main( sys.argv[ 1: ] ) )